@@ -389,9 +389,10 @@ class GameController:
         if not game:
             raise IndexError("Partie non trouvée")
         
-        # Créer une copie manuelle de la partie
+        # Créer une copie de la partie : le fork partage les coups jusqu'au premier coup joué,
+        # la partie de la bibliothèque n'est donc jamais modifiée
         game_copy = SavedGame(
-            game=game.game,  # Le jeu est déjà une copie dans SavedGame
+            game=game.game.fork(),
             blue_player_name=game.blue_player.name,
             red_player_name=game.red_player.name
         )
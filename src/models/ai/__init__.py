@@ -4,12 +4,42 @@ This module contains classes related to artificial intelligence players and stra
 """
 
 from .ai_player import AIPlayer
+from .connection_evaluators import (ConnectionEvaluator, ShortestPathEvaluator, TwoDistanceEvaluator,
+                                    ResistanceEvaluator)
 from .ai_strategies import RandomStrategy, ShortestPathStrategy
 from .simple_ai_player import SimpleAIPlayer
+from .rollout_engine import RolloutEngine, RolloutResult
+from .transposition_table import SharedTranspositionTable
+from .mcts_strategy import MCTSStrategy, MCTSNode
+from .time_manager import TimeManager
+from .h_search import HSearch, VirtualConnections
+from .solved_store import SolvedPositionStore
+from .dfpn_solver import DFPNSolver, SolveResult
+from .alpha_beta_strategy import AlphaBetaStrategy
+from .parallel_search import ParallelSearch, ParallelSearchResult, ParallelStrategy
 
 __all__ = [
     'AIPlayer',
     'RandomStrategy',
     'ShortestPathStrategy',
-    'SimpleAIPlayer'
+    'ConnectionEvaluator',
+    'ShortestPathEvaluator',
+    'TwoDistanceEvaluator',
+    'ResistanceEvaluator',
+    'SimpleAIPlayer',
+    'RolloutEngine',
+    'RolloutResult',
+    'SharedTranspositionTable',
+    'MCTSStrategy',
+    'MCTSNode',
+    'TimeManager',
+    'HSearch',
+    'VirtualConnections',
+    'SolvedPositionStore',
+    'DFPNSolver',
+    'SolveResult',
+    'AlphaBetaStrategy',
+    'ParallelSearch',
+    'ParallelSearchResult',
+    'ParallelStrategy'
 ] 
\ No newline at end of file
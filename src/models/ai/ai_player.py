@@ -1,14 +1,28 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Set, Tuple
+import asyncio
+import threading
 import time
 import random
+import numpy as np
 
-from ..core import HexCell, IHexGame
+from ..core import HexCell, HexCellTable, IHexBoard, IHexGame, HexGame, ActiveState
+from ..game_management.command import MoveCommand
+from ..game_management.player import Player
 
-class AIPlayer():
+class AIPlayer(Player):
     """
     Base class for AI players implementing common AI functionality.
     This class provides a foundation for different AI strategies.
+    AI players are regular players: they can be attached to a game manager.
+
+    Attached to a game manager, an AI player takes its turn after every notification of the
+    game (see take_turn): it searches its move in a worker thread when its colour is to move,
+    and ponders on the opponent's time otherwise. The player's name must be the name the
+    game manager gives its colour.
     """
+    BLUE_PLAYER = 1
+    RED_PLAYER = 2
+
     def __init__(self, player_id: str, name: str, is_blue: bool, min_think_time: float = 1.0):
         """
         Initialize an AI player.
@@ -19,8 +33,54 @@ class AIPlayer():
             is_blue: Whether the player plays as blue
             min_think_time: Minimum time in seconds the AI must wait before making a move
         """
-        super().__init__(player_id, name, is_blue, min_think_time)
+        super().__init__(name, min_think_time)
+        self._player_id = player_id
+        self._is_blue = is_blue
         self._available_moves: List[HexCell] = []
+        self._thinking = False
+        # Set when take_turn is called while the player is acting
+        self._turn_pending = False
+        self._ponder_stop: Optional[threading.Event] = None
+        self._ponder_future: Optional[asyncio.Future] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def player_id(self) -> str:
+        """Get the unique identifier of the player."""
+        return self._player_id
+
+    @property
+    def is_blue(self) -> bool:
+        """Check if the player plays as blue."""
+        return self._is_blue
+
+    @property
+    def player_value(self) -> int:
+        """Get the value of the player's stones (BLUE_PLAYER or RED_PLAYER)."""
+        return self.BLUE_PLAYER if self._is_blue else self.RED_PLAYER
+
+    def _is_my_turn(self, game: IHexGame) -> bool:
+        """
+        Check if the player is to move in a game.
+
+        Args:
+            game: The current game state
+
+        Returns:
+            bool: True if the game is not over and the player's colour is to move
+        """
+        return not game.is_game_over() and game.get_current_player() == self.player_value
+
+    def _wait_min_think_time(self, since: Optional[float] = None) -> None:
+        """
+        Wait until the minimum think time has elapsed.
+
+        Args:
+            since: When thinking started (time.time()); the full minimum think time is waited when None
+        """
+        remaining = self._min_think_time if since is None else self._min_think_time - (time.time() - since)
+        if remaining > 0:
+            time.sleep(remaining)
         
     def _get_available_moves(self, game: IHexGame) -> List[HexCell]:
         """
@@ -32,13 +92,9 @@ class AIPlayer():
         Returns:
             List[HexCell]: List of available cells to play
         """
-        available_moves = []
-        for row in range(game.board_size):
-            for col in range(game.board_size):
-                cell = game.get_cell(row, col)
-                if cell is not None and not cell.is_occupied:
-                    available_moves.append(cell)
-        return available_moves
+        board = game.board
+        cells = HexCellTable.for_size(board.size).cells
+        return [cells[index] for index in board.empty_indices().tolist()]
         
     def _select_random_move(self, game: IHexGame) -> Optional[HexCell]:
         """
@@ -65,18 +121,122 @@ class AIPlayer():
         Returns:
             Optional[HexCell]: The selected cell to play, or None if no move is selected
         """
-        if not self._is_my_turn:
+        if not self._is_my_turn(game):
             return None
             
         # Update available moves
         self._available_moves = self._get_available_moves(game)
         
         # Wait for the minimum think time
-        time.sleep(self._min_think_time)
+        self._wait_min_think_time()
         
         # Select and return a move
         return self._select_random_move(game)
         
+    def analyse(self, board: IHexBoard, deadline: Optional[float] = None,
+                stop: Optional[Callable[[], bool]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the statistics of the moves of a position, in the form used by search drivers.
+        This base implementation gives one visit to the move select_move picks, and no wins;
+        searching strategies override it with their root statistics.
+
+        Args:
+            board: The board to analyse (left untouched); the player's colour must be to move
+            deadline: Wall-clock time (time.time()) at which the analysis must stop (unused here)
+            stop: Called to check if the analysis must stop (unused here)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The flat indices of the moves, their visits and their wins
+        """
+        moves = board.empty_indices()
+        visits = np.zeros(len(moves))
+        cell = self.select_move(HexGame(board.fork(), ActiveState()))
+        if cell is not None:
+            visits[np.flatnonzero(moves == cell.x * board.size + cell.y)] = 1
+        return moves, visits, np.zeros(len(moves))
+
+    def ponder(self, board: IHexBoard, stop: Callable[[], bool]) -> None:
+        """
+        Think about a position where the opponent is to move, until stop returns True.
+        Called in a worker thread while the opponent thinks. This base implementation does
+        nothing; searching strategies override it to prepare their next move.
+
+        Args:
+            board: The board to think about (a fork of the game's board)
+            stop: Called to check if pondering must stop
+        """
+
+    async def _stop_pondering(self) -> None:
+        """Stop pondering and wait for the worker thread to finish."""
+        while self._ponder_future is not None:
+            future = self._ponder_future
+            self._ponder_stop.set()
+            await future
+            if self._ponder_future is future:
+                self._ponder_future = self._ponder_stop = None
+
+    async def take_turn(self) -> None:
+        """
+        Act on the current state of the attached game: stop pondering, then search and send a
+        move when the player's colour is to move, or start pondering on the opponent's time.
+        Searching and pondering run in worker threads, so the game manager's loop goes on.
+        A call made while the player is acting is not lost: the player acts again on the
+        state of the game once it is done.
+        """
+        if not self.is_attached:
+            return
+        if self._thinking:
+            self._turn_pending = True
+            return
+        self._thinking = True
+        try:
+            self._turn_pending = True
+            while self._turn_pending and self.is_attached:
+                self._turn_pending = False
+                await self._act()
+        finally:
+            self._thinking = False
+
+    async def _act(self) -> None:
+        """Stop pondering, then search and send a move or start pondering (see take_turn)."""
+        await self._stop_pondering()
+        game = self._game_manager.game_board
+        if game.is_game_over() or not isinstance(game.state, ActiveState):
+            return
+        loop = asyncio.get_running_loop()
+        if not self._is_my_turn(game):
+            self._ponder_stop = threading.Event()
+            self._ponder_future = loop.run_in_executor(None, self.ponder, game.board.fork(), self._ponder_stop.is_set)
+            return
+        if any(isinstance(command, MoveCommand) and command.player is self
+               for command in self._game_manager.command_queue):
+            return
+        # The manager's loop keeps executing commands on the game during the search
+        position = game.board.position_hash, game.board.get_total_moves()
+        cell = await loop.run_in_executor(None, self.select_move, game.fork())
+        if cell is None or not self.is_attached:
+            return
+        game = self._game_manager.game_board
+        if (game.is_game_over() or not isinstance(game.state, ActiveState)
+                or (game.board.position_hash, game.board.get_total_moves()) != position):
+            # Stale move: the notification of the change makes the player act again
+            return
+        await self.send_command(MoveCommand(self, cell.x, cell.y))
+
+    def receive_notification(self, command: Any, result: Any) -> None:
+        """
+        Receive notification about an action of the game.
+        AI players take their turn (see take_turn) in a new task of the running event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.take_turn())
+        # Keep a reference until the task is done
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     def handle_game_over(self, winner, reason: Any) -> None:
         """
         Handle the end of the game.
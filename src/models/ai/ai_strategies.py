@@ -2,9 +2,11 @@ from typing import Optional, List, Dict, Any
 import random
 import numpy as np
 
-from ..core import HexCell, IHexGame
+from .ai_player import AIPlayer
+from .connection_evaluators import ConnectionEvaluator, ShortestPathEvaluator
+from ..core import HexCell, HexCellTable, HexGeometry, IHexGame
 
-class RandomStrategy():
+class RandomStrategy(AIPlayer):
     """
     A simple AI strategy that selects moves randomly.
     This strategy is useful for testing and as a baseline for more sophisticated strategies.
@@ -32,13 +34,9 @@ class RandomStrategy():
         Returns:
             List[HexCell]: List of available cells to play
         """
-        available_moves = []
-        for row in range(game.board_size):
-            for col in range(game.board_size):
-                cell = game.get_cell(row, col)
-                if cell is not None and not cell.is_occupied:
-                    available_moves.append(cell)
-        return available_moves
+        board = game.board
+        cells = HexCellTable.for_size(board.size).cells
+        return [cells[index] for index in board.empty_indices().tolist()]
         
     def select_move(self, game: IHexGame) -> Optional[HexCell]:
         """
@@ -51,7 +49,7 @@ class RandomStrategy():
         Returns:
             Optional[HexCell]: The selected cell to play, or None if no move is selected
         """
-        if not self._is_my_turn:
+        if not self._is_my_turn(game):
             return None
             
         # Update available moves
@@ -78,12 +76,15 @@ class RandomStrategy():
         self._available_moves = []
 
 
-class ShortestPathStrategy():
+class ShortestPathStrategy(AIPlayer):
     """
     A simple AI strategy that tries to find the shortest path to win.
-    This strategy evaluates moves based on their potential to create a path to victory.
+    This strategy evaluates moves based on their potential to create a path to victory:
+    every move is scored by a connection evaluator (shortest connection by default, or
+    two-distance or resistance network), and ties go to the cell closest to the centre.
     """
-    def __init__(self, player_id: str, name: str, is_blue: bool, min_think_time: float = 1.0):
+    def __init__(self, player_id: str, name: str, is_blue: bool, min_think_time: float = 1.0,
+                 evaluator: Optional[ConnectionEvaluator] = None):
         """
         Initialize a shortest path strategy player.
         
@@ -92,9 +93,16 @@ class ShortestPathStrategy():
             name: Display name of the player
             is_blue: Whether the player plays as blue
             min_think_time: Minimum time in seconds the player must wait before making a move
+            evaluator: The connection evaluator scoring the moves (ShortestPathEvaluator when None)
         """
         super().__init__(player_id, name, is_blue, min_think_time)
         self._available_moves: List[HexCell] = []
+        self._evaluator = evaluator if evaluator is not None else ShortestPathEvaluator()
+
+    @property
+    def evaluator(self) -> ConnectionEvaluator:
+        """Get the connection evaluator scoring the moves."""
+        return self._evaluator
         
     def _get_available_moves(self, game: IHexGame) -> List[HexCell]:
         """
@@ -106,32 +114,26 @@ class ShortestPathStrategy():
         Returns:
             List[HexCell]: List of available cells to play
         """
-        available_moves = []
-        for row in range(game.board_size):
-            for col in range(game.board_size):
-                cell = game.get_cell(row, col)
-                if cell is not None and not cell.is_occupied:
-                    available_moves.append(cell)
-        return available_moves
+        board = game.board
+        cells = HexCellTable.for_size(board.size).cells
+        return [cells[index] for index in board.empty_indices().tolist()]
         
-    def _evaluate_move(self, cell: HexCell, game: IHexGame) -> float:
+    def _evaluate_moves(self, indices: np.ndarray, game: IHexGame) -> np.ndarray:
         """
-        Evaluate a move based on its potential to create a path to victory.
+        Evaluate moves based on their potential to create a path to victory, all at once.
         
         Args:
-            cell: The cell to evaluate
+            indices: Flat indices (x * size + y) of the cells to evaluate
             game: The current game state
             
         Returns:
-            float: A score for the move, higher is better
+            np.ndarray: One score per move, higher is better
         """
-        # Calculate distance from center
-        center = game.board_size // 2
-        row_dist = abs(cell.row - center)
-        col_dist = abs(cell.col - center)
-        
-        # Prefer moves closer to center
-        return -(row_dist + col_dist)
+        board = game.board
+        scores = self._evaluator.evaluate_moves(board.board_view(), indices, self.player_value)
+        # Among the best moves, prefer the ones closer to the centre (distances shared per board size)
+        centre_distance = HexGeometry.for_size(board.size).centre_distance[indices]
+        return np.where(scores == scores.max(), -centre_distance, -np.inf) if len(scores) else scores
         
     def select_move(self, game: IHexGame) -> Optional[HexCell]:
         """
@@ -144,7 +146,7 @@ class ShortestPathStrategy():
         Returns:
             Optional[HexCell]: The selected cell to play, or None if no move is selected
         """
-        if not self._is_my_turn:
+        if not self._is_my_turn(game):
             return None
             
         # Update available moves
@@ -156,17 +158,9 @@ class ShortestPathStrategy():
         # Wait for the minimum think time
         self._wait_min_think_time()
         
-        # Evaluate all moves and select the best one
-        best_move = None
-        best_score = float('-inf')
-        
-        for move in self._available_moves:
-            score = self._evaluate_move(move, game)
-            if score > best_score:
-                best_score = score
-                best_move = move
-                
-        return best_move
+        # Evaluate all moves in one pass and select the best one (the first on ties)
+        scores = self._evaluate_moves(game.board.empty_indices(), game)
+        return self._available_moves[int(np.argmax(scores))]
         
     def handle_game_over(self, winner, reason: Any) -> None:
         """
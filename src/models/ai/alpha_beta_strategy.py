@@ -0,0 +1,340 @@
+from typing import Any, Dict, List, Optional, Tuple
+import time
+import numpy as np
+
+from .ai_player import AIPlayer
+from .connection_evaluators import ConnectionEvaluator, ShortestPathEvaluator
+from .h_search import HSearch
+from .solved_store import SolvedPositionStore
+from .time_manager import TimeManager
+from ..core import HexBoard, HexCell, HexCellTable, HexGeometry, HexWinDetector, HexZobrist, IHexBoard, IHexGame
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the hard deadline is reached."""
+
+
+class AlphaBetaStrategy(AIPlayer):
+    """
+    Negamax alpha-beta player with iterative deepening.
+
+    The search plays and takes back moves on a private fork of the board (make/unmake with
+    _play_index and _undo_index), with an incremental Zobrist hash of the position. Moves are
+    ordered by the best move stored for the position in the transposition table (hash move),
+    then the two killer moves of the ply, then the history heuristic.
+
+    The last ply is evaluated in one batch: all the moves of a node at depth 1 are scored
+    together by the connection evaluator (see ConnectionEvaluator.evaluate_moves), and the
+    winning ones are found by one batched win detection.
+
+    Each iteration after the first searches within an aspiration window around the previous
+    score, and searches again with a full window when the score falls outside.
+
+    The think time of a move comes from a TimeManager (the player's clock in a TimedHexGame,
+    a fixed time otherwise). No new iteration starts after NEW_ITERATION_FRACTION of it, and
+    the running one is abandoned at its end: the best move of the last complete iteration
+    is played. The minimum think time is spent searching rather than sleeping.
+
+    With an HSearch, the root moves are restricted to the must-play region of the position
+    (the cells breaking every virtual connection of the opponent, without dead cells).
+
+    With a SolvedPositionStore, a position the store knows to be won is played at once with
+    its stored winning move, without searching.
+    """
+    WIN_SCORE = 100000.0
+    # Fraction of the think time after which no new iteration starts
+    NEW_ITERATION_FRACTION = 0.4
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+    def __init__(self, player_id: str, name: str, is_blue: bool, min_think_time: float = 0.0,
+                 evaluator: Optional[ConnectionEvaluator] = None, time_manager: Optional[TimeManager] = None,
+                 max_depth: Optional[int] = None, aspiration_window: float = 1.0,
+                 h_search: Optional[HSearch] = None, solved_store: Optional[SolvedPositionStore] = None):
+        """
+        Initialize an alpha-beta player.
+
+        Args:
+            player_id: Unique identifier for the player
+            name: Display name of the player
+            is_blue: Whether the player plays as blue
+            min_think_time: Minimum time in seconds the player must wait before making a move
+            evaluator: The connection evaluator of the last ply (ShortestPathEvaluator when None)
+            time_manager: Budgets the think time of each move (one second per move when None)
+            max_depth: Deepest iteration (None to deepen until the time runs out)
+            aspiration_window: Half-width of the aspiration windows, in evaluator units
+            h_search: Virtual connection engine restricting the root moves (None for all moves)
+            solved_store: Solved positions played without searching (None for none)
+
+        Raises:
+            ValueError: If max_depth is not positive
+        """
+        super().__init__(player_id, name, is_blue, min_think_time)
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("The search depth must be positive.")
+        self._evaluator = evaluator if evaluator is not None else ShortestPathEvaluator()
+        self._time_manager = time_manager if time_manager is not None else TimeManager()
+        self._max_depth = max_depth
+        self._aspiration_window = aspiration_window
+        self._h_search = h_search
+        self._solved_store = solved_store
+        self._root_moves = np.zeros(0, dtype=np.intp)
+        self._table: Dict[int, Tuple[int, float, int, int]] = {}
+        self._killers: List[List[int]] = []
+        self._history = np.zeros(0)
+        self._nodes = 0
+        self._depth = 0
+        self._score = 0.0
+        self._deadline = 0.0
+        self._board: Optional[HexBoard] = None
+        self._keys: List[List[int]] = []
+        self._hash = 0
+        self._centre_prior = np.zeros(0)
+
+    @property
+    def time_manager(self) -> TimeManager:
+        """Get the time manager."""
+        return self._time_manager
+
+    @property
+    def nodes(self) -> int:
+        """Get the number of nodes of the last search."""
+        return self._nodes
+
+    @property
+    def depth(self) -> int:
+        """Get the depth of the last complete iteration of the last search."""
+        return self._depth
+
+    @property
+    def score(self) -> float:
+        """Get the score of the last complete iteration of the last search, for the player to move."""
+        return self._score
+
+    def _prepare(self, board: IHexBoard) -> None:
+        """Set up the search state for a position (a private fork of the board and fresh tables)."""
+        size = board.size
+        self._board = board.fork() if isinstance(board, HexBoard) else board.fork().to_hex_board()
+        zobrist = HexZobrist.for_size(size)
+        self._keys = zobrist.keys
+        self._hash = zobrist.hash_board(self._board.board_view())
+        self._table = {}
+        self._killers = []
+        self._history = np.zeros(size * size)
+        # Tiny bonus for central cells, so that ties in the other heuristics go to the centre
+        self._centre_prior = -HexGeometry.for_size(size).centre_distance * 1e-3
+        self._nodes = 0
+        self._root_moves = self._board.empty_indices()
+        if self._h_search is not None and len(self._root_moves):
+            region = self._h_search.must_play(self._board.board_view()).ravel()
+            self._root_moves = np.flatnonzero(region)
+
+    def _order(self, moves: np.ndarray, ply: int, hash_move: int) -> np.ndarray:
+        """
+        Order the moves of a node: hash move, killers, then by history.
+
+        Args:
+            moves: Flat indices of the empty cells
+            ply: Distance from the root
+            hash_move: Best move stored for the position (-1 for none)
+
+        Returns:
+            np.ndarray: The moves, best first
+        """
+        priority = self._history[moves] + self._centre_prior[moves]
+        if ply < len(self._killers):
+            for rank, killer in enumerate(self._killers[ply]):
+                priority[moves == killer] = 1e12 - rank
+        if hash_move >= 0:
+            priority[moves == hash_move] = 1e13
+        return moves[np.argsort(-priority, kind='stable')]
+
+    def _store_killer(self, move: int, ply: int) -> None:
+        """Remember a move that caused a cut-off at a ply (two killers per ply)."""
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+
+    def _frontier(self, moves: np.ndarray, player: int, ply: int) -> Tuple[float, int]:
+        """
+        Score every move of a node at depth 1 in one batch.
+
+        Args:
+            moves: Flat indices of the empty cells
+            player: The player to move
+            ply: Distance from the root
+
+        Returns:
+            Tuple[float, int]: The best score for the player to move and its move
+        """
+        size = self._board.size
+        boards = np.repeat(self._board.board_view().reshape(1, -1), len(moves), axis=0)
+        boards[np.arange(len(moves)), moves] = player
+        boards = boards.reshape(-1, size, size)
+        self._nodes += len(moves)
+        won = HexWinDetector.detect_winners(boards) == player
+        scores = self._evaluator.measure(boards, 3 - player) - self._evaluator.measure(boards, player)
+        scores = np.where(won, self.WIN_SCORE - ply - 1, scores) + self._centre_prior[moves]
+        best = int(np.argmax(scores))
+        return float(scores[best]), int(moves[best])
+
+    def _negamax(self, depth: int, alpha: float, beta: float, ply: int) -> Tuple[float, int]:
+        """
+        Search the current position of the private board.
+
+        Args:
+            depth: Remaining depth (at least 1)
+            alpha: Lower bound of the window
+            beta: Upper bound of the window
+            ply: Distance from the root
+
+        Returns:
+            Tuple[float, int]: The score for the player to move and the best move
+
+        Raises:
+            _SearchTimeout: If the hard deadline is reached
+        """
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+        self._nodes += 1
+        board = self._board
+        key = self._hash
+        hash_move = -1
+        entry = self._table.get(key)
+        if entry is not None:
+            stored_depth, score, flag, hash_move = entry
+            if stored_depth >= depth and (flag == self.EXACT or (flag == self.LOWER and score >= beta)
+                                          or (flag == self.UPPER and score <= alpha)):
+                return score, hash_move
+
+        moves = self._root_moves if ply == 0 else board.empty_indices()
+        player = self.BLUE_PLAYER if board.get_total_moves() % 2 == 0 else self.RED_PLAYER
+        if depth == 1 or len(moves) == 1:
+            score, best_move = self._frontier(moves, player, ply)
+            self._table[key] = (depth, score, self.EXACT, best_move)
+            return score, best_move
+
+        original_alpha = alpha
+        best_score, best_move = -np.inf, -1
+        keys = self._keys[player]
+        for move in self._order(moves, ply, hash_move).tolist():
+            winner = board._play_index(move)
+            self._hash = key ^ keys[move]
+            try:
+                if winner is not None:
+                    score = self.WIN_SCORE - ply - 1
+                else:
+                    score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)[0]
+            finally:
+                board._undo_index()
+                self._hash = key
+            if score > best_score:
+                best_score, best_move = score, move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self._store_killer(move, ply)
+                self._history[move] += depth * depth
+                break
+
+        if best_score <= original_alpha:
+            flag = self.UPPER
+        elif best_score >= beta:
+            flag = self.LOWER
+        else:
+            flag = self.EXACT
+        self._table[key] = (depth, best_score, flag, best_move)
+        return best_score, best_move
+
+    def search(self, board: IHexBoard, think_time: float, min_time: float = 0.0) -> Optional[int]:
+        """
+        Search a position by iterative deepening within a think time.
+
+        Args:
+            board: The board to search (left untouched)
+            think_time: Time allowed in seconds
+            min_time: Time in seconds during which new iterations keep starting
+
+        Returns:
+            Optional[int]: The flat index (x * size + y) of the best move, or None on a full board
+        """
+        start = time.perf_counter()
+        if self._solved_store is not None:
+            stored = self._solved_store.lookup(board.board_view())
+            if stored is not None and stored[1] != SolvedPositionStore.NO_MOVE:
+                self._nodes, self._depth, self._score = 0, 0, self.WIN_SCORE
+                return stored[1]
+        self._prepare(board)
+        empties = len(self._board.empty_indices())
+        self._depth = 0
+        if not empties:
+            return None
+        self._deadline = start + think_time
+        soft_end = start + max(think_time * self.NEW_ITERATION_FRACTION, min_time)
+        max_depth = empties if self._max_depth is None else min(self._max_depth, empties)
+
+        best_move, score = None, 0.0
+        for depth in range(1, max_depth + 1):
+            try:
+                if depth == 1 or abs(score) >= self.WIN_SCORE / 2:
+                    score, move = self._negamax(depth, -np.inf, np.inf, 0)
+                else:
+                    alpha, beta = score - self._aspiration_window, score + self._aspiration_window
+                    result, move = self._negamax(depth, alpha, beta, 0)
+                    if result <= alpha or result >= beta:
+                        result, move = self._negamax(depth, -np.inf, np.inf, 0)
+                    score = result
+            except _SearchTimeout:
+                if best_move is None:
+                    # Not even the first iteration finished: play the best first-ply move
+                    player = self.BLUE_PLAYER if self._board.get_total_moves() % 2 == 0 else self.RED_PLAYER
+                    best_move = self._frontier(self._root_moves, player, 0)[1]
+                break
+            best_move, self._depth, self._score = move, depth, score
+            # A proven result does not change with depth
+            if abs(score) >= self.WIN_SCORE / 2 or time.perf_counter() > soft_end:
+                break
+        self._board = None
+        return best_move
+
+    def select_move(self, game: IHexGame) -> Optional[HexCell]:
+        """
+        Select a move based on the current game state.
+        This implementation searches within the think time given by the time manager.
+
+        Args:
+            game: The current game state
+
+        Returns:
+            Optional[HexCell]: The selected cell to play, or None if no move is selected
+        """
+        if not self._is_my_turn(game):
+            return None
+
+        start = time.time()
+        think_time = self._time_manager.think_time(game, self.player_value, self._min_think_time)
+        index = self.search(game.board, think_time, self._min_think_time)
+        if index is None:
+            return None
+
+        # Wait for what remains of the minimum think time (the search may end early)
+        self._wait_min_think_time(start)
+        return HexCellTable.for_size(game.board.size).cells[index]
+
+    def handle_game_over(self, winner, reason: Any) -> None:
+        """
+        Handle the end of the game.
+        For alpha-beta players, this drops the search tables.
+
+        Args:
+            winner: The player who won, or None if there was no winner
+            reason: The reason why the game ended
+        """
+        super().handle_game_over(winner, reason)
+        self._table = {}
+        self._killers = []
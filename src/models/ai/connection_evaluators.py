@@ -0,0 +1,267 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict
+import numpy as np
+
+from ..core import HexGeometry
+
+
+class _EvaluatorTables:
+    """
+    Per-size lookups shared by the evaluators: the neighbours of every cell padded to six
+    columns, and the edges of the board graph as pairs of flat indices (i < j).
+    """
+    _cache: Dict[int, '_EvaluatorTables'] = {}
+
+    __slots__ = ('geometry', 'neighbours', 'pairs')
+
+    def __init__(self, size: int):
+        """Build the tables of a board size."""
+        self.geometry = geometry = HexGeometry.for_size(size)
+        cells = size * size
+        # Missing neighbours point to the extra column `cells`, which always holds infinity
+        self.neighbours = np.full((cells, 6), cells, dtype=np.intp)
+        counts = np.diff(geometry.neighbour_offsets)
+        rows = np.repeat(np.arange(cells), counts)
+        columns = np.arange(len(geometry.neighbour_indices)) - np.repeat(geometry.neighbour_offsets[:-1], counts)
+        self.neighbours[rows, columns] = geometry.neighbour_indices
+        self.pairs = np.stack([rows, geometry.neighbour_indices])[:, rows < geometry.neighbour_indices]
+
+    @classmethod
+    def for_size(cls, size: int) -> '_EvaluatorTables':
+        """Get the shared tables of a board size."""
+        tables = cls._cache.get(size)
+        if tables is None:
+            tables = cls._cache[size] = cls(size)
+        return tables
+
+
+class ConnectionEvaluator(ABC):
+    """
+    Base class of the connection evaluators used by ShortestPathStrategy.
+
+    An evaluator measures how far a player is from connecting their two edges (lower is better)
+    for a whole batch of boards at once. evaluate_moves uses it to score every candidate
+    move of a position in one pass: each move gives one board of the batch, and the score is
+    the measure of the opponent minus the measure of the player after the move.
+    """
+    BLUE = 1
+    RED = 2
+
+    @abstractmethod
+    def measure(self, boards: np.ndarray, player: int) -> np.ndarray:
+        """
+        Measure the connection distance of a player on a batch of boards.
+
+        Args:
+            boards: uint8 array of shape (count, size, size)
+            player: The player to measure (BLUE=1, RED=2)
+
+        Returns:
+            np.ndarray: One float per board, lower is better (a connected player gets 0)
+        """
+
+    def evaluate_moves(self, board_state: np.ndarray, indices: np.ndarray, player: int) -> np.ndarray:
+        """
+        Score candidate moves of a player, all evaluated together.
+
+        Args:
+            board_state: The (size, size) board state
+            indices: Flat indices (x * size + y) of the empty cells to evaluate
+            player: The player to move (BLUE=1, RED=2)
+
+        Returns:
+            np.ndarray: One score per move, higher is better
+        """
+        board_state = np.asarray(board_state, dtype=np.uint8)
+        size = board_state.shape[0]
+        indices = np.asarray(indices, dtype=np.intp)
+        boards = np.repeat(board_state.reshape(1, -1), len(indices), axis=0)
+        boards[np.arange(len(indices)), indices] = player
+        boards = boards.reshape(-1, size, size)
+        return self.measure(boards, 3 - player) - self.measure(boards, player)
+
+
+class ShortestPathEvaluator(ConnectionEvaluator):
+    """
+    Shortest connection: the number of empty cells a player still needs to fill to connect
+    their edges, with own stones costing 0 and opponent stones blocked.
+
+    distance() runs a 0-1 BFS on one board. measure() computes the same distances for a batch
+    of boards with vectorized relaxation sweeps (every cell takes the best of its neighbours
+    plus its own cost) until no distance changes, which takes about as many sweeps as the
+    path is long. Disconnected players get size * size + 1.
+    """
+    def distance(self, board_state: np.ndarray, player: int) -> int:
+        """
+        Compute the shortest connection of a player on one board (0-1 BFS).
+
+        Args:
+            board_state: The (size, size) board state
+            player: The player to measure (BLUE=1, RED=2)
+
+        Returns:
+            int: The number of empty cells on the shortest connection
+        """
+        state = np.asarray(board_state).ravel()
+        size = int(round(state.size ** 0.5))
+        geometry = HexGeometry.for_size(size)
+        start, end = geometry.edge_masks[player]
+        unreachable = size * size + 1
+        distances = np.full(size * size, unreachable)
+        queue = deque()
+        for index in np.flatnonzero(start & (state != 3 - player)).tolist():
+            distances[index] = int(state[index] == 0)
+            queue.appendleft(index) if distances[index] == 0 else queue.append(index)
+        while queue:
+            index = queue.popleft()
+            if end[index]:
+                return int(distances[index])
+            for neighbour in geometry.neighbours(index).tolist():
+                if state[neighbour] == 3 - player:
+                    continue
+                cost = int(state[neighbour] == 0)
+                if distances[index] + cost < distances[neighbour]:
+                    distances[neighbour] = distances[index] + cost
+                    queue.appendleft(neighbour) if cost == 0 else queue.append(neighbour)
+        return unreachable
+
+    def measure(self, boards: np.ndarray, player: int) -> np.ndarray:
+        boards = np.asarray(boards)
+        count, size = boards.shape[0], boards.shape[1]
+        cells = size * size
+        tables = _EvaluatorTables.for_size(size)
+        start, end = tables.geometry.edge_masks[player]
+        flat = boards.reshape(count, cells)
+        costs = np.where(flat == 0, 1.0, 0.0)
+        costs[flat == 3 - player] = np.inf
+
+        distances = np.full((count, cells + 1), np.inf)
+        distances[:, :cells] = np.where(start, costs, np.inf)
+        while True:
+            relaxed = np.minimum(distances[:, :cells], distances[:, tables.neighbours].min(axis=2) + costs)
+            if np.array_equal(relaxed, distances[:, :cells]):
+                break
+            distances[:, :cells] = relaxed
+        result = distances[:, :cells][:, end].min(axis=1)
+        return np.where(np.isinf(result), cells + 1, result)
+
+
+class TwoDistanceEvaluator(ConnectionEvaluator):
+    """
+    Two-distance: like the shortest connection, but the opponent is assumed to block the best
+    route at every step, so an empty cell is one more than its second best neighbour. An edge
+    counts as two neighbours of its cells (it cannot be blocked) and own stones take the best
+    of their neighbours at no cost.
+
+    The two-distances to both edges are computed together, for a batch of boards, with
+    vectorized relaxation sweeps until stable. The measure is the best sum of the two over
+    the cells (an empty cell counted once). Disconnected players get size * size + 1.
+    """
+    def measure(self, boards: np.ndarray, player: int) -> np.ndarray:
+        boards = np.asarray(boards)
+        count, size = boards.shape[0], boards.shape[1]
+        cells = size * size
+        tables = _EvaluatorTables.for_size(size)
+        flat = boards.reshape(count, cells)
+        empty = flat == 0
+        own = flat == player
+        blocked = flat == 3 - player
+        # For each edge, two neighbour columns holding 0 for the cells of that edge
+        edges = np.where(tables.geometry.edge_masks[player], 0.0, np.inf)[:, None, :, None].repeat(2, axis=3)
+        edges = np.broadcast_to(edges, (2, count, cells, 2))
+
+        # distances[e] holds the two-distances to edge e (the extra column holds infinity)
+        distances = np.full((2, count, cells + 1), np.inf)
+        while True:
+            values = np.concatenate([distances[:, :, tables.neighbours], edges], axis=3)
+            values.partition(1, axis=3)
+            relaxed = np.where(empty, values[..., 1] + 1.0, np.where(own, values[..., 0], np.inf))
+            relaxed = np.minimum(relaxed, distances[:, :, :cells])
+            relaxed[:, blocked] = np.inf
+            if np.array_equal(relaxed, distances[:, :, :cells]):
+                break
+            distances[:, :, :cells] = relaxed
+
+        result = (distances[0, :, :cells] + distances[1, :, :cells] - empty).min(axis=1)
+        return np.where(np.isinf(result), cells + 1, result)
+
+
+class ResistanceEvaluator(ConnectionEvaluator):
+    """
+    Resistance network: the board is an electric circuit between the two edges of a player.
+    Every cell has a resistance (EMPTY_RESISTANCE for empty cells, OWN_RESISTANCE for own
+    stones, none for opponent stones, which cut the circuit), two adjacent cells are joined by
+    the sum of their resistances, and the edges are joined to their cells in the same way.
+
+    The potentials of the cells solve Kirchhoff's equations (L V = I); the batch of
+    systems is solved at once by numpy.linalg.solve, batch_size boards at a time to bound
+    memory (each system is (size * size)^2 floats). The measure is the log of the
+    resistance between the edges. A small leak to the ground keeps the systems regular when
+    regions are cut off, so a disconnected player gets a very large resistance.
+    """
+    EMPTY_RESISTANCE = 1.0
+    OWN_RESISTANCE = 0.01
+    LEAK_CONDUCTANCE = 1e-9
+
+    def __init__(self, batch_size: int = 64):
+        """
+        Initialize the evaluator.
+
+        Args:
+            batch_size: Maximum number of systems solved at once
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive.")
+        self._batch_size = batch_size
+
+    def resistance(self, boards: np.ndarray, player: int) -> np.ndarray:
+        """
+        Compute the resistance between the edges of a player on a batch of boards.
+
+        Args:
+            boards: uint8 array of shape (count, size, size)
+            player: The player to measure (BLUE=1, RED=2)
+
+        Returns:
+            np.ndarray: One resistance per board
+        """
+        boards = np.asarray(boards)
+        count, size = boards.shape[0], boards.shape[1]
+        result = np.empty(count)
+        for first in range(0, count, self._batch_size):
+            batch = boards[first:first + self._batch_size]
+            result[first:first + len(batch)] = self._solve(batch.reshape(len(batch), size * size), size, player)
+        return result
+
+    def _solve(self, flat: np.ndarray, size: int, player: int) -> np.ndarray:
+        """Solve the circuits of a batch of flat boards."""
+        count, cells = flat.shape
+        tables = _EvaluatorTables.for_size(size)
+        start, end = tables.geometry.edge_masks[player]
+        resistances = np.where(flat == player, self.OWN_RESISTANCE, self.EMPTY_RESISTANCE)
+        conductances = np.where(flat == 3 - player, 0.0, 1.0 / resistances)
+
+        # Cell to cell: 1 / (r_i + r_j), zero when either cell is blocked
+        first, second = tables.pairs
+        links = np.where((conductances[:, first] > 0) & (conductances[:, second] > 0),
+                         1.0 / (resistances[:, first] + resistances[:, second]), 0.0)
+        # Edge to cell: 1 / r_i
+        sources = conductances * start
+        sinks = conductances * end
+
+        system = np.zeros((count, cells, cells))
+        system[:, first, second] = -links
+        system[:, second, first] = -links
+        diagonal = sources + sinks + self.LEAK_CONDUCTANCE
+        np.add.at(diagonal.T, first, links.T)
+        np.add.at(diagonal.T, second, links.T)
+        system[:, np.arange(cells), np.arange(cells)] = diagonal
+
+        # The start edge is held at potential 1, the end edge at 0
+        potentials = np.linalg.solve(system, sources[:, :, None])[:, :, 0]
+        current = (sources * (1.0 - potentials)).sum(axis=1)
+        return 1.0 / np.maximum(current, self.LEAK_CONDUCTANCE)
+
+    def measure(self, boards: np.ndarray, player: int) -> np.ndarray:
+        return np.log(self.resistance(boards, player))
@@ -0,0 +1,321 @@
+from typing import Dict, List, Optional
+import numpy as np
+
+from .solved_store import SolvedPositionStore
+from ..core import BitBoardMasks, HexGeometry
+
+
+class _NodeLimit(Exception):
+    """Raised inside the search when the node budget is spent."""
+
+
+class SolveResult:
+    """
+    Exact result of a position.
+    The move is a winning move of the player to move (flat index x * size + y), or
+    SolvedPositionStore.NO_MOVE when they lose (or the game is already over).
+    """
+    __slots__ = ('winner', 'move', 'to_move', 'nodes', 'from_store')
+
+    def __init__(self, winner: int, move: int, to_move: int, nodes: int, from_store: bool = False):
+        """
+        Initialize a result.
+
+        Args:
+            winner: The player who wins with perfect play (BLUE=1, RED=2)
+            move: A winning move of the player to move, or NO_MOVE
+            to_move: The player to move in the position
+            nodes: Number of nodes searched to find it
+            from_store: Whether the result was read from the solved-position store
+        """
+        self.winner = winner
+        self.move = move
+        self.to_move = to_move
+        self.nodes = nodes
+        self.from_store = from_store
+
+    def __repr__(self) -> str:
+        return f"SolveResult(winner={self.winner}, move={self.move}, to_move={self.to_move}, nodes={self.nodes})"
+
+
+class DFPNSolver:
+    """
+    Depth-first proof-number search (Nagai) for small boards.
+
+    Positions are pairs of bitsets (see BitBoardMasks) and every node stores a proof
+    number phi and a disproof number delta for the player to move: phi is 0 when they win,
+    delta is 0 when they lose. A node is searched until one of its numbers reaches its
+    threshold, the child of smallest delta being searched next; the thresholds of the
+    child use the 1 + epsilon trick (Pawlewicz & Lew) to avoid thrashing between siblings.
+
+    Every node is pruned with the threats of the position, found by flood fill: a player
+    to move with a winning cell wins, a player facing two winning cells of the opponent
+    loses, and a player facing one must play it. Otherwise the moves are restricted to the
+    cells breaking every move that would give the opponent two winning cells (see
+    _must_play), and tried from the centre out.
+
+    The table keeps the numbers of every searched position (exact keys, so no collision)
+    until clear. With a SolvedPositionStore, positions are looked up in the store before
+    they are expanded, and the solved positions up to store_plies moves after the root are
+    written to it once a position is solved.
+    """
+    BLUE = 1
+    RED = 2
+
+    INFINITY = 1 << 40
+
+    def __init__(self, store: Optional[SolvedPositionStore] = None, epsilon: float = 0.25, store_plies: int = 2):
+        """
+        Initialize a solver.
+
+        Args:
+            store: Solved-position store to read and fill (None for none)
+            epsilon: Margin of the thresholds of the second-best sibling
+            store_plies: Depth below the root of the solved positions written to the store
+
+        Raises:
+            ValueError: If epsilon or store_plies is negative
+        """
+        if epsilon < 0 or store_plies < 0:
+            raise ValueError("Epsilon and the store depth must not be negative.")
+        self._store = store
+        self._epsilon = epsilon
+        self._store_plies = store_plies
+        # key -> [phi, delta, best move, moves (None once solved)]
+        self._table: Dict[int, list] = {}
+        self._size = 0
+        self._masks: Optional[BitBoardMasks] = None
+        self._order: List[int] = []
+        self._nodes = 0
+        self._max_nodes: Optional[int] = None
+
+    @property
+    def store(self) -> Optional[SolvedPositionStore]:
+        """Get the solved-position store."""
+        return self._store
+
+    @property
+    def nodes(self) -> int:
+        """Get the number of nodes searched by the last solve."""
+        return self._nodes
+
+    def clear(self) -> None:
+        """Drop the proof and disproof numbers of the searched positions."""
+        self._table = {}
+
+    def _set_size(self, size: int) -> None:
+        """Set up the masks and the move order of a board size."""
+        if size != self._size:
+            self._size = size
+            self._masks = BitBoardMasks.for_size(size)
+            self._order = np.argsort(HexGeometry.for_size(size).centre_distance, kind='stable').tolist()
+            self._table = {}
+
+    def _key(self, blue: int, red: int, mover: int) -> int:
+        """Get the exact table key of a position."""
+        cells = self._size * self._size
+        return blue | (red << cells) | ((mover - 1) << (2 * cells))
+
+    def _state(self, blue: int, red: int) -> np.ndarray:
+        """Get the (size, size) board state of a position."""
+        cells = self._size * self._size
+        length = (cells + 7) // 8
+        state = np.unpackbits(np.frombuffer(blue.to_bytes(length, 'little'), dtype=np.uint8), bitorder='little')[:cells]
+        state += 2 * np.unpackbits(np.frombuffer(red.to_bytes(length, 'little'), dtype=np.uint8),
+                                   bitorder='little')[:cells]
+        return state.reshape(self._size, self._size)
+
+    def _threats(self, own: int, other: int, player: int) -> int:
+        """Get the empty cells where a player would win at once."""
+        masks = self._masks
+        if player == self.BLUE:
+            start, end = masks.blue_start, masks.blue_end
+        else:
+            start, end = masks.red_start, masks.red_end
+        empty = masks.full & ~(own | other)
+        touching_start = masks.dilate(masks.flood(own & start, own)) | start
+        touching_end = masks.dilate(masks.flood(own & end, own)) | end
+        return touching_start & touching_end & empty
+
+    def _must_play(self, other: int, mover: int, empty: int) -> int:
+        """
+        Get the cells the player to move must play in, when neither player wins at once: a
+        cell giving the opponent two winning cells is a semi connection of the opponent, so
+        the move must be that cell or one of the winning cells it creates.
+        """
+        masks = self._masks
+        if mover == self.BLUE:
+            start, end = masks.red_start, masks.red_end
+        else:
+            start, end = masks.blue_start, masks.blue_end
+        # Only a stone joining the opponent's edge-connected stones (or an edge) creates threats
+        from_start, from_end = masks.flood(other & start, other), masks.flood(other & end, other)
+        near_start, near_end = masks.dilate(from_start) | start, masks.dilate(from_end) | end
+        region = empty
+        cells = empty & (near_start | near_end)
+        while cells:
+            bit = cells & -cells
+            cells ^= bit
+            stones = other | bit
+            reached_start = masks.flood(from_start | bit, stones) if bit & near_start else from_start
+            reached_end = masks.flood(from_end | bit, stones) if bit & near_end else from_end
+            threats = (masks.dilate(reached_start) | start) & (masks.dilate(reached_end) | end) & empty & ~bit
+            if threats & (threats - 1):
+                region &= bit | threats
+                if not region:
+                    break
+        return region
+
+    def _expand(self, blue: int, red: int, mover: int) -> list:
+        """
+        Create the table entry of a new position.
+
+        Returns:
+            list: [phi, delta, best move, moves]
+        """
+        if self._store is not None:
+            stored = self._store.lookup(self._state(blue, red), mover)
+            if stored is not None:
+                winner, move = stored
+                return [0, self.INFINITY, move, None] if winner == mover \
+                    else [self.INFINITY, 0, -1, None]
+        own, other = (blue, red) if mover == self.BLUE else (red, blue)
+        wins = self._threats(own, other, mover)
+        if wins:
+            return [0, self.INFINITY, (wins & -wins).bit_length() - 1, None]
+        threats = self._threats(other, own, 3 - mover)
+        if threats & (threats - 1):
+            # Two winning cells of the opponent: only one can be blocked
+            return [self.INFINITY, 0, (threats & -threats).bit_length() - 1, None]
+        if threats:
+            moves = [(threats & -threats).bit_length() - 1]
+        else:
+            empty = self._masks.full & ~(blue | red)
+            region = self._must_play(other, mover, empty)
+            if not region:
+                return [self.INFINITY, 0, -1, None]
+            moves = [index for index in self._order if region >> index & 1]
+        return [1, len(moves), moves[0], moves]
+
+    def _mid(self, blue: int, red: int, mover: int, phi_threshold: int, delta_threshold: int) -> list:
+        """
+        Search a position until its proof or disproof number reaches its threshold.
+
+        Args:
+            blue: The blue stones
+            red: The red stones
+            mover: The player to move
+            phi_threshold: Threshold of the proof number
+            delta_threshold: Threshold of the disproof number
+
+        Returns:
+            list: The table entry of the position
+
+        Raises:
+            _NodeLimit: If the node budget is spent
+        """
+        self._nodes += 1
+        if self._max_nodes is not None and self._nodes > self._max_nodes:
+            raise _NodeLimit()
+        table = self._table
+        key = self._key(blue, red, mover)
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = self._expand(blue, red, mover)
+        if entry[3] is None:
+            return entry
+
+        infinity = self.INFINITY
+        opponent = 3 - mover
+        cells = self._size * self._size
+        # Key of the children: the stone of the mover and the other player to move
+        base = key ^ (1 << (2 * cells))
+        shift = 0 if mover == self.BLUE else cells
+        moves = entry[3]
+        while True:
+            phi, delta, second = infinity, 0, infinity
+            best, best_phi = -1, 0
+            for move in moves:
+                child = table.get(base | (1 << (move + shift)))
+                child_phi, child_delta = (child[0], child[1]) if child is not None else (1, 1)
+                if child_delta < phi:
+                    second, phi, best, best_phi = phi, child_delta, move, child_phi
+                elif child_delta < second:
+                    second = child_delta
+                delta += child_phi
+            entry[0], entry[1], entry[2] = phi, min(delta, infinity), best
+            if phi == 0 or delta == 0:
+                # Solved (a child lost by the opponent, or every child won by them)
+                entry[0], entry[1] = (0, infinity) if phi == 0 else (infinity, 0)
+                entry[3] = None
+                return entry
+            delta = entry[1]
+            if phi >= phi_threshold or delta >= delta_threshold:
+                return entry
+            child_phi_threshold = min(delta_threshold - (delta - best_phi), infinity)
+            child_delta_threshold = min(phi_threshold, int(second * (1 + self._epsilon)) + 1)
+            if mover == self.BLUE:
+                self._mid(blue | (1 << best), red, opponent, child_phi_threshold, child_delta_threshold)
+            else:
+                self._mid(blue, red | (1 << best), opponent, child_phi_threshold, child_delta_threshold)
+
+    def _record(self, blue: int, red: int, mover: int, plies: int) -> None:
+        """Write a solved position and the solved positions below it, up to a number of plies."""
+        entry = self._table.get(self._key(blue, red, mover))
+        if entry is None or entry[3] is not None:
+            return
+        if entry[0] == 0:
+            self._store.store(self._state(blue, red), mover, entry[2], mover)
+            moves = [entry[2]]
+        else:
+            self._store.store(self._state(blue, red), 3 - mover, SolvedPositionStore.NO_MOVE, mover)
+            empty = self._masks.full & ~(blue | red)
+            moves = [index for index in self._order if empty >> index & 1]
+        if plies:
+            for move in moves:
+                if mover == self.BLUE:
+                    self._record(blue | (1 << move), red, 3 - mover, plies - 1)
+                else:
+                    self._record(blue, red | (1 << move), 3 - mover, plies - 1)
+
+    def solve(self, board_state: np.ndarray, to_move: Optional[int] = None,
+              max_nodes: Optional[int] = None) -> Optional[SolveResult]:
+        """
+        Solve a position.
+
+        Args:
+            board_state: The (size, size) board state
+            to_move: The player to move (deduced from the stone counts when None)
+            max_nodes: Node budget (None for no limit)
+
+        Returns:
+            Optional[SolveResult]: The result, or None if the budget ran out first
+        """
+        state = np.asarray(board_state, dtype=np.uint8)
+        self._set_size(state.shape[0])
+        flat = state.ravel()
+        if to_move is None:
+            to_move = self.BLUE if np.count_nonzero(flat) % 2 == 0 else self.RED
+        blue = int.from_bytes(np.packbits(flat == self.BLUE, bitorder='little').tobytes(), 'little')
+        red = int.from_bytes(np.packbits(flat == self.RED, bitorder='little').tobytes(), 'little')
+        self._nodes = 0
+        self._max_nodes = max_nodes
+
+        winner = self._masks.winner(blue, red)
+        if winner is not None:
+            return SolveResult(winner, SolvedPositionStore.NO_MOVE, to_move, 0)
+        if self._store is not None:
+            stored = self._store.lookup(state, to_move)
+            if stored is not None:
+                return SolveResult(stored[0], stored[1], to_move, 0, from_store=True)
+
+        try:
+            entry = self._mid(blue, red, to_move, self.INFINITY, self.INFINITY)
+        except _NodeLimit:
+            return None
+        if self._store is not None:
+            self._record(blue, red, to_move, self._store_plies)
+            self._store.commit()
+        if entry[0] == 0:
+            return SolveResult(to_move, entry[2], to_move, self._nodes)
+        return SolveResult(3 - to_move, SolvedPositionStore.NO_MOVE, to_move, self._nodes)
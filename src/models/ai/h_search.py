@@ -0,0 +1,543 @@
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+from ..core import HexGeometry, HexZobrist
+
+
+class _Templates:
+    """
+    Per-size tables of the H-search: the six neighbours of every cell in ring order (off-board
+    neighbours marked with the edge they belong to), the bridges with their carriers, and the
+    edge template II (a cell one row away from an edge, joined to it through its two edge cells).
+    """
+    # Neighbour offsets in ring order: two consecutive neighbours are adjacent
+    RING = ((1, 0), (1, 1), (0, 1), (-1, 0), (-1, -1), (0, -1))
+    # Markers of off-board neighbours in the ring
+    OFF_BLUE = -1
+    OFF_RED = -2
+    OFF_CORNER = -3
+
+    _cache: Dict[int, '_Templates'] = {}
+
+    __slots__ = ('size', 'geometry', 'ring', 'bridges', 'edge_templates')
+
+    def __init__(self, size: int):
+        """Build the tables of a board size."""
+        self.size = size
+        self.geometry = geometry = HexGeometry.for_size(size)
+        self.ring = np.empty((size * size, 6), dtype=np.intp)
+        for index, (x, y) in enumerate(geometry.coordinates.tolist()):
+            for position, (dx, dy) in enumerate(self.RING):
+                nx, ny = x + dx, y + dy
+                outside_x, outside_y = not 0 <= nx < size, not 0 <= ny < size
+                if outside_x and outside_y:
+                    self.ring[index, position] = self.OFF_CORNER
+                elif outside_x:
+                    # BLUE connects x == 0 to x == size - 1, so beyond x lies a blue edge
+                    self.ring[index, position] = self.OFF_BLUE
+                elif outside_y:
+                    self.ring[index, position] = self.OFF_RED
+                else:
+                    self.ring[index, position] = nx * size + ny
+
+        # Bridges, each listed once (first end < second end)
+        rows = np.repeat(np.arange(size * size), np.diff(geometry.bridge_offsets))
+        once = rows < geometry.bridge_indices
+        self.bridges: List[Tuple[int, int, int, int]] = [
+            (a, b, c, d) for a, b, (c, d) in zip(rows[once].tolist(), geometry.bridge_indices[once].tolist(),
+                                                 geometry.bridge_carriers[once].tolist())]
+
+        # Edge template II: per player and edge side, (cell, first edge cell, second edge cell)
+        self.edge_templates: Dict[int, List[List[Tuple[int, int, int]]]] = {}
+        for player in (HexGeometry.BLUE, HexGeometry.RED):
+            sides = []
+            for distances in geometry.edge_distances[player]:
+                templates = []
+                for index in np.flatnonzero(distances == 1).tolist():
+                    edge_cells = [n for n in geometry.neighbours(index).tolist() if distances[n] == 0]
+                    if len(edge_cells) == 2:
+                        templates.append((index, edge_cells[0], edge_cells[1]))
+                sides.append(templates)
+            self.edge_templates[player] = sides
+
+    @classmethod
+    def for_size(cls, size: int) -> '_Templates':
+        """Get the shared tables of a board size."""
+        templates = cls._cache.get(size)
+        if templates is None:
+            templates = cls._cache[size] = cls(size)
+        return templates
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Iterate over the cells of a carrier bit mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class VirtualConnections:
+    """
+    Virtual connections of one player in one position, as found by HSearch.
+
+    Nodes are the empty cells and the player's groups (flat index of a cell, any stone of a
+    group standing for the whole group), plus the two edges of the player (START and END
+    offsets past the last cell, see edge_node). A carrier is a bit mask of empty cells
+    (bit i for flat index i).
+
+    - a full connection between two nodes holds even if the opponent moves first: the
+      player answers every intrusion in the carrier
+    - a semi connection needs one more move of the player, which is inside its carrier
+    """
+    START = 0
+    END = 1
+
+    __slots__ = ('player', 'size', 'groups', '_full', '_semi')
+
+    def __init__(self, player: int, size: int, groups: np.ndarray,
+                 full: Dict[int, Dict[int, List[int]]], semi: Dict[int, Dict[int, List[int]]]):
+        """
+        Initialize the connections found by a search.
+
+        Args:
+            player: The player (BLUE=1, RED=2)
+            size: The size of the board
+            groups: Node of every cell (-1 for the opponent's stones)
+            full: Carriers of the full connections, by node pair
+            semi: Carriers of the semi connections, by node pair
+        """
+        self.player = player
+        self.size = size
+        self.groups = groups
+        self._full = full
+        self._semi = semi
+
+    def edge_node(self, side: int) -> int:
+        """Get the node of one of the player's edges (START or END)."""
+        return self.size * self.size + side
+
+    def node(self, index: int) -> int:
+        """
+        Get the node of a cell.
+
+        Raises:
+            ValueError: If the cell holds an opponent stone
+        """
+        node = int(self.groups[index])
+        if node < 0:
+            raise ValueError("Opponent stones are not nodes of the player's connections.")
+        return node
+
+    def full(self, a: int, b: int) -> List[int]:
+        """Get the carriers of the full connections between two nodes."""
+        return list(self._full.get(a, {}).get(b, ()))
+
+    def semi(self, a: int, b: int) -> List[int]:
+        """Get the carriers of the semi connections between two nodes."""
+        return list(self._semi.get(a, {}).get(b, ()))
+
+    def edge_full(self) -> List[int]:
+        """Get the carriers of the full connections between the player's edges."""
+        return self.full(self.edge_node(self.START), self.edge_node(self.END))
+
+    def edge_semi(self) -> List[int]:
+        """Get the carriers of the semi connections between the player's edges."""
+        return self.semi(self.edge_node(self.START), self.edge_node(self.END))
+
+    def is_connected(self) -> bool:
+        """Check if the player connects their edges virtually, even with the opponent to move."""
+        return bool(self.edge_full())
+
+    def cells(self, carrier: int) -> np.ndarray:
+        """Get the flat indices of the cells of a carrier."""
+        return np.fromiter(_bits(carrier), dtype=np.intp)
+
+    def __len__(self) -> int:
+        """Get the number of connections (each pair counted once)."""
+        total = sum(len(carriers) for targets in self._full.values() for carriers in targets.values())
+        total += sum(len(carriers) for targets in self._semi.values() for carriers in targets.values())
+        return total // 2
+
+
+class HSearch:
+    """
+    H-search: virtual connection engine (Anshelevich).
+
+    The connections of a player are built bottom-up:
+    - adjacent nodes are fully connected with an empty carrier, and the bridges and edge
+      template II of the position (cached per size) are added as full connections
+    - two nodes with a common empty neighbour are semi connected through it
+    - AND rule: full(x, z) and full(z, y) with disjoint carriers give full(x, y) when z is a
+      group of the player, and semi(x, y) with key z when z is empty
+    - OR rule: semi connections between the same nodes whose carriers have no common cell give
+      a full connection (pairs first, then a greedy combination of the smallest carriers)
+    until nothing new is found. The number of carriers kept per pair is limited (full_limit,
+    semi_limit), the smallest ones being kept, so the search is incomplete but sound.
+
+    The connections are cached by position hash (HexZobrist) and player, for the last
+    cache_size positions.
+
+    Inferior cells come from the neighbourhood of each empty cell: a cell is useless to a
+    player when every two neighbours it could link are already linked without it (adjacent, or
+    through stones or the edge of that player). Dead cells are useless to both players, and
+    a pair of adjacent empty cells is captured by a player when taking either cell of the pair
+    makes the other one dead.
+    """
+    BLUE = 1
+    RED = 2
+
+    def __init__(self, full_limit: int = 4, semi_limit: int = 8, cache_size: int = 4096):
+        """
+        Initialize the engine.
+
+        Args:
+            full_limit: Maximum number of full carriers kept per node pair
+            semi_limit: Maximum number of semi carriers kept per node pair
+            cache_size: Number of (position, player) searches kept
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if full_limit < 1 or semi_limit < 1 or cache_size < 0:
+            raise ValueError("Carrier limits must be positive.")
+        self._full_limit = full_limit
+        self._semi_limit = semi_limit
+        self._cache_size = cache_size
+        self._cache: 'OrderedDict[Tuple[int, int, int], VirtualConnections]' = OrderedDict()
+
+    @staticmethod
+    def _flat(board_state: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Get the flat board state and the board size."""
+        state = np.asarray(board_state, dtype=np.uint8)
+        return state.ravel(), state.shape[0]
+
+    @staticmethod
+    def _groups(state: np.ndarray, size: int, player: int) -> np.ndarray:
+        """
+        Get the node of every cell for a player: itself for empty cells, the smallest index of
+        its group for the player's stones and -1 for the opponent's stones.
+        """
+        geometry = HexGeometry.for_size(size)
+        nodes = np.where(state == 0, np.arange(state.size), -1)
+        for index in np.flatnonzero(state == player).tolist():
+            if nodes[index] >= 0:
+                continue
+            stack, nodes[index] = [index], index
+            while stack:
+                cell = stack.pop()
+                for neighbour in geometry.neighbours(cell).tolist():
+                    if state[neighbour] == player and nodes[neighbour] < 0:
+                        nodes[neighbour] = index
+                        stack.append(neighbour)
+        return nodes
+
+    def connections(self, board_state: np.ndarray, player: int) -> VirtualConnections:
+        """
+        Find the virtual connections of a player.
+
+        Args:
+            board_state: The (size, size) board state
+            player: The player (BLUE=1, RED=2)
+
+        Returns:
+            VirtualConnections: The connections found
+        """
+        state, size = self._flat(board_state)
+        key = (size, HexZobrist.for_size(size).hash_board(state), player)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        connections = self._search(state, size, player)
+        if self._cache_size:
+            self._cache[key] = connections
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return connections
+
+    def _search(self, state: np.ndarray, size: int, player: int) -> VirtualConnections:
+        """Run the H-search of a player on a flat board state."""
+        templates = _Templates.for_size(size)
+        geometry = templates.geometry
+        cells = size * size
+        groups = self._groups(state, size, player)
+        empty = state == 0
+        edges = geometry.edge_masks[player]
+        full: Dict[int, Dict[int, List[int]]] = {}
+        semi: Dict[int, Dict[int, List[int]]] = {}
+        queue: List[Tuple[int, int, int]] = []
+
+        def is_cell(node: int) -> bool:
+            return node < cells
+
+        def add_full(a: int, b: int, carrier: int) -> None:
+            if a == b:
+                return
+            carriers = full.setdefault(a, {}).setdefault(b, [])
+            if any(existing & carrier == existing for existing in carriers):
+                return
+            carriers[:] = [existing for existing in carriers if existing & carrier != carrier]
+            carriers.append(carrier)
+            carriers.sort(key=int.bit_count)
+            del carriers[self._full_limit:]
+            # Both directions share the same list
+            full.setdefault(b, {})[a] = carriers
+            if carrier in carriers:
+                queue.append((a, b, carrier))
+
+        def add_semi(a: int, b: int, carrier: int) -> None:
+            if a == b:
+                return
+            if any(existing & carrier == existing for existing in full.get(a, {}).get(b, ())):
+                return
+            carriers = semi.setdefault(a, {}).setdefault(b, [])
+            if any(existing & carrier == existing for existing in carriers):
+                return
+            carriers[:] = [existing for existing in carriers if existing & carrier != carrier]
+            carriers.append(carrier)
+            carriers.sort(key=int.bit_count)
+            del carriers[self._semi_limit:]
+            semi.setdefault(b, {})[a] = carriers
+            if carrier not in carriers:
+                return
+            # OR rule: two disjoint semi carriers first, then the greedy intersection of all of them
+            for other in carriers:
+                if not other & carrier:
+                    add_full(a, b, other | carrier)
+                    return
+            union, common = 0, -1
+            for other in carriers:
+                if common & other != common:
+                    common &= other
+                    union |= other
+                    if not common:
+                        add_full(a, b, union)
+                        return
+
+        # Nodes adjacent to each other or to an edge
+        nodes = groups
+        for index in np.flatnonzero(nodes >= 0).tolist():
+            node = int(nodes[index])
+            for neighbour in geometry.neighbours(index).tolist():
+                other = int(nodes[neighbour])
+                if other >= 0:
+                    add_full(node, other, 0)
+            for side in (VirtualConnections.START, VirtualConnections.END):
+                if edges[side][index]:
+                    add_full(node, cells + side, 0)
+
+        # Cached templates: bridges and edge template II
+        for a, b, c, d in templates.bridges:
+            if nodes[a] >= 0 and nodes[b] >= 0 and empty[c] and empty[d]:
+                add_full(int(nodes[a]), int(nodes[b]), (1 << c) | (1 << d))
+        for side, side_templates in enumerate(templates.edge_templates[player]):
+            for index, c, d in side_templates:
+                if nodes[index] >= 0 and empty[c] and empty[d]:
+                    add_full(int(nodes[index]), cells + side, (1 << c) | (1 << d))
+
+        # AND rule over every new full connection, through either of its ends
+        while queue:
+            a, b, carrier = queue.pop()
+            if carrier not in full.get(a, {}).get(b, ()):
+                continue
+            for middle, end in ((b, a), (a, b)):
+                if not is_cell(middle):
+                    continue
+                middle_empty = bool(empty[middle])
+                for other, carriers in list(full.get(middle, {}).items()):
+                    if other == end:
+                        continue
+                    for second in list(carriers):
+                        if second & carrier:
+                            continue
+                        # An empty end cannot lie in the other carrier
+                        if (is_cell(end) and second >> end & 1) or (is_cell(other) and carrier >> other & 1):
+                            continue
+                        if middle_empty:
+                            add_semi(end, other, carrier | second | (1 << middle))
+                        else:
+                            add_full(end, other, carrier | second)
+        return VirtualConnections(player, size, groups, full, semi)
+
+    # Inferior cells
+
+    def _useless(self, state: np.ndarray, size: int, index: int, player: int, groups: np.ndarray) -> bool:
+        """
+        Check if an empty cell is useless to a player: every two neighbours the player could
+        link through it are already linked (adjacent, or through the player's stones or edge).
+        """
+        templates = _Templates.for_size(size)
+        own_edge = templates.OFF_BLUE if player == self.BLUE else templates.OFF_RED
+        labels = []
+        for neighbour in templates.ring[index].tolist():
+            if neighbour >= 0:
+                value = state[neighbour]
+                if value == 0:
+                    labels.append(None)
+                elif value == player:
+                    labels.append(int(groups[neighbour]))
+                else:
+                    labels.append(False)
+            elif neighbour == own_edge:
+                # The two edges of a player are distinct nodes
+                labels.append(-1 - int(templates.geometry.coordinates[index][0 if player == self.BLUE else 1] > 0))
+            else:
+                labels.append(False)
+
+        # Components of the player's stones and edges touched by every usable neighbour
+        touched = []
+        for position, label in enumerate(labels):
+            if label is False:
+                touched.append(None)
+                continue
+            components = set()
+            for offset in (-1, 0, 1):
+                other = labels[(position + offset) % 6]
+                if other is not None and other is not False:
+                    components.add(other)
+            touched.append(components)
+        usable = [position for position, label in enumerate(labels) if label is not False]
+        for i, first in enumerate(usable):
+            for second in usable[i + 1:]:
+                if (second - first) % 6 in (1, 5):
+                    continue
+                if not touched[first] & touched[second]:
+                    return False
+        return True
+
+    def dead_cells(self, board_state: np.ndarray) -> np.ndarray:
+        """
+        Find the dead cells: empty cells whose colour cannot matter to either player.
+
+        Args:
+            board_state: The (size, size) board state
+
+        Returns:
+            np.ndarray: Boolean (size, size) mask of the dead cells
+        """
+        state, size = self._flat(board_state)
+        blue_groups = self._groups(state, size, self.BLUE)
+        red_groups = self._groups(state, size, self.RED)
+        dead = np.zeros(state.size, dtype=bool)
+        for index in np.flatnonzero(state == 0).tolist():
+            dead[index] = self._useless(state, size, index, self.BLUE, blue_groups) \
+                and self._useless(state, size, index, self.RED, red_groups)
+        return dead.reshape(size, size)
+
+    def captured_cells(self, board_state: np.ndarray, player: int) -> np.ndarray:
+        """
+        Find the cells captured by a player: pairs of adjacent empty cells such that after the
+        player takes either one, the other is dead. The player can be given both cells.
+
+        Args:
+            board_state: The (size, size) board state
+            player: The player (BLUE=1, RED=2)
+
+        Returns:
+            np.ndarray: Boolean (size, size) mask of the captured cells
+        """
+        state, size = self._flat(board_state)
+        geometry = HexGeometry.for_size(size)
+        captured = np.zeros(state.size, dtype=bool)
+        for first in np.flatnonzero(state == 0).tolist():
+            for second in geometry.neighbours(first).tolist():
+                if second <= first or state[second] != 0:
+                    continue
+                if self._dead_after(state, size, first, second, player) \
+                        and self._dead_after(state, size, second, first, player):
+                    captured[first] = captured[second] = True
+        return captured.reshape(size, size)
+
+    def _dead_after(self, state: np.ndarray, size: int, cell: int, taken: int, player: int) -> bool:
+        """Check if a cell is dead once a player has taken another cell."""
+        after = state.copy()
+        after[taken] = player
+        return self._useless(after, size, cell, self.BLUE, self._groups(after, size, self.BLUE)) \
+            and self._useless(after, size, cell, self.RED, self._groups(after, size, self.RED))
+
+    def fill_in(self, board_state: np.ndarray) -> np.ndarray:
+        """
+        Fill the inferior cells until none is left: captured cells go to their captor and dead
+        cells to blue (their colour does not matter). The winner of the position is unchanged,
+        but the stone counts no longer tell the player to move.
+
+        Args:
+            board_state: The (size, size) board state
+
+        Returns:
+            np.ndarray: The filled (size, size) board state
+        """
+        state = np.array(board_state, dtype=np.uint8)
+        while True:
+            changed = False
+            for player in (self.BLUE, self.RED):
+                captured = self.captured_cells(state, player)
+                if captured.any():
+                    state[captured] = player
+                    changed = True
+            dead = self.dead_cells(state)
+            if dead.any():
+                state[dead] = self.BLUE
+                changed = True
+            if not changed:
+                return state
+
+    # Use by searches
+
+    def virtual_winner(self, board_state: np.ndarray, to_move: Optional[int] = None) -> Optional[int]:
+        """
+        Find a player who wins by virtual connection: a full connection between their edges,
+        or a semi connection for the player to move.
+
+        Args:
+            board_state: The (size, size) board state
+            to_move: The player to move (deduced from the stone counts when None)
+
+        Returns:
+            Optional[int]: The winner, or None if neither player has a virtual win
+        """
+        state, size = self._flat(board_state)
+        if to_move is None:
+            to_move = self.BLUE if np.count_nonzero(state) % 2 == 0 else self.RED
+        mover = self.connections(board_state, to_move)
+        if mover.is_connected() or mover.edge_semi():
+            return to_move
+        if self.connections(board_state, 3 - to_move).is_connected():
+            return 3 - to_move
+        return None
+
+    def must_play(self, board_state: np.ndarray, to_move: Optional[int] = None) -> np.ndarray:
+        """
+        Find the cells the player to move must play in: the common cells of the carriers of
+        the opponent's connections between their edges (any other move lets the opponent
+        connect). Dead cells are left out when other cells remain.
+
+        Args:
+            board_state: The (size, size) board state
+            to_move: The player to move (deduced from the stone counts when None)
+
+        Returns:
+            np.ndarray: Boolean (size, size) mask of the cells to consider (every empty cell
+                        when the opponent has no connection between their edges)
+        """
+        state, size = self._flat(board_state)
+        if to_move is None:
+            to_move = self.BLUE if np.count_nonzero(state) % 2 == 0 else self.RED
+        opponent = self.connections(board_state, 3 - to_move)
+        carriers = opponent.edge_full() + opponent.edge_semi()
+        region = state == 0
+        if carriers:
+            common = -1
+            for carrier in carriers:
+                common &= carrier
+            mask = np.zeros(state.size, dtype=bool)
+            mask[opponent.cells(common & ((1 << state.size) - 1))] = True
+            # Without common cells the opponent wins anyway: every move is left
+            if (region & mask).any():
+                region &= mask
+        alive = region & ~self.dead_cells(board_state).ravel()
+        if alive.any():
+            region = alive
+        return region.reshape(size, size)
@@ -0,0 +1,430 @@
+from typing import Optional, List, Any, Callable, Tuple
+import math
+import time
+import numpy as np
+
+from .ai_player import AIPlayer
+from .rollout_engine import RolloutEngine
+from .transposition_table import SharedTranspositionTable
+from ..core import HexCell, HexCellTable, HexWinDetector, HexZobrist, IHexBoard, IHexGame
+
+
+class MCTSNode:
+    """
+    Node of the MCTS tree: one position, with the statistics of all its moves in flat arrays.
+
+    The moves are the flat indices (x * size + y) of the empty cells. For each move the node keeps
+    the visit and win counts of the child (UCT) and the all-moves-as-first counts (AMAF/RAVE):
+    how often the player to move owned that cell at the end of a playout through this node.
+    Children are created the first time their move is selected.
+    """
+    __slots__ = ('player', 'moves', 'children', 'visits', 'wins', 'amaf_visits', 'amaf_wins', 'total', 'key')
+
+    def __init__(self, player: int, moves: np.ndarray, key: int = 0):
+        """
+        Initialize a node without statistics.
+
+        Args:
+            player: The player to move (BLUE=1, RED=2)
+            moves: Flat indices of the empty cells
+            key: Zobrist hash of the position (kept only when a transposition table is used)
+        """
+        self.player = player
+        self.moves = moves
+        self.key = key
+        self.children: List[Optional['MCTSNode']] = [None] * len(moves)
+        self.visits = np.zeros(len(moves))
+        self.wins = np.zeros(len(moves))
+        self.amaf_visits = np.zeros(len(moves))
+        self.amaf_wins = np.zeros(len(moves))
+        self.total = 0
+
+    def child(self, position: int) -> 'MCTSNode':
+        """Get the child reached by the move at a position of the move array, creating it if needed."""
+        child = self.children[position]
+        if child is None:
+            child = self.children[position] = MCTSNode(3 - self.player, np.delete(self.moves, position))
+        return child
+
+    def best_move(self) -> int:
+        """Get the most visited move (flat index)."""
+        return int(self.moves[int(np.argmax(self.visits))])
+
+
+class MCTSStrategy(AIPlayer):
+    """
+    Monte-Carlo Tree Search player with UCT selection and RAVE (AMAF) statistics.
+
+    Playouts use the fact that Hex has no draws: instead of playing random moves one
+    at a time and checking for a winner after each of them, the remaining empty cells
+    are shuffled and filled alternately at once, and the winner of the full board is
+    detected once. The winner of the full board is the winner of the game, whatever
+    the moves after the winning one.
+
+    New leaves can also be evaluated by a batch of completions simulated together by the
+    RolloutEngine (leaf_rollouts), which trades tree growth for cheaper playouts.
+
+    The search budget is a number of playouts, a time limit in milliseconds, or both
+    (the first one reached stops the search).
+
+    With a SharedTranspositionTable, the searches share what they learnt: a new node whose
+    position is in the table starts with a prior on the best move found there, and the nodes
+    visited at least TT_MIN_VISITS times are written back to the table after each search.
+
+    While the opponent thinks, ponder grows the tree of the position they have to play in
+    (continuing the tree of the last search). The next search starts from the subtree of the
+    move they actually played, and the rest of the pondered tree is dropped.
+    """
+    # Visits a node needs to be written to the transposition table
+    TT_MIN_VISITS = 32
+    # Visits given to the best move of a node found in the transposition table
+    TT_PRIOR_VISITS = 10
+    # Most playouts of one ponder, bounding the tree grown on the opponent's time
+    PONDER_MAX_PLAYOUTS = 100000
+    def __init__(self, player_id: str, name: str, is_blue: bool, min_think_time: float = 0.0,
+                 playouts: Optional[int] = 1000, time_limit_ms: Optional[float] = None,
+                 exploration: float = 0.25, rave_equivalence: float = 300.0, seed: Optional[int] = None,
+                 leaf_rollouts: int = 1, transposition_table: Optional[SharedTranspositionTable] = None):
+        """
+        Initialize an MCTS player.
+
+        Args:
+            player_id: Unique identifier for the player
+            name: Display name of the player
+            is_blue: Whether the player plays as blue
+            min_think_time: Minimum time in seconds the player must wait before making a move
+            playouts: Maximum number of playouts per move (None for no limit)
+            time_limit_ms: Maximum search time per move in milliseconds (None for no limit)
+            exploration: UCT exploration constant
+            rave_equivalence: Number of visits at which UCT and AMAF values weigh the same
+            seed: Seed of the random generator, for reproducible searches
+            leaf_rollouts: Number of completions evaluating each new leaf; above 1 they are
+                           simulated together by the RolloutEngine and count as that many playouts
+            transposition_table: Table shared with other searches (e.g. the workers of a ParallelSearch)
+
+        Raises:
+            ValueError: If neither a playout nor a time budget is given
+        """
+        super().__init__(player_id, name, is_blue, min_think_time)
+        if playouts is None and time_limit_ms is None:
+            raise ValueError("A playout or time budget must be provided.")
+        self._playouts = playouts
+        self._time_limit_ms = time_limit_ms
+        self._exploration = exploration
+        self._rave_equivalence = rave_equivalence
+        if leaf_rollouts < 1:
+            raise ValueError("At least one rollout per leaf is needed.")
+        self._rng = np.random.default_rng(seed)
+        self._leaf_rollouts = leaf_rollouts
+        self._rollouts = RolloutEngine(seed)
+        self._transposition_table = transposition_table
+        self._keys: List[List[int]] = []
+        self._root: Optional[MCTSNode] = None
+        self._root_state: Optional[np.ndarray] = None
+        self._ponder_root: Optional[MCTSNode] = None
+        self._ponder_state: Optional[np.ndarray] = None
+
+    @property
+    def root(self) -> Optional[MCTSNode]:
+        """Get the root of the last search."""
+        return self._root
+
+    def _score(self, node: MCTSNode) -> np.ndarray:
+        """
+        Compute the selection score of every move of a node.
+        The value mixes the UCT and AMAF win rates, with the AMAF weight decreasing as visits grow.
+
+        Args:
+            node: The node to select from
+
+        Returns:
+            np.ndarray: One score per move, the highest is selected
+        """
+        visits = node.visits
+        value = np.divide(node.wins, visits, out=np.full_like(visits, 0.5), where=visits > 0)
+        amaf = np.divide(node.amaf_wins, node.amaf_visits, out=np.full_like(visits, 0.5),
+                         where=node.amaf_visits > 0)
+        beta = np.sqrt(self._rave_equivalence / (3.0 * visits + self._rave_equivalence))
+        exploration = self._exploration * np.sqrt(math.log(node.total + 1) / (visits + 1.0))
+        return (1.0 - beta) * value + beta * amaf + exploration
+
+    def _seed_from_table(self, node: MCTSNode, size: int) -> None:
+        """
+        Give a new node a prior on the best move stored for its position in the transposition table.
+
+        Args:
+            node: The new node (with its key set)
+            size: The size of the board
+        """
+        entry = self._transposition_table.lookup(SharedTranspositionTable.position_key(node.key, size))
+        if entry is None:
+            return
+        visits, value, best_move, _ = entry
+        position = np.flatnonzero(node.moves == best_move)
+        if not len(position):
+            return
+        prior = min(visits, self.TT_PRIOR_VISITS)
+        node.visits[position[0]] += prior
+        node.wins[position[0]] += prior * value
+        node.total += prior
+
+    def _store_in_table(self, root: MCTSNode, size: int) -> None:
+        """
+        Write the nodes of the tree visited at least TT_MIN_VISITS times to the transposition table.
+
+        Args:
+            root: The root of the tree
+            size: The size of the board
+        """
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            if node.total < self.TT_MIN_VISITS:
+                continue
+            best = int(np.argmax(node.visits))
+            self._transposition_table.store(SharedTranspositionTable.position_key(node.key, size), int(node.total),
+                                            float(node.wins[best] / node.visits[best]), int(node.moves[best]))
+            nodes.extend(child for child in node.children if child is not None)
+
+    def _playout(self, state: np.ndarray, player: int, size: int) -> int:
+        """
+        Fill the empty cells of a position randomly and get the winner of the full board.
+
+        Args:
+            state: Flat board state, filled in place
+            player: The player to move
+            size: The size of the board
+
+        Returns:
+            int: The winner (BLUE=1, RED=2)
+        """
+        empties = np.flatnonzero(state == 0)
+        self._rng.shuffle(empties)
+        state[empties[0::2]] = player
+        state[empties[1::2]] = 3 - player
+        return HexWinDetector.static_detect_full_board_winner(state.reshape(size, size))
+
+    def _run_playout(self, root: MCTSNode, root_state: np.ndarray, size: int) -> None:
+        """
+        Run one iteration: select down the tree, expand one node, play out and back up the result.
+
+        Args:
+            root: The root of the tree
+            root_state: Flat board state of the root position
+            size: The size of the board
+        """
+        state = root_state.copy()
+        node = root
+        path = []
+        while len(node.moves):
+            position = int(np.argmax(self._score(node)))
+            path.append((node, position))
+            state[node.moves[position]] = node.player
+            expanded = node.children[position] is None
+            parent, node = node, node.child(position)
+            if expanded:
+                if self._transposition_table is not None:
+                    node.key = parent.key ^ self._keys[parent.player][int(parent.moves[position])]
+                    self._seed_from_table(node, size)
+                break
+
+        if self._leaf_rollouts == 1:
+            winner = self._playout(state, node.player, size)
+            for node, position in path:
+                won = winner == node.player
+                node.total += 1
+                node.visits[position] += 1
+                node.wins[position] += won
+                # AMAF: every move of this node whose cell the player to move owns at the end
+                owned = state[node.moves] == node.player
+                node.amaf_visits[owned] += 1
+                if won:
+                    node.amaf_wins[owned] += 1
+            return
+
+        # Leaf evaluated by a batch of completions, backed up as that many playouts
+        count = self._leaf_rollouts
+        boards = self._rollouts.completions(state.reshape(size, size), count, node.player)
+        winners = HexWinDetector.detect_full_board_winners(boards)
+        boards = boards.reshape(count, -1)
+        for node, position in path:
+            won = winners == node.player
+            node.total += count
+            node.visits[position] += count
+            node.wins[position] += np.count_nonzero(won)
+            owned = boards[:, node.moves] == node.player
+            node.amaf_visits += owned.sum(axis=0)
+            node.amaf_wins += owned[won].sum(axis=0)
+
+    def _new_root(self, state: np.ndarray, size: int) -> MCTSNode:
+        """
+        Create the root of a new tree.
+
+        Args:
+            state: Flat board state of the position (with empty cells)
+            size: The size of the board
+
+        Returns:
+            MCTSNode: The root, seeded from the transposition table if there is one
+        """
+        moves = np.flatnonzero(state == 0)
+        player = self.BLUE_PLAYER if (size * size - len(moves)) % 2 == 0 else self.RED_PLAYER
+        root = MCTSNode(player, moves)
+        if self._transposition_table is not None:
+            root.key = HexZobrist.for_size(size).hash_board(state.reshape(size, size))
+            self._seed_from_table(root, size)
+        return root
+
+    @staticmethod
+    def _subtree(node: Optional[MCTSNode], node_state: Optional[np.ndarray], state: np.ndarray) -> Optional[MCTSNode]:
+        """
+        Find the node of a position in an earlier tree, following the stones played since its root.
+
+        Args:
+            node: The root of the earlier tree (None for none)
+            node_state: Flat board state of that root
+            state: Flat board state of the position
+
+        Returns:
+            Optional[MCTSNode]: The node of the position, or None if the tree does not reach it
+        """
+        if node is None or node_state.shape != state.shape or ((node_state != 0) & (node_state != state)).any():
+            return None
+        added = np.flatnonzero(node_state != state)
+        while len(added):
+            # The next stone is one of the player to move in the node
+            mine = np.flatnonzero(state[added] == node.player)
+            if not len(mine):
+                return None
+            node = node.children[int(np.searchsorted(node.moves, added[mine[0]]))]
+            if node is None:
+                return None
+            added = np.delete(added, mine[0])
+        return node
+
+    def ponder(self, board: IHexBoard, stop: Callable[[], bool]) -> None:
+        """
+        Search a position where the opponent is to move, on their time, until stop returns True
+        or PONDER_MAX_PLAYOUTS playouts are run. The tree of the last search is continued when
+        the position follows from it; the next search reuses the subtree of the opponent's move.
+
+        Args:
+            board: The board to search (left untouched)
+            stop: Called between playouts; pondering stops as soon as it returns True
+        """
+        size = board.size
+        state = board.board_view().ravel().copy()
+        if not (state == 0).any():
+            return
+        if self._transposition_table is not None:
+            self._keys = HexZobrist.for_size(size).keys
+        root = self._subtree(self._root, self._root_state, state)
+        if root is None:
+            root = self._new_root(state, size)
+        self._ponder_root, self._ponder_state = root, state
+
+        playouts = 0
+        while playouts < self.PONDER_MAX_PLAYOUTS and not stop():
+            self._run_playout(root, state, size)
+            playouts += self._leaf_rollouts
+
+    def search(self, board: IHexBoard, deadline: Optional[float] = None,
+               stop: Optional[Callable[[], bool]] = None) -> Optional[int]:
+        """
+        Search the position of a board for the player to move (blue always starts).
+
+        Args:
+            board: The board to search (left untouched)
+            deadline: Wall-clock time (time.time()) at which the search stops, on top of the budget
+            stop: Called between playouts; the search stops as soon as it returns True
+
+        Returns:
+            Optional[int]: The flat index (x * size + y) of the best move, or None on a full board
+        """
+        size = board.size
+        root_state = board.board_view().ravel().copy()
+        if not (root_state == 0).any():
+            return None
+        if self._transposition_table is not None:
+            self._keys = HexZobrist.for_size(size).keys
+        # The subtree of the move actually played is kept from pondering, the rest is dropped
+        root = self._subtree(self._ponder_root, self._ponder_state, root_state)
+        self._ponder_root = self._ponder_state = None
+        if root is None:
+            root = self._new_root(root_state, size)
+        self._root, self._root_state = root, root_state
+
+        # Both limits are converted to the monotonic clock
+        now = time.perf_counter()
+        limits = []
+        if self._time_limit_ms is not None:
+            limits.append(now + self._time_limit_ms / 1000.0)
+        if deadline is not None:
+            limits.append(now + deadline - time.time())
+        end = min(limits) if limits else None
+
+        playouts = 0
+        while (self._playouts is None or playouts < self._playouts) \
+                and (end is None or time.perf_counter() < end) \
+                and (stop is None or not stop()):
+            self._run_playout(root, root_state, size)
+            playouts += self._leaf_rollouts
+        if self._transposition_table is not None:
+            self._store_in_table(root, size)
+        # The root always gets a move, even when stopped before the first playout
+        return root.best_move()
+
+    def analyse(self, board: IHexBoard, deadline: Optional[float] = None,
+                stop: Optional[Callable[[], bool]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Search a position and get the statistics of the root moves.
+
+        Args:
+            board: The board to search (left untouched)
+            deadline: Wall-clock time (time.time()) at which the search stops, on top of the budget
+            stop: Called between playouts; the search stops as soon as it returns True
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The flat indices of the moves, their visits and their wins
+        """
+        if self.search(board, deadline, stop) is None:
+            empty = np.zeros(0)
+            return empty.astype(np.intp), empty, empty
+        root = self._root
+        return root.moves, root.visits.copy(), root.wins.copy()
+
+    def select_move(self, game: IHexGame) -> Optional[HexCell]:
+        """
+        Select a move based on the current game state.
+        This implementation runs a search within the budget and plays the most visited move.
+
+        Args:
+            game: The current game state
+
+        Returns:
+            Optional[HexCell]: The selected cell to play, or None if no move is selected
+        """
+        if not self._is_my_turn(game):
+            return None
+
+        start = time.time()
+        index = self.search(game.board)
+        if index is None:
+            return None
+
+        # Wait for what remains of the minimum think time
+        self._wait_min_think_time(start)
+        return HexCellTable.for_size(game.board.size).cells[index]
+
+    def handle_game_over(self, winner, reason: Any) -> None:
+        """
+        Handle the end of the game.
+        For MCTS players, this drops the search and ponder trees.
+
+        Args:
+            winner: The player who won, or None if there was no winner
+            reason: The reason why the game ended
+        """
+        super().handle_game_over(winner, reason)
+        self._root = self._root_state = None
+        self._ponder_root = self._ponder_state = None
@@ -0,0 +1,302 @@
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Type
+import inspect
+import multiprocessing
+import os
+import time
+import numpy as np
+
+from .ai_player import AIPlayer
+from .mcts_strategy import MCTSStrategy
+from .transposition_table import SharedTranspositionTable
+from ..core import HexBoard, HexCell, HexCellTable, HexGeometry, IHexBoard, IHexGame
+
+# Cancellation flag shared by the driver and its workers (set in each worker by _init_worker)
+_cancel_event = None
+# Transposition table shared by the driver and its workers (attached in each worker by _init_worker)
+_transposition_table: Optional[SharedTranspositionTable] = None
+
+
+def _init_worker(cancel_event: Any, sizes: Sequence[int],
+                 transposition_table: Optional[SharedTranspositionTable] = None) -> None:
+    """
+    Prepare a worker process once: keep the cancellation flag and the transposition table,
+    and warm the per-size tables.
+
+    Args:
+        cancel_event: The driver's cancellation event
+        sizes: Board sizes whose tables are built in advance
+        transposition_table: The driver's transposition table, if any
+    """
+    global _cancel_event, _transposition_table
+    _cancel_event = cancel_event
+    _transposition_table = transposition_table
+    for size in sizes:
+        HexGeometry.for_size(size)
+        HexCellTable.for_size(size)
+
+
+def _cancelled() -> bool:
+    """Check if the driver cancelled the current search."""
+    return _cancel_event is not None and _cancel_event.is_set()
+
+
+def _worker_analyse(strategy_class: Type[AIPlayer], strategy_kwargs: Dict[str, Any], board: IHexBoard,
+                    is_blue: bool, deadline: Optional[float], seed: int) -> tuple:
+    """
+    Run one independent search in a worker process.
+
+    Args:
+        strategy_class: The strategy to run
+        strategy_kwargs: Extra arguments of the strategy's constructor
+        board: The position to search
+        is_blue: Whether blue is to move
+        deadline: Shared wall-clock deadline (time.time())
+        seed: Seed of this worker's search
+
+    Returns:
+        tuple: The flat indices of the moves, their visits and their wins
+    """
+    kwargs = dict(strategy_kwargs)
+    parameters = inspect.signature(strategy_class).parameters
+    if 'seed' in parameters:
+        kwargs['seed'] = seed
+    if _transposition_table is not None and 'transposition_table' in parameters:
+        kwargs['transposition_table'] = _transposition_table
+    strategy = strategy_class("worker", "worker", is_blue, 0.0, **kwargs)
+    if _cancelled():
+        moves = board.empty_indices()
+        return moves, np.zeros(len(moves)), np.zeros(len(moves))
+    return strategy.analyse(board, deadline, _cancelled)
+
+
+class ParallelSearchResult:
+    """
+    Merged root statistics of a parallel search.
+    Arrays are indexed by flat cell index (x * size + y); occupied cells have no visits.
+    """
+    __slots__ = ('visits', 'wins', 'searches')
+
+    def __init__(self, cells: int):
+        """Initialize empty statistics for a board of the given number of cells."""
+        self.visits = np.zeros(cells)
+        self.wins = np.zeros(cells)
+        self.searches = 0
+
+    def add(self, moves: np.ndarray, visits: np.ndarray, wins: np.ndarray) -> None:
+        """Add the root statistics of one search."""
+        np.add.at(self.visits, moves, visits)
+        np.add.at(self.wins, moves, wins)
+        self.searches += 1
+
+    @property
+    def total_visits(self) -> float:
+        """Get the number of root visits of all searches."""
+        return float(self.visits.sum())
+
+    def values(self) -> np.ndarray:
+        """Get the win rate of every move for the player to move (NaN for unvisited cells)."""
+        values = np.full(self.visits.shape, np.nan)
+        np.divide(self.wins, self.visits, out=values, where=self.visits > 0)
+        return values
+
+    def best_move(self) -> Optional[int]:
+        """Get the most visited move (flat index), or None if nothing was visited."""
+        if not self.visits.any():
+            return None
+        return int(np.argmax(self.visits))
+
+
+class ParallelSearch:
+    """
+    Root-parallel search driver: every worker process grows its own search tree of the same
+    position, and the root statistics (visits and wins per move) are summed at the end.
+
+    The worker processes are started once and reused for every search (warm workers):
+    imports and per-size tables are paid once per process. All searches share one
+    wall-clock deadline, and cancel() stops the running searches at their next playout.
+
+    Any strategy of src.models.ai can be driven: its constructor must accept
+    (player_id, name, is_blue, min_think_time, **strategy_kwargs) and it must implement
+    analyse(board, deadline, stop). AIPlayer provides a default analyse (one visit to
+    its chosen move), searching strategies such as MCTSStrategy return their root statistics.
+
+    The workers can also share a SharedTranspositionTable, handed to the strategies that accept
+    a transposition_table argument. The table stays owned by the caller, who closes it after the driver.
+    """
+    def __init__(self, strategy_class: Type[AIPlayer], workers: Optional[int] = None,
+                 sizes: Sequence[int] = (), seed: Optional[int] = None,
+                 transposition_table: Optional[SharedTranspositionTable] = None, **strategy_kwargs: Any):
+        """
+        Start the worker processes.
+
+        Args:
+            strategy_class: The strategy run by the workers
+            workers: Number of worker processes (one per core when None)
+            sizes: Board sizes whose tables the workers build at start-up
+            seed: Base seed of the searches (each search gets its own seed)
+            transposition_table: Table shared by the searches of the workers
+            strategy_kwargs: Extra arguments of the strategy's constructor
+
+        Raises:
+            ValueError: If the number of workers is not positive
+        """
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers < 1:
+            raise ValueError("At least one worker is needed.")
+        self._strategy_class = strategy_class
+        self._strategy_kwargs = strategy_kwargs
+        self._workers = workers
+        self._seeds = np.random.default_rng(seed)
+        self._cancel_event = multiprocessing.Event()
+        self._futures: List[Future] = []
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                             initargs=(self._cancel_event, tuple(sizes), transposition_table))
+
+    @property
+    def workers(self) -> int:
+        """Get the number of worker processes."""
+        return self._workers
+
+    def search(self, board: IHexBoard, time_limit_ms: Optional[float] = None,
+               deadline: Optional[float] = None, searches: Optional[int] = None) -> ParallelSearchResult:
+        """
+        Search a position on all workers and merge their root statistics.
+
+        Args:
+            board: The board to search (left untouched)
+            time_limit_ms: Time allowed for the search, from now
+            deadline: Wall-clock time (time.time()) at which every search stops
+            searches: Number of independent searches (one per worker when None)
+
+        Returns:
+            ParallelSearchResult: The merged statistics (partial if the search was cancelled)
+        """
+        if time_limit_ms is not None:
+            limit = time.time() + time_limit_ms / 1000.0
+            deadline = limit if deadline is None else min(deadline, limit)
+        size = board.size
+        is_blue = board.get_total_moves() % 2 == 0
+        # A compact copy is sent to the workers
+        board = board.fork().to_hex_board() if not isinstance(board, HexBoard) else board.fork()
+
+        self._cancel_event.clear()
+        count = searches if searches is not None else self._workers
+        self._futures = [
+            self._executor.submit(_worker_analyse, self._strategy_class, self._strategy_kwargs, board,
+                                  is_blue, deadline, int(seed))
+            for seed in self._seeds.integers(0, 2 ** 31, size=count)
+        ]
+
+        result = ParallelSearchResult(size * size)
+        for future in self._futures:
+            try:
+                moves, visits, wins = future.result()
+            except CancelledError:
+                continue
+            result.add(moves, visits, wins)
+        self._futures = []
+        return result
+
+    def cancel(self) -> None:
+        """
+        Stop the current search: queued searches are dropped and running ones stop at their
+        next playout, so search() returns the statistics gathered so far.
+        May be called from another thread.
+        """
+        self._cancel_event.set()
+        for future in list(self._futures):
+            future.cancel()
+
+    def close(self) -> None:
+        """Cancel any search and stop the worker processes."""
+        self.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> 'ParallelSearch':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ParallelStrategy(AIPlayer):
+    """
+    AI player running another strategy root-parallel on a ParallelSearch driver.
+    Each move is searched by all workers until the time limit, and the most visited move is played.
+    """
+    def __init__(self, player_id: str, name: str, is_blue: bool, min_think_time: float = 0.0,
+                 strategy_class: Optional[Type[AIPlayer]] = None, workers: Optional[int] = None,
+                 time_limit_ms: float = 1000.0, seed: Optional[int] = None,
+                 driver: Optional[ParallelSearch] = None, **strategy_kwargs: Any):
+        """
+        Initialize a parallel player and start its workers.
+
+        Args:
+            player_id: Unique identifier for the player
+            name: Display name of the player
+            is_blue: Whether the player plays as blue
+            min_think_time: Minimum time in seconds the player must wait before making a move
+            strategy_class: The strategy run by the workers (MCTSStrategy when None)
+            workers: Number of worker processes (one per core when None)
+            time_limit_ms: Search time per move in milliseconds
+            seed: Base seed of the searches
+            driver: A running driver to use (left open by close) instead of starting new workers
+            strategy_kwargs: Extra arguments of the strategy's constructor
+        """
+        super().__init__(player_id, name, is_blue, min_think_time)
+        self._time_limit_ms = time_limit_ms
+        self._owns_driver = driver is None
+        if driver is not None:
+            self._driver = driver
+            return
+        if strategy_class is None:
+            strategy_class = MCTSStrategy
+            strategy_kwargs.setdefault('playouts', None)
+            strategy_kwargs.setdefault('time_limit_ms', time_limit_ms)
+        self._driver = ParallelSearch(strategy_class, workers, seed=seed, **strategy_kwargs)
+
+    @property
+    def driver(self) -> ParallelSearch:
+        """Get the search driver."""
+        return self._driver
+
+    def select_move(self, game: IHexGame) -> Optional[HexCell]:
+        """
+        Select a move based on the current game state.
+        This implementation searches on all workers and plays the most visited move.
+
+        Args:
+            game: The current game state
+
+        Returns:
+            Optional[HexCell]: The selected cell to play, or None if no move is selected
+        """
+        if not self._is_my_turn(game):
+            return None
+
+        start = time.time()
+        index = self._driver.search(game.board, self._time_limit_ms).best_move()
+        if index is None:
+            return None
+
+        # Wait for what remains of the minimum think time
+        self._wait_min_think_time(start)
+        return HexCellTable.for_size(game.board.size).cells[index]
+
+    def handle_game_over(self, winner, reason: Any) -> None:
+        """
+        Handle the end of the game.
+        For parallel players, this stops any running search (the workers stay up for the next game).
+
+        Args:
+            winner: The player who won, or None if there was no winner
+            reason: The reason why the game ended
+        """
+        super().handle_game_over(winner, reason)
+        self._driver.cancel()
+
+    def close(self) -> None:
+        """Stop the worker processes (a driver given to the constructor is left running)."""
+        if self._owns_driver:
+            self._driver.close()
@@ -0,0 +1,162 @@
+from typing import Optional
+import numpy as np
+
+from ..core import HexWinDetector
+
+
+class RolloutResult:
+    """
+    Statistics of a batch of random completions of one position.
+
+    All per-cell arrays have the shape (size, size) of the board:
+    - ownership: fraction of the completions in which BLUE owns the cell (stones already
+      on the board count as 1 for BLUE and 0 for RED)
+    - owned: number of completions in which the player to move owns the cell
+    - owned_wins: number of those completions won by the player to move (AMAF wins)
+    """
+    __slots__ = ('count', 'to_move', 'wins', 'ownership', 'owned', 'owned_wins')
+
+    def __init__(self, count: int, to_move: int, wins: int, ownership: np.ndarray,
+                 owned: np.ndarray, owned_wins: np.ndarray):
+        """
+        Initialize the statistics.
+
+        Args:
+            count: Number of completions
+            to_move: The player to move in the position (BLUE=1, RED=2)
+            wins: Number of completions won by the player to move
+            ownership: BLUE ownership frequency of every cell
+            owned: Ownership counts of the player to move
+            owned_wins: Ownership counts of the player to move in the completions they won
+        """
+        self.count = count
+        self.to_move = to_move
+        self.wins = wins
+        self.ownership = ownership
+        self.owned = owned
+        self.owned_wins = owned_wins
+
+    @property
+    def win_rate(self) -> float:
+        """Get the fraction of completions won by the player to move."""
+        return self.wins / self.count if self.count else 0.5
+
+    def amaf_values(self) -> np.ndarray:
+        """
+        Get the AMAF value of every cell for the player to move: the win rate of the
+        completions in which they own it (NaN where they never own it).
+        """
+        values = np.full(self.owned.shape, np.nan)
+        np.divide(self.owned_wins, self.owned, out=values, where=self.owned > 0)
+        return values
+
+    def merge(self, other: 'RolloutResult') -> 'RolloutResult':
+        """
+        Combine the statistics of two batches of the same position.
+
+        Args:
+            other: The statistics of another batch
+
+        Returns:
+            RolloutResult: The statistics of both batches
+        """
+        count = self.count + other.count
+        ownership = (self.ownership * self.count + other.ownership * other.count) / max(count, 1)
+        return RolloutResult(count, self.to_move, self.wins + other.wins, ownership,
+                             self.owned + other.owned, self.owned_wins + other.owned_wins)
+
+
+class RolloutEngine:
+    """
+    Vectorized playout engine: simulates many random completions of a position at once.
+
+    A completion fills every empty cell, alternating colours from the player to move in a
+    random order. N completions are built as one (N, size, size) array from N permutations
+    of the empty cells, and scored with one batched connectivity pass
+    (HexWinDetector.detect_full_board_winners). Hex has no draws, so every completion has
+    exactly one winner, which is the winner of the random game continued past its end.
+
+    The completions are processed in batches of batch_size to bound memory.
+    """
+    BLUE = 1
+    RED = 2
+
+    def __init__(self, seed: Optional[int] = None, batch_size: int = 1024):
+        """
+        Initialize the engine.
+
+        Args:
+            seed: Seed of the random generator, for reproducible rollouts
+            batch_size: Maximum number of completions held in memory at once
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive.")
+        self._rng = np.random.default_rng(seed)
+        self._batch_size = batch_size
+
+    @classmethod
+    def player_to_move(cls, board_state: np.ndarray) -> int:
+        """Get the player to move in a board state (blue always starts)."""
+        return cls.BLUE if np.count_nonzero(board_state) % 2 == 0 else cls.RED
+
+    def completions(self, board_state: np.ndarray, count: int, to_move: Optional[int] = None) -> np.ndarray:
+        """
+        Build random completions of a position.
+
+        Args:
+            board_state: The (size, size) board state, e.g. from HexBoard.get_board_state()
+            count: Number of completions
+            to_move: The player to move (deduced from the stone counts when None)
+
+        Returns:
+            np.ndarray: uint8 array of shape (count, size, size) with no empty cell
+        """
+        board_state = np.asarray(board_state, dtype=np.uint8)
+        size = board_state.shape[0]
+        if to_move is None:
+            to_move = self.player_to_move(board_state)
+        flat = board_state.ravel()
+        empties = np.flatnonzero(flat == 0)
+        boards = np.repeat(flat[None, :], count, axis=0)
+        if empties.size:
+            # The cells taken in order by each completion; the player to move takes the even ranks
+            order = self._rng.permuted(np.broadcast_to(empties, (count, empties.size)), axis=1)
+            colours = np.full(empties.size, 3 - to_move, dtype=np.uint8)
+            colours[0::2] = to_move
+            boards[np.arange(count)[:, None], order] = colours
+        return boards.reshape(count, size, size)
+
+    def run(self, board_state: np.ndarray, count: int, to_move: Optional[int] = None) -> RolloutResult:
+        """
+        Simulate random completions of a position and gather their statistics.
+
+        Args:
+            board_state: The (size, size) board state, e.g. from HexBoard.get_board_state()
+            count: Number of completions
+            to_move: The player to move (deduced from the stone counts when None)
+
+        Returns:
+            RolloutResult: The win count, ownership and AMAF statistics
+        """
+        board_state = np.asarray(board_state, dtype=np.uint8)
+        if to_move is None:
+            to_move = self.player_to_move(board_state)
+        shape = board_state.shape
+        blue = np.zeros(shape, dtype=np.int64)
+        owned = np.zeros(shape, dtype=np.int64)
+        owned_wins = np.zeros(shape, dtype=np.int64)
+        wins = 0
+
+        done = 0
+        while done < count:
+            batch = min(self._batch_size, count - done)
+            boards = self.completions(board_state, batch, to_move)
+            won = HexWinDetector.detect_full_board_winners(boards) == to_move
+            mine = boards == to_move
+            wins += int(won.sum())
+            blue += (boards == self.BLUE).sum(axis=0)
+            owned += mine.sum(axis=0)
+            owned_wins += mine[won].sum(axis=0)
+            done += batch
+
+        return RolloutResult(count, to_move, wins, blue / max(count, 1), owned, owned_wins)
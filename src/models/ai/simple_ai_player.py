@@ -1,7 +1,8 @@
 from typing import Optional, List
+import numpy as np
 
 from .ai_player import AIPlayer
-from ..core import HexCell, IHexGame
+from ..core import HexCell, HexGeometry, IHexGame
 
 
 class SimpleAIPlayer(AIPlayer):
@@ -9,25 +10,20 @@ class SimpleAIPlayer(AIPlayer):
     A simple AI player that uses a basic strategy to make moves.
     This AI prefers moves that are closer to the center of the board.
     """
-    def _evaluate_move(self, cell: HexCell, game: IHexGame) -> float:
+    def _evaluate_moves(self, indices: np.ndarray, game: IHexGame) -> np.ndarray:
         """
-        Evaluate a move based on its position on the board.
+        Evaluate moves based on their position on the board, all at once.
         Moves closer to the center are preferred.
         
         Args:
-            cell: The cell to evaluate
+            indices: Flat indices (x * size + y) of the cells to evaluate
             game: The current game state
             
         Returns:
-            float: A score for the move, higher is better
+            np.ndarray: One score per move, higher is better
         """
-        # Calculate distance from center
-        center = game.board_size // 2
-        row_dist = abs(cell.row - center)
-        col_dist = abs(cell.col - center)
-        
-        # Prefer moves closer to center
-        return -(row_dist + col_dist)
+        # Prefer moves closer to center (distances shared per board size)
+        return -HexGeometry.for_size(game.board.size).centre_distance[indices]
         
     def select_move(self, game: IHexGame) -> Optional[HexCell]:
         """
@@ -40,7 +36,7 @@ class SimpleAIPlayer(AIPlayer):
         Returns:
             Optional[HexCell]: The selected cell to play, or None if no move is selected
         """
-        if not self._is_my_turn:
+        if not self._is_my_turn(game):
             return None
             
         # Update available moves
@@ -52,14 +48,6 @@ class SimpleAIPlayer(AIPlayer):
         # Wait for the minimum think time
         self._wait_min_think_time()
         
-        # Evaluate all moves and select the best one
-        best_move = None
-        best_score = float('-inf')
-        
-        for move in self._available_moves:
-            score = self._evaluate_move(move, game)
-            if score > best_score:
-                best_score = score
-                best_move = move
-                
-        return best_move 
\ No newline at end of file
+        # Evaluate all moves in one pass and select the best one (the first on ties)
+        scores = self._evaluate_moves(game.board.empty_indices(), game)
+        return self._available_moves[int(np.argmax(scores))] 
\ No newline at end of file
@@ -0,0 +1,165 @@
+from typing import Optional, Tuple
+import sqlite3
+import threading
+import numpy as np
+
+from ..core import HexSymmetry
+
+
+class SolvedPositionStore:
+    """
+    Disk-backed store of solved positions (SQLite).
+
+    Positions are keyed by their canonical hash (HexSymmetry.canonical_hash, side to move
+    included), so a result also serves the symmetric images of the position. Each row
+    holds the canonical board state, checked on lookup so that a hash collision cannot
+    return a wrong result, whether the player to move wins, and the winning move in
+    canonical coordinates (-1 when the player to move loses).
+
+    Writes are buffered in the current transaction until commit (or close). The store
+    can be used from any thread (AI players search in worker threads): the connection is
+    shared, and every access goes through a lock.
+    """
+    BLUE = 1
+    RED = 2
+
+    NO_MOVE = -1
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: Path of the SQLite file (':memory:' for a store that is not kept)
+        """
+        self._path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS "Solved" ('
+            '"size" INTEGER, "hash" INTEGER, "state" BLOB, "mover_wins" INTEGER, "move" INTEGER, '
+            'PRIMARY KEY ("size", "hash")) WITHOUT ROWID')
+        self._lookups = 0
+        self._hits = 0
+
+    @property
+    def path(self) -> str:
+        """Get the path of the SQLite file."""
+        return self._path
+
+    @property
+    def lookups(self) -> int:
+        """Get the number of lookups since the store was opened."""
+        return self._lookups
+
+    @property
+    def hits(self) -> int:
+        """Get the number of lookups that found the position."""
+        return self._hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of the lookups that found the position (0 without lookups)."""
+        return self._hits / self._lookups if self._lookups else 0.0
+
+    @staticmethod
+    def _signed(value: int) -> int:
+        """Map a 64-bit hash to the signed range of SQLite integers."""
+        return value - (1 << 64) if value >= 1 << 63 else value
+
+    @classmethod
+    def _canonical(cls, board_state: np.ndarray, to_move: Optional[int]) -> Tuple[HexSymmetry, int, int, bytes, int]:
+        """
+        Get the canonical key of a position.
+
+        Returns:
+            Tuple: The symmetry tables, the symmetry used, the signed canonical hash, the
+                   canonical state bytes and the player to move in the position
+        """
+        state = np.asarray(board_state, dtype=np.uint8)
+        symmetry = HexSymmetry.for_size(state.shape[0])
+        if to_move is None:
+            to_move = cls.BLUE if np.count_nonzero(state) % 2 == 0 else cls.RED
+        hashes = symmetry.symmetric_hashes(state, to_move)
+        used = int(np.argmin(hashes))
+        canonical = symmetry.transform_state(state, used)
+        return symmetry, used, cls._signed(int(hashes[used])), canonical.tobytes(), to_move
+
+    def lookup(self, board_state: np.ndarray, to_move: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Look a position up.
+
+        Args:
+            board_state: The (size, size) board state
+            to_move: The player to move (deduced from the stone counts when None)
+
+        Returns:
+            Optional[Tuple[int, int]]: The winner and the winning move of the player to move
+                                       (flat index, NO_MOVE when they lose), or None if the
+                                       position is not stored
+        """
+        symmetry, used, key, state, to_move = self._canonical(board_state, to_move)
+        with self._lock:
+            self._lookups += 1
+            row = self._connection.execute('SELECT "state", "mover_wins", "move" FROM "Solved" '
+                                           'WHERE "size" = ? AND "hash" = ?', (symmetry.size, key)).fetchone()
+            if row is None or row[0] != state:
+                return None
+            self._hits += 1
+        if not row[1]:
+            return 3 - to_move, self.NO_MOVE
+        # Every symmetry is its own inverse
+        return to_move, symmetry.transform_index(row[2], used)
+
+    def store(self, board_state: np.ndarray, winner: int, move: int = NO_MOVE,
+              to_move: Optional[int] = None) -> None:
+        """
+        Record the result of a position (replacing any previous one).
+
+        Args:
+            board_state: The (size, size) board state
+            winner: The player who wins the position with perfect play
+            move: A winning move of the player to move (flat index), NO_MOVE when they lose
+            to_move: The player to move (deduced from the stone counts when None)
+
+        Raises:
+            ValueError: If the player to move wins and no move is given
+        """
+        symmetry, used, key, state, to_move = self._canonical(board_state, to_move)
+        mover_wins = winner == to_move
+        if mover_wins and move == self.NO_MOVE:
+            raise ValueError("A won position needs its winning move.")
+        canonical_move = symmetry.transform_index(move, used) if mover_wins else self.NO_MOVE
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO "Solved" VALUES (?, ?, ?, ?, ?)',
+                                     (symmetry.size, key, state, int(mover_wins), canonical_move))
+
+    def commit(self) -> None:
+        """Write the pending results to the file."""
+        with self._lock:
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove every stored position."""
+        with self._lock:
+            self._connection.execute('DELETE FROM "Solved"')
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        """Get the number of stored positions."""
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM "Solved"').fetchone()[0]
+
+    def close(self) -> None:
+        """Commit the pending results and close the file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> 'SolvedPositionStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from ..core import IHexGame
+
+
+class TimeManager:
+    """
+    Budgets the think time of a move from the player's clock.
+
+    The remaining time (minus a safety margin) is shared between the moves the player may
+    still have to play, estimated from the number of empty cells, and a single move never
+    takes more than max_fraction of it. Untimed games get a fixed time per move.
+    """
+    def __init__(self, move_time: float = 1.0, safety_margin: float = 0.05, max_fraction: float = 0.25,
+                 min_moves_left: int = 4):
+        """
+        Initialize a time manager.
+
+        Args:
+            move_time: Think time in seconds of a move in an untimed game
+            safety_margin: Time in seconds always kept on the clock
+            max_fraction: Largest fraction of the remaining time spent on one move
+            min_moves_left: Fewest moves the remaining time is shared between
+
+        Raises:
+            ValueError: If a time or the number of moves is negative, or the fraction is not in (0, 1]
+        """
+        if move_time < 0 or safety_margin < 0 or min_moves_left < 1:
+            raise ValueError("Times must be positive and at least one move must be left.")
+        if not 0 < max_fraction <= 1:
+            raise ValueError("The fraction of the remaining time must be in (0, 1].")
+        self._move_time = move_time
+        self._safety_margin = safety_margin
+        self._max_fraction = max_fraction
+        self._min_moves_left = min_moves_left
+
+    @property
+    def move_time(self) -> float:
+        """Get the think time of a move in an untimed game."""
+        return self._move_time
+
+    def budget(self, remaining: Optional[float], empties: int, minimum: float = 0.0) -> float:
+        """
+        Compute the think time of a move.
+
+        Args:
+            remaining: Time left on the player's clock in seconds (None for an untimed game)
+            empties: Number of empty cells on the board
+            minimum: Think time to use at least, as long as the clock allows it
+
+        Returns:
+            float: The think time in seconds
+        """
+        if remaining is None:
+            return max(self._move_time, minimum)
+        usable = max(0.0, remaining - self._safety_margin)
+        # The player plays every other move of the empty cells left
+        moves_left = max(self._min_moves_left, (empties + 1) // 2)
+        think = min(usable / moves_left, usable * self._max_fraction)
+        return min(max(think, minimum), usable)
+
+    def think_time(self, game: IHexGame, player: int, minimum: float = 0.0) -> float:
+        """
+        Compute the think time of a player's move in a game.
+
+        Args:
+            game: The current game state (TimedHexGame clocks are used, other games are untimed)
+            player: The player to move (BLUE=1, RED=2)
+            minimum: Think time to use at least, as long as the clock allows it
+
+        Returns:
+            float: The think time in seconds
+        """
+        return self.budget(game.get_remaining_time(player), len(game.board.empty_indices()), minimum)
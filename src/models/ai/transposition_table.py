@@ -0,0 +1,165 @@
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import multiprocessing
+import os
+import numpy as np
+
+
+class SharedTranspositionTable:
+    """
+    Fixed-size transposition table in shared memory, usable by several processes at once.
+
+    Positions are keyed by a 64-bit hash (see position_key) and each entry stores the
+    visits, the value, the best move (flat index, -1 for none) and the search depth of the position.
+
+    The table is an array of two-entry buckets, the bucket being chosen by the key:
+    - the first entry is depth-preferred: it is only replaced by a deeper (or, at equal depth,
+      more visited) search, and then moves down to the second entry
+    - the second entry is always replaced
+    Memory never grows: old entries are overwritten.
+
+    Writers and readers of a bucket hold one of `stripes` locks (bucket % stripes), so
+    processes working on different buckets rarely wait for each other.
+
+    The table is created by one process and shared with the processes it starts: passing
+    it to a multiprocessing.Process, or in the initargs of a ProcessPoolExecutor, attaches
+    the shared memory by name in the child (the locks can only be inherited this way).
+    """
+    ENTRY_DTYPE = np.dtype([('key', np.uint64), ('value', np.float64), ('visits', np.uint32),
+                            ('best_move', np.int32), ('depth', np.int16), ('used', np.uint8)], align=True)
+    WAYS = 2
+
+    # Multiplier mixing the board size into the position key
+    _SIZE_MIX = 0x9E3779B97F4A7C15
+    _MASK = (1 << 64) - 1
+
+    def __init__(self, buckets: int = 1 << 16, stripes: int = 64):
+        """
+        Create the table in a new shared memory block.
+
+        Args:
+            buckets: Number of two-entry buckets
+            stripes: Number of locks sharing the buckets
+
+        Raises:
+            ValueError: If buckets or stripes is not positive
+        """
+        if buckets < 1 or stripes < 1:
+            raise ValueError("The table needs at least one bucket and one lock.")
+        self._memory = shared_memory.SharedMemory(create=True, size=buckets * self.WAYS * self.ENTRY_DTYPE.itemsize)
+        self._owner = os.getpid()
+        self._buckets = buckets
+        self._locks: List = [multiprocessing.Lock() for _ in range(min(stripes, buckets))]
+        self._attach()
+        self._entries[:] = np.zeros(1, dtype=self.ENTRY_DTYPE)
+
+    def _attach(self) -> None:
+        """Map the entries over the shared memory block."""
+        self._entries = np.ndarray((self._buckets, self.WAYS), dtype=self.ENTRY_DTYPE, buffer=self._memory.buf)
+
+    def __getstate__(self) -> tuple:
+        """Pickle the table as the name of its memory block and its locks (for child processes)."""
+        return self._memory.name, self._buckets, self._locks
+
+    def __setstate__(self, state: tuple) -> None:
+        """Attach to the memory block of the table in a child process."""
+        name, self._buckets, self._locks = state
+        self._memory = shared_memory.SharedMemory(name=name)
+        self._owner = None
+        self._attach()
+
+    @classmethod
+    def position_key(cls, position_hash: int, size: int) -> int:
+        """
+        Get the table key of a position, so that boards of different sizes never share keys
+        (e.g. every empty board has the position hash 0).
+
+        Args:
+            position_hash: The Zobrist hash of the position (HexZobrist)
+            size: The size of the board
+
+        Returns:
+            int: The 64-bit key
+        """
+        return (position_hash ^ (size * cls._SIZE_MIX)) & cls._MASK
+
+    @property
+    def name(self) -> str:
+        """Get the name of the shared memory block."""
+        return self._memory.name
+
+    @property
+    def buckets(self) -> int:
+        """Get the number of buckets."""
+        return self._buckets
+
+    @property
+    def nbytes(self) -> int:
+        """Get the size of the entries in bytes."""
+        return self._entries.nbytes
+
+    def lookup(self, key: int) -> Optional[Tuple[int, float, int, int]]:
+        """
+        Read the entry of a position.
+
+        Args:
+            key: The key of the position
+
+        Returns:
+            Optional[Tuple[int, float, int, int]]: (visits, value, best_move, depth), or None if absent
+        """
+        bucket = key % self._buckets
+        with self._locks[bucket % len(self._locks)]:
+            for entry in self._entries[bucket]:
+                if entry['used'] and int(entry['key']) == key:
+                    return int(entry['visits']), float(entry['value']), int(entry['best_move']), int(entry['depth'])
+        return None
+
+    def store(self, key: int, visits: int, value: float, best_move: int = -1, depth: int = 0) -> None:
+        """
+        Write the entry of a position, replacing its previous entry or an entry of its bucket.
+
+        Args:
+            key: The key of the position
+            visits: Number of visits (or nodes) behind the value
+            value: Value of the position for the player to move
+            best_move: Flat index of the best move (-1 for none)
+            depth: Depth of the search behind the value
+        """
+        bucket = key % self._buckets
+        record = (key, value, min(visits, 0xFFFFFFFF), best_move, depth, 1)
+        with self._locks[bucket % len(self._locks)]:
+            entries = self._entries[bucket]
+            first = entries[0]
+            if first['used'] and int(first['key']) == key:
+                entries[0] = record
+            elif not first['used'] or (depth, visits) >= (int(first['depth']), int(first['visits'])):
+                # The depth-preferred entry moves down (dropping any older entry of this position)
+                entries[1] = first
+                entries[0] = record
+            else:
+                entries[1] = record
+
+    def clear(self) -> None:
+        """Remove every entry (not atomic: no search should use the table meanwhile)."""
+        self._entries['used'] = 0
+
+    def __len__(self) -> int:
+        """Get the number of entries in use."""
+        return int(np.count_nonzero(self._entries['used']))
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory. The process that created the table also frees it,
+        so it must close last.
+        """
+        self._entries = None
+        self._memory.close()
+        if self._owner == os.getpid():
+            self._memory.unlink()
+
+    def __enter__(self) -> 'SharedTranspositionTable':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -6,24 +6,39 @@ This module contains the fundamental elements of the game such as cells, board,
 from .interfaces import IHexMove, IHexBoard, IHexGame, GameEndReason, HexState, IHexState
 
 from .hex_cell import HexCell
+from .hex_geometry import HexGeometry
+from .hex_cell_table import HexCellTable
 from .hex_move import HexMove
 from .hex_win_detector import HexWinDetector
+from .hex_union_find import HexUnionFind
+from .hex_zobrist import HexZobrist
+from .hex_symmetry import HexSymmetry
 from .hex_board import HexBoard, MemoryHexBoard
+from .bit_hex_board import BitHexBoard, BitBoardMasks
 from .hex_state import NotStartedState, ActiveState, PausedState, FinishedState, CorruptedState
 from .hex_game import HexGame, TimedHexGame
 from .hex_game_factory import HexGameFactory
+from .sim_hex_game import SimHexGame
 
 from .exceptions import HexGameError, InvalidMoveError, GameOverError, NotPlayerTurnError, InvalidPlayerError, TimeoutError, BoardFullError, InvalidCellError, CellAlreadyOccupiedError, InvalidStateTransition
 
 __all__ = [
     # Core classes
     'HexCell',
+    'HexGeometry',
+    'HexCellTable',
     'HexMove',
     'HexWinDetector',
+    'HexUnionFind',
+    'HexZobrist',
+    'HexSymmetry',
     'HexBoard',
     'MemoryHexBoard',
+    'BitHexBoard',
+    'BitBoardMasks',
     'HexGame',
     'TimedHexGame',
+    'SimHexGame',
     
     # State classes
     'HexState',
@@ -0,0 +1,403 @@
+from typing import Dict, List, Optional, Set
+import numpy as np
+
+from .hex_cell import HexCell
+from .interfaces import IHexMove, IHexBoard
+from .hex_board import HexBoard, MemoryHexBoard
+from .exceptions import InvalidCellError, BoardFullError, CellAlreadyOccupiedError
+
+
+class BitBoardMasks:
+    """
+    Precomputed bit masks for a given board size.
+    Bit i of a mask stands for the cell (x, y) with i = x * size + y.
+
+    Instances are shared per size through `for_size`, so the masks are only
+    computed once per process.
+    """
+    _cache: Dict[int, 'BitBoardMasks'] = {}
+
+    __slots__ = ('size', 'full', 'not_first_column', 'not_last_column',
+                 'blue_start', 'blue_end', 'red_start', 'red_end')
+
+    def __init__(self, size: int):
+        """
+        Compute the masks for a board size.
+
+        Args:
+            size: The size of the board (n x n)
+        """
+        cells = size * size
+        row = (1 << size) - 1
+        first_column = sum(1 << (x * size) for x in range(size))
+
+        self.size = size
+        self.full = (1 << cells) - 1
+        self.not_first_column = self.full & ~first_column
+        self.not_last_column = self.full & ~(first_column << (size - 1))
+        self.blue_start = row
+        self.blue_end = row << (size * (size - 1))
+        self.red_start = first_column
+        self.red_end = first_column << (size - 1)
+
+    @classmethod
+    def for_size(cls, size: int) -> 'BitBoardMasks':
+        """Get the shared masks for a board size."""
+        masks = cls._cache.get(size)
+        if masks is None:
+            masks = cls._cache[size] = cls(size)
+        return masks
+
+    def dilate(self, bits: int) -> int:
+        """
+        Grow a set of cells by one step in the six hexagonal directions.
+
+        Args:
+            bits: The cells to grow
+
+        Returns:
+            int: The cells and all their neighbours
+        """
+        size = self.size
+        return (bits
+                | (bits << size) | (bits >> size)
+                | ((bits << 1) & self.not_first_column) | ((bits >> 1) & self.not_last_column)
+                | ((bits << (size + 1)) & self.not_first_column)
+                | ((bits >> (size + 1)) & self.not_last_column)) & self.full
+
+    def neighbours(self, index: int) -> int:
+        """
+        Get the neighbour mask of a cell.
+        Computed on demand: a per-cell table would hold size * size ints of size * size bits.
+
+        Args:
+            index: Flat index of the cell
+
+        Returns:
+            int: The mask of the (up to six) neighbouring cells
+        """
+        bit = 1 << index
+        return self.dilate(bit) & ~bit
+
+    def flood(self, seed: int, stones: int) -> int:
+        """
+        Get the cells of `stones` connected to `seed` by repeated mask dilation.
+
+        Args:
+            seed: The starting cells (must be a subset of stones)
+            stones: The cells the fill may spread through
+
+        Returns:
+            int: The connected cells
+        """
+        reached = seed
+        while True:
+            grown = self.dilate(reached) & stones
+            if grown == reached:
+                return reached
+            reached = grown
+
+    def winner(self, blue: int, red: int) -> Optional[int]:
+        """
+        Detect the winner of a position given as two bitsets.
+
+        Args:
+            blue: The blue stones
+            red: The red stones
+
+        Returns:
+            Optional[int]: The winning player (BLUE=1, RED=2) or None if no winner
+        """
+        if self.flood(blue & self.blue_start, blue) & self.blue_end:
+            return BitHexBoard.BLUE
+        if self.flood(red & self.red_start, red) & self.red_end:
+            return BitHexBoard.RED
+        return None
+
+
+class BitHexBoard(IHexBoard):
+    """
+    Represents the Hex game board with one arbitrary-precision int bitset per player.
+    Board operations are bitwise, and win detection is a flood fill by mask dilation
+    starting from the last placed stone.
+    """
+    EMPTY = 0
+    BLUE = 1
+    RED = 2
+
+    def __init__(self, size: int):
+        """
+        Initialize a new Hex board.
+
+        Args:
+            size: The size of the board (n x n)
+
+        Raises:
+            ValueError: If size is not between 3 and 255
+        """
+        if not (3 <= size <= 255):
+            raise ValueError("Board size must be between 3 and 255")
+        self._size = int(size)
+        self._masks = BitBoardMasks.for_size(self._size)
+        self._memory_board = MemoryHexBoard(self._size)
+        self._blue = 0
+        self._red = 0
+        self._winner: Optional[int] = None
+        self._winner_at = 0
+
+    def add_move(self, move: IHexMove) -> bool:
+        """
+        Add a move to the board.
+
+        Args:
+            move: The move to add
+
+        Returns:
+            bool: True if the move was successfully added
+
+        Raises:
+            BoardFullError: If the board is full
+            InvalidCellError: If the cell is out of the board boundaries
+            CellAlreadyOccupiedError: If the cell is already occupied
+        """
+        if self.is_full():
+            raise BoardFullError("Cannot make move: board is full")
+
+        cell = move.cell
+        if not (0 <= cell.x < self._size and 0 <= cell.y < self._size):
+            raise InvalidCellError(f"Cell coordinates out of bounds: {cell}")
+
+        bit = 1 << (cell.x * self._size + cell.y)
+        if (self._blue | self._red) & bit:
+            raise CellAlreadyOccupiedError(f"Cell already occupied: {cell}")
+
+        # Synchronize with _memory_board
+        self._memory_board._append_move(move)
+
+        if self._memory_board.get_total_moves() % 2 == 1:
+            self._blue |= bit
+            if self._winner is None:
+                group = self._masks.flood(bit, self._blue)
+                if group & self._masks.blue_start and group & self._masks.blue_end:
+                    self._winner = self.BLUE
+                    self._winner_at = self.get_total_moves()
+        else:
+            self._red |= bit
+            if self._winner is None:
+                group = self._masks.flood(bit, self._red)
+                if group & self._masks.red_start and group & self._masks.red_end:
+                    self._winner = self.RED
+                    self._winner_at = self.get_total_moves()
+
+        return True
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def position_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the current position."""
+        return self._memory_board.position_hash
+
+    @property
+    def blue_bits(self) -> int:
+        """Get the bitset of blue stones."""
+        return self._blue
+
+    @property
+    def red_bits(self) -> int:
+        """Get the bitset of red stones."""
+        return self._red
+
+    def _bits_to_array(self, bits: int) -> np.ndarray:
+        """Unpack a bitset into a flat uint8 array of 0/1 values."""
+        cells = self._size * self._size
+        raw = np.frombuffer(bits.to_bytes((cells + 7) // 8, 'little'), dtype=np.uint8)
+        return np.unpackbits(raw, bitorder='little')[:cells]
+
+    def get_board_state(self) -> np.ndarray:
+        """Get the current board state as a numpy array."""
+        board_state = self._bits_to_array(self._blue) + self._bits_to_array(self._red) * np.uint8(self.RED)
+        return board_state.reshape(self._size, self._size)
+
+    def board_view(self) -> np.ndarray:
+        """Get a read-only view of the current board state, shared with the synchronized memory board (no copy)."""
+        return self._memory_board.board_view()
+
+    def legal_mask(self) -> np.ndarray:
+        """Get a boolean (size, size) mask of the empty cells."""
+        return self._memory_board.legal_mask()
+
+    def empty_indices(self) -> np.ndarray:
+        """Get the flat indices (x * size + y) of the empty cells, in increasing order."""
+        return self._memory_board.empty_indices()
+
+    def stones(self, player: int) -> np.ndarray:
+        """Get a boolean (size, size) mask of the stones of a player."""
+        return self._memory_board.stones(player)
+
+    def move_indices(self) -> np.ndarray:
+        """Get the flat indices of the played cells, in move order."""
+        return self._memory_board.move_indices()
+
+    def is_valid_move(self, cell: HexCell) -> bool:
+        """
+        Check if a move is valid.
+
+        Args:
+            cell: The cell to check
+
+        Returns:
+            bool: True if the move is valid
+
+        Raises:
+            InvalidCellError: If the cell coordinates are out of bounds
+            CellAlreadyOccupiedError: If the cell is already occupied
+        """
+        if not (0 <= cell.x < self._size and 0 <= cell.y < self._size):
+            raise InvalidCellError(f"Cell coordinates out of bounds: {cell}")
+
+        if ((self._blue | self._red) >> (cell.x * self._size + cell.y)) & 1:
+            raise CellAlreadyOccupiedError(f"Cell already occupied: {cell}")
+
+        return True
+
+    def get_last_move(self) -> Optional[IHexMove]:
+        """Get the last move made on the board."""
+        return self._memory_board.get_last_move()
+
+    def get_occupied_cells(self) -> Set[HexCell]:
+        """Get the set of occupied cells."""
+        return self._memory_board.get_occupied_cells()
+
+    def is_full(self) -> bool:
+        """Check if the board is full."""
+        return (self._blue | self._red) == self._masks.full
+
+    def get_player_at(self, cell: HexCell) -> Optional[int]:
+        """
+        Get the player at a specific cell.
+
+        Args:
+            cell: The cell to check
+
+        Returns:
+            Optional[int]: The player at the cell (BLUE=1, RED=2) or None if empty
+
+        Raises:
+            InvalidCellError: If the cell coordinates are out of bounds
+        """
+        if not (0 <= cell.x < self._size and 0 <= cell.y < self._size):
+            raise InvalidCellError(f"Cell coordinates out of bounds: {cell}")
+
+        index = cell.x * self._size + cell.y
+        if (self._blue >> index) & 1:
+            return self.BLUE
+        if (self._red >> index) & 1:
+            return self.RED
+        return None
+
+    def to_memory_hex_board(self) -> MemoryHexBoard:
+        """Convert to MemoryHexBoard (the move storage is shared copy-on-write)."""
+        return self._memory_board.fork()
+
+    def fork(self) -> 'BitHexBoard':
+        """
+        Get an independent copy of the board in O(1).
+        The bitsets are immutable ints and the move storage is shared copy-on-write.
+
+        Returns:
+            BitHexBoard: The new board
+        """
+        board = BitHexBoard.__new__(BitHexBoard)
+        board._size = self._size
+        board._masks = self._masks
+        board._memory_board = self._memory_board.fork()
+        board._blue = self._blue
+        board._red = self._red
+        board._winner = self._winner
+        board._winner_at = self._winner_at
+        return board
+
+    def to_hex_board(self) -> HexBoard:
+        """Convert to HexBoard."""
+        return self.to_memory_hex_board().to_hex_board()
+
+    def __getstate__(self) -> tuple:
+        """Pickle as the move storage, the two bitsets and the winner; the masks are shared per size."""
+        return self._memory_board, self._blue, self._red, self._winner, self._winner_at
+
+    def __setstate__(self, state: tuple) -> None:
+        """Rebuild the board from its pickled state."""
+        self._memory_board, self._blue, self._red, self._winner, self._winner_at = state
+        self._size = self._memory_board.size
+        self._masks = BitBoardMasks.for_size(self._size)
+
+    @classmethod
+    def from_board(cls, board: IHexBoard) -> 'BitHexBoard':
+        """
+        Build a BitHexBoard holding the same moves as another board.
+
+        Args:
+            board: The board to copy
+
+        Returns:
+            BitHexBoard: The new board
+        """
+        bit_board = cls(board.size)
+        for move in board.get_moves():
+            bit_board.add_move(move)
+        return bit_board
+
+    def get_board_state_at_move(self, move_index: int) -> np.ndarray:
+        """
+        Get the board state at a specific move index.
+
+        Args:
+            move_index: The index of the move
+
+        Returns:
+            np.ndarray: The board state at the specified move index
+        """
+        return self._memory_board.get_board_state_at_move(move_index)
+
+    def get_history_tensor(self) -> np.ndarray:
+        """Get every position of the game in one (total moves + 1, size, size) array."""
+        return self._memory_board.get_history_tensor()
+
+    def get_total_moves(self) -> int:
+        """Get the total number of moves made."""
+        return self._memory_board.get_total_moves()
+
+    def get_winner(self) -> Optional[int]:
+        """
+        Check for a winner on the board.
+        The winner is updated in add_move by flooding the group of the placed stone.
+
+        Returns:
+            Optional[int]: The value of the winning player (1 for BLUE, 2 for RED), or None if there is no winner.
+        """
+        return self._winner
+
+    def get_moves(self) -> List[IHexMove]:
+        """Get the list of all moves made on the board."""
+        return self._memory_board.get_moves()
+
+    def undo_move(self) -> IHexMove:
+        """
+        Take back the last move made on the board.
+
+        Returns:
+            IHexMove: The removed move
+
+        Raises:
+            InvalidMoveError: If no move has been made
+        """
+        move = self._memory_board.undo_move()
+        bit = 1 << (move.cell.x * self._size + move.cell.y)
+        self._blue &= ~bit
+        self._red &= ~bit
+        if self._winner is not None and self.get_total_moves() < self._winner_at:
+            self._winner = None
+        return move
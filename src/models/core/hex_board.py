@@ -1,21 +1,36 @@
-from typing import List, Optional, Set
+from array import array
+from typing import Iterable, List, Optional, Set
 import numpy as np
 
 from .hex_cell import HexCell
+from .hex_cell_table import HexCellTable
+from .hex_move import HexMove
 from .interfaces import IHexMove, IHexBoard
 from .hex_win_detector import HexWinDetector
-from .exceptions import InvalidCellError, BoardFullError, CellAlreadyOccupiedError
+from .hex_union_find import HexUnionFind
+from .hex_zobrist import HexZobrist
+from .exceptions import InvalidCellError, BoardFullError, CellAlreadyOccupiedError, InvalidMoveError
+
+# Stored in place of a missing move timestamp
+_NO_TIMESTAMP = float('nan')
 
 
 class MemoryHexBoard(IHexBoard):
     """
     Represents the Hex game board optimized for memory storage.
     Manages the state of the board and validates moves.
+
+    Moves are kept as flat cell indices (x * size + y) in an array('H') and their
+    timestamps in an array('d'), plus one occupancy byte per cell. HexMove objects
+    are only materialised when get_moves() or get_last_move() is called.
     """
     EMPTY = 0
     BLUE = 1
     RED = 2
 
+    # Winner cache shared by all memory boards, keyed by position hash (thread safe)
+    _win_detector = HexWinDetector()
+
     def __init__(self, size: int):
         """
         Initialize a new Hex board.
@@ -29,7 +44,18 @@ class MemoryHexBoard(IHexBoard):
         if not (3 <= size <= 255):
             raise ValueError("Board size must be between 3 and 255")
         self._size = np.uint8(size)
-        self._moves: List[IHexMove] = []
+        self._cells = array('H')
+        # NaN stands for a move without timestamp
+        self._timestamps = array('d')
+        # Player on each cell (EMPTY, BLUE or RED), indexed like _cells
+        self._occupancy = bytearray(int(size) * int(size))
+        self._zobrist = HexZobrist.for_size(int(size))
+        self._table = HexCellTable.for_size(int(size))
+        self._position_hash = 0
+        # Move number (1-based) of the stone on each cell, built on first use
+        self._move_grid: Optional[np.ndarray] = None
+        # True while the storage may be shared with a fork
+        self._shared = False
 
     def add_move(self, move: IHexMove) -> bool:
         """
@@ -52,21 +78,161 @@ class MemoryHexBoard(IHexBoard):
         if not self.is_valid_move(move.cell):
             raise CellAlreadyOccupiedError(f"Cell already occupied: {move.cell}")
 
-        self._moves.append(move)
+        self._append_move(move)
         return True
-    
+
+    def _append_move(self, move: IHexMove) -> None:
+        """Append an already validated move and update the derived state."""
+        timestamp = move.timestamp
+        self._append_index(move.cell.x * self.size + move.cell.y,
+                           timestamp if timestamp is not None else _NO_TIMESTAMP)
+
+    def _append_index(self, index: int, timestamp: float) -> None:
+        """Append an already validated move given as a flat index and update the derived state."""
+        if self._shared:
+            self._ensure_private()
+        self._cells.append(index)
+        self._timestamps.append(timestamp)
+        number = len(self._cells)
+        player = self.BLUE if number % 2 == 1 else self.RED
+        self._occupancy[index] = player
+        self._position_hash ^= self._zobrist.keys[player][index]
+        if self._move_grid is not None:
+            self._move_grid.flat[index] = number
+
+    def _load_moves(self, moves: List[IHexMove]) -> None:
+        """Replace the move list (already validated) and rebuild the derived state."""
+        size = self.size
+        self._load_storage(
+            [move.cell.x * size + move.cell.y for move in moves],
+            [move.timestamp if move.timestamp is not None else _NO_TIMESTAMP for move in moves])
+
+    def _load_storage(self, cells: Iterable[int], timestamps: Iterable[float]) -> None:
+        """
+        Replace the stored moves (already validated) and rebuild the derived state in one vectorized pass.
+
+        Args:
+            cells: Flat cell indices in move order
+            timestamps: Timestamps of the moves (NaN for none)
+        """
+        self._cells = array('H', cells)
+        self._timestamps = array('d', timestamps)
+        indices = np.array(self._cells, dtype=np.intp)
+        players = np.full(len(indices), self.RED, dtype=np.uint8)
+        players[0::2] = self.BLUE
+        occupancy = np.zeros(self.size * self.size, dtype=np.uint8)
+        occupancy[indices] = players
+        self._occupancy = bytearray(occupancy.tobytes())
+        keys = self._zobrist.table[players, indices]
+        self._position_hash = int(np.bitwise_xor.reduce(keys)) if keys.size else 0
+        self._move_grid = None
+        self._shared = False
+
+    def fork(self) -> 'MemoryHexBoard':
+        """
+        Get an independent copy of the board in O(1).
+        Both boards share their storage until one of them writes, which then copies it first (copy-on-write).
+
+        Returns:
+            MemoryHexBoard: The new board
+        """
+        board = MemoryHexBoard.__new__(MemoryHexBoard)
+        board._size = self._size
+        board._cells = self._cells
+        board._timestamps = self._timestamps
+        board._occupancy = self._occupancy
+        board._zobrist = self._zobrist
+        board._table = self._table
+        board._position_hash = self._position_hash
+        board._move_grid = self._move_grid
+        board._shared = self._shared = True
+        return board
+
+    def _ensure_private(self) -> None:
+        """Copy the storage shared with a fork so that it can be written."""
+        self._cells = self._cells[:]
+        self._timestamps = self._timestamps[:]
+        self._occupancy = bytearray(self._occupancy)
+        if self._move_grid is not None:
+            self._move_grid = self._move_grid.copy()
+        self._shared = False
+
+    def __getstate__(self) -> tuple:
+        """
+        Pickle as the size, the packed move indices and the timestamps (None when no move has one).
+        Occupancy and hash are rebuilt in one vectorized pass on load, the move grid on first use.
+        """
+        timestamps = self._timestamps
+        if np.isnan(np.array(timestamps, dtype=np.float64)).all():
+            timestamps = None
+        else:
+            timestamps = timestamps.tobytes()
+        return self.size, self._cells.tobytes(), timestamps
+
+    def __setstate__(self, state: tuple) -> None:
+        """Rebuild the board from its pickled state."""
+        size, cells, timestamps = state
+        self._size = np.uint8(size)
+        self._zobrist = HexZobrist.for_size(size)
+        self._table = HexCellTable.for_size(size)
+        moves = array('H')
+        moves.frombytes(cells)
+        times = array('d')
+        if timestamps is None:
+            times.extend([_NO_TIMESTAMP] * len(moves))
+        else:
+            times.frombytes(timestamps)
+        self._load_storage(moves, times)
+
+    def _grid(self) -> np.ndarray:
+        """Get the move-number grid, building it from the stored moves on first use."""
+        if self._move_grid is None:
+            grid = np.zeros(self.size * self.size, dtype=np.uint16)
+            grid[np.array(self._cells, dtype=np.intp)] = np.arange(1, len(self._cells) + 1, dtype=np.uint16)
+            self._move_grid = grid.reshape(self.size, self.size)
+        return self._move_grid
+
+    def _restore_move(self, position: int) -> IHexMove:
+        """Materialise the move stored at a position of the move list."""
+        index = self._cells[position]
+        timestamp = self._timestamps[position]
+        return HexMove._restore(self._table.cells[index],
+                                timestamp if timestamp == timestamp else None)
+
     @property
     def size(self) -> int:
         return int(self._size)
 
+    @property
+    def position_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the current position."""
+        return self._position_hash
+
     def get_board_state(self) -> np.ndarray:
         """Get the current board state as a numpy array."""
-        board_state = np.zeros((self._size, self._size), dtype=np.uint8)
-        for index, move in enumerate(self._moves):
-            if move.cell:
-                value = self.BLUE if index % 2 == 0 else self.RED
-                board_state[move.cell.x, move.cell.y] = value
-        return board_state
+        return self.board_view().copy()
+
+    def board_view(self) -> np.ndarray:
+        """Get a read-only view of the current board state, backed by the occupancy map (no copy)."""
+        view = np.frombuffer(self._occupancy, dtype=np.uint8).reshape(self.size, self.size)
+        view.flags.writeable = False
+        return view
+
+    def legal_mask(self) -> np.ndarray:
+        """Get a boolean (size, size) mask of the empty cells."""
+        return self.board_view() == self.EMPTY
+
+    def empty_indices(self) -> np.ndarray:
+        """Get the flat indices (x * size + y) of the empty cells, in increasing order."""
+        return np.flatnonzero(np.frombuffer(self._occupancy, dtype=np.uint8) == self.EMPTY)
+
+    def stones(self, player: int) -> np.ndarray:
+        """Get a boolean (size, size) mask of the stones of a player."""
+        return self.board_view() == player
+
+    def move_indices(self) -> np.ndarray:
+        """Get the flat indices of the played cells, in move order."""
+        return np.array(self._cells, dtype=np.uint16)
 
     def is_valid_move(self, cell: HexCell) -> bool:
         """
@@ -84,19 +250,20 @@ class MemoryHexBoard(IHexBoard):
         if not (0 <= cell.x < self._size and 0 <= cell.y < self._size):
             raise InvalidCellError(f"Cell coordinates out of bounds: {cell}")
 
-        return all(move.cell != cell for move in self._moves)
+        return self._occupancy[cell.x * self.size + cell.y] == self.EMPTY
 
     def get_last_move(self) -> Optional[IHexMove]:
         """Get the last move made on the board."""
-        return self._moves[-1] if self._moves else None
+        return self._restore_move(-1) if self._cells else None
 
     def get_occupied_cells(self) -> Set[HexCell]:
         """Get the set of occupied cells."""
-        return {move.cell for move in self._moves if move.cell}
+        cells = self._table.cells
+        return {cells[index] for index in self._cells}
 
     def is_full(self) -> bool:
         """Check if the board is full."""
-        return len(self._moves) == self._size * self._size
+        return len(self._cells) == self.size * self.size
 
     def get_player_at(self, cell: HexCell) -> Optional[int]:
         """
@@ -114,27 +281,26 @@ class MemoryHexBoard(IHexBoard):
         if not (0 <= cell.x < self._size and 0 <= cell.y < self._size):
             raise InvalidCellError(f"Cell coordinates out of bounds: {cell}")
 
-        for index, move in enumerate(self._moves):
-            if move.cell == cell:
-                return self.BLUE if index % 2 == 0 else self.RED
-        return None
+        value = self._occupancy[cell.x * self.size + cell.y]
+        return value if value != self.EMPTY else None
 
     def to_memory_hex_board(self) -> 'MemoryHexBoard':
         """Convert to MemoryHexBoard (no-op for this class)."""
         return self
 
     def to_hex_board(self) -> 'HexBoard':
-        """Convert to HexBoard."""
-        hex_board = HexBoard(self._size)
-        hex_board._memory_board = self
-        hex_board._board_state = self.get_board_state()
-        hex_board._occupied_cells = self.get_occupied_cells()
-        hex_board._is_full = self.is_full()
+        """
+        Convert to HexBoard (the move storage is shared copy-on-write).
+        The occupied set and connectivity structure are rebuilt on first use.
+        """
+        hex_board = HexBoard.__new__(HexBoard)
+        hex_board.__setstate__((self.fork(),))
         return hex_board
     
     def get_board_state_at_move(self, move_index: int) -> np.ndarray:
         """
         Get the board state at a specific move index.
+        Computed with one vectorized comparison against the move-number grid.
 
         Args:
             move_index: The index of the move
@@ -142,34 +308,75 @@ class MemoryHexBoard(IHexBoard):
         Returns:
             np.ndarray: The board state at the specified move index
         """
-        if not (0 <= move_index <= len(self._moves)):
+        if not (0 <= move_index <= len(self._cells)):
             raise ValueError("Move index out of range")
+        if move_index == len(self._cells):
+            return self.get_board_state()
+
+        grid = self._grid()
+        played = (grid > 0) & (grid <= move_index)
+        # Odd move numbers are blue, even ones are red
+        return np.where(played, self.RED - (grid & 1), self.EMPTY).astype(np.uint8)
 
-        board_state = np.zeros((self._size, self._size), dtype=np.uint8)
-        for i in range(move_index):
-            move = self._moves[i]
-            if move.cell:
-                value = self.BLUE if i % 2 == 0 else self.RED
-                board_state[move.cell.x, move.cell.y] = value
-        return board_state
+    def get_history_tensor(self) -> np.ndarray:
+        """
+        Get every position of the game in one array.
+
+        Returns:
+            np.ndarray: uint8 array of shape (total moves + 1, size, size); entry k is the
+                        board state after k moves
+        """
+        grid = self._grid()
+        colours = np.where(grid > 0, self.RED - (grid & 1), self.EMPTY).astype(np.uint8)
+        move_indices = np.arange(len(self._cells) + 1, dtype=np.uint16)[:, np.newaxis, np.newaxis]
+        return np.where((grid > 0) & (grid <= move_indices), colours, np.uint8(self.EMPTY))
 
     def get_total_moves(self) -> int:
         """Get the total number of moves made."""
-        return len(self._moves)
+        return len(self._cells)
     
     def get_winner(self) -> Optional[int]:
         """
-        Check for a winner on the board using the static detector.
+        Check for a winner on the board using the shared detector cache.
 
         Returns:
             Optional[int]: The value of the winning player (1 for BLUE, 2 for RED), or None if there is no winner.
         """
         board_state = self.get_board_state()
-        return HexWinDetector.static_detect_winner(board_state)
+        return self._win_detector.detect_winner(board_state, self._position_hash)
     
     def get_moves(self) -> List[IHexMove]:
-        """Get the list of all moves made on the board."""
-        return self._moves.copy()
+        """Get the list of all moves made on the board (materialised on each call)."""
+        return [self._restore_move(position) for position in range(len(self._cells))]
+
+    def undo_move(self) -> IHexMove:
+        """
+        Take back the last move made on the board.
+
+        Returns:
+            IHexMove: The removed move
+
+        Raises:
+            InvalidMoveError: If no move has been made
+        """
+        if not self._cells:
+            raise InvalidMoveError("No move to undo")
+        move = self._restore_move(-1)
+        self._pop_index()
+        return move
+
+    def _pop_index(self) -> int:
+        """Remove the last move (there must be one) and return its flat index."""
+        if self._shared:
+            self._ensure_private()
+        player = self.BLUE if len(self._cells) % 2 == 1 else self.RED
+        index = self._cells.pop()
+        self._timestamps.pop()
+        self._occupancy[index] = self.EMPTY
+        self._position_hash ^= self._zobrist.keys[player][index]
+        if self._move_grid is not None:
+            self._move_grid.flat[index] = 0
+        return index
     
     
 class HexBoard(IHexBoard):
@@ -197,7 +404,9 @@ class HexBoard(IHexBoard):
         self._board_state = np.zeros((size, size), dtype=np.uint8)
         self._occupied_cells: Set[HexCell] = set()
         self._is_full = False
-        self._win_detector = HexWinDetector()
+        self._connectivity = HexUnionFind(int(size))
+        # True while the matrix, occupied set and connectivity may be shared with a fork
+        self._shared = False
 
     def add_move(self, move: IHexMove) -> bool:
         """
@@ -224,27 +433,100 @@ class HexBoard(IHexBoard):
         if cell in self._occupied_cells:
             raise CellAlreadyOccupiedError(f"Cell already occupied: {cell}")
         
+        if self._shared:
+            self._ensure_private()
+
         # Synchronize with _memory_board
-        self._memory_board._moves.append(move)
+        self._memory_board._append_move(move)
 
         self._occupied_cells.add(cell)
         value = self.BLUE if self._memory_board.get_total_moves() % 2 == 1 else self.RED
         self._board_state[cell.x, cell.y] = value
+        self._connectivity.add_stone(cell.x, cell.y, value)
 
-
-        if len(self._occupied_cells) == self._memory_board._size * self._memory_board._size:
+        if len(self._occupied_cells) == self.size * self.size:
             self._is_full = True
 
         return True
+
+    def _play_index(self, index: int, timestamp: float = _NO_TIMESTAMP) -> Optional[int]:
+        """
+        Place a stone on an empty cell given as a flat index, without any validation.
+        Fast path for simulations: no HexMove, no exception, no clock read.
+
+        Args:
+            index: Flat index (x * size + y) of an empty cell
+            timestamp: Timestamp of the move (NaN for none)
+
+        Returns:
+            Optional[int]: The winner after this stone, or None if there is no winner
+        """
+        if self._shared:
+            self._ensure_private()
+        memory_board = self._memory_board
+        memory_board._append_index(index, timestamp)
+        total = len(memory_board._cells)
+        size = self._connectivity._size
+        x, y = divmod(index, size)
+        value = self.BLUE if total % 2 == 1 else self.RED
+        self._occupied_cells.add(memory_board._table.cells[index])
+        self._board_state[x, y] = value
+        if total == size * size:
+            self._is_full = True
+        return self._connectivity.add_stone(x, y, value)
+
+    def _undo_index(self) -> int:
+        """
+        Take back the last move (there must be one) without materialising it.
+
+        Returns:
+            int: The flat index of the removed stone
+        """
+        index = self._memory_board._pop_index()
+        if self._shared:
+            self._ensure_private()
+        size = self._memory_board.size
+        self._board_state[index // size, index % size] = self.EMPTY
+        self._occupied_cells.discard(self._memory_board._table.cells[index])
+        self._is_full = False
+        self._connectivity.remove_last_stone()
+        return index
     
     @property
     def size(self) -> int:
         return self._memory_board.size
 
+    @property
+    def position_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the current position, kept up to date by add_move and undo_move."""
+        return self._memory_board.position_hash
+
     def get_board_state(self) -> np.ndarray:
         """Get the current board state as a numpy array."""
         return self._board_state.copy()
 
+    def board_view(self) -> np.ndarray:
+        """Get a read-only view of the current board state (no copy)."""
+        view = self._board_state.view()
+        view.flags.writeable = False
+        return view
+
+    def legal_mask(self) -> np.ndarray:
+        """Get a boolean (size, size) mask of the empty cells."""
+        return self._board_state == self.EMPTY
+
+    def empty_indices(self) -> np.ndarray:
+        """Get the flat indices (x * size + y) of the empty cells, in increasing order."""
+        return np.flatnonzero(self._board_state == self.EMPTY)
+
+    def stones(self, player: int) -> np.ndarray:
+        """Get a boolean (size, size) mask of the stones of a player."""
+        return self._board_state == player
+
+    def move_indices(self) -> np.ndarray:
+        """Get the flat indices of the played cells, in move order."""
+        return self._memory_board.move_indices()
+
     def is_valid_move(self, cell: HexCell) -> bool:
         """
         Check if a move is valid.
@@ -299,10 +581,63 @@ class HexBoard(IHexBoard):
         return value if value != self.EMPTY else None
 
     def to_memory_hex_board(self) -> 'MemoryHexBoard':
-        """Convert to MemoryHexBoard."""
-        memory_board = MemoryHexBoard(self._memory_board._size)
-        memory_board._moves = self._memory_board._moves.copy()
-        return memory_board
+        """Convert to MemoryHexBoard (the move storage is shared copy-on-write)."""
+        return self._memory_board.fork()
+
+    def fork(self) -> 'HexBoard':
+        """
+        Get an independent copy of the board in O(1).
+        Both boards share their matrix, occupied set and connectivity structure until one
+        of them writes, which then copies them first (copy-on-write).
+
+        Returns:
+            HexBoard: The new board
+        """
+        board = HexBoard.__new__(HexBoard)
+        board._memory_board = self._memory_board.fork()
+        board._board_state = self._board_state
+        board._occupied_cells = self._occupied_cells
+        board._is_full = self._is_full
+        board._connectivity = self._connectivity
+        board._shared = self._shared = True
+        return board
+
+    def __getstate__(self) -> tuple:
+        """Pickle as the move storage only: every derived structure is rebuilt on load."""
+        return (self._memory_board,)
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Rebuild the board from its move storage.
+        The matrix is rebuilt at once; the occupied set and the connectivity structure
+        are only rebuilt on first use (see __getattr__).
+        """
+        memory_board, = state
+        self._memory_board = memory_board
+        self._board_state = memory_board.get_board_state()
+        self._is_full = memory_board.is_full()
+        self._shared = False
+
+    def __getattr__(self, name: str):
+        """Build the lazy structures of a board created by __setstate__ when they are first accessed."""
+        if name not in ('_occupied_cells', '_connectivity') or '_memory_board' not in self.__dict__:
+            raise AttributeError(name)
+        memory_board = self._memory_board
+        table = memory_board._table
+        size = memory_board.size
+        self._occupied_cells = {table.cells[index] for index in memory_board._cells}
+        self._connectivity = HexUnionFind(size)
+        for number, index in enumerate(memory_board._cells):
+            value = self.BLUE if number % 2 == 0 else self.RED
+            self._connectivity.add_stone(index // size, index % size, value)
+        return self.__dict__[name]
+
+    def _ensure_private(self) -> None:
+        """Copy the state shared with a fork so that it can be written."""
+        self._board_state = self._board_state.copy()
+        self._occupied_cells = self._occupied_cells.copy()
+        self._connectivity = self._connectivity.copy()
+        self._shared = False
 
     def to_hex_board(self) -> 'HexBoard':
         """Convert to HexBoard (no-op for this class)."""
@@ -320,20 +655,46 @@ class HexBoard(IHexBoard):
         """
         return self._memory_board.get_board_state_at_move(move_index)
 
+    def get_history_tensor(self) -> np.ndarray:
+        """Get every position of the game in one (total moves + 1, size, size) array."""
+        return self._memory_board.get_history_tensor()
+
     def get_total_moves(self) -> int:
         """Get the total number of moves made."""
         return self._memory_board.get_total_moves()
     
     def get_winner(self) -> Optional[int]:
         """
-        Check for a winner on the board using the cached detector.
+        Check for a winner on the board using the incremental connectivity structure.
+        The structure is updated in add_move, so no board traversal happens here.
 
         Returns:
             Optional[int]: The value of the winning player (1 for BLUE, 2 for RED), or None if there is no winner.
         """
-        board_state = self.get_board_state()
-        return self._win_detector.detect_winner(board_state)
+        return self._connectivity.winner
     
     def get_moves(self) -> List[IHexMove]:
         """Get the list of all moves made on the board."""
-        return self._memory_board.get_moves()
\ No newline at end of file
+        return self._memory_board.get_moves()
+
+    def undo_move(self) -> IHexMove:
+        """
+        Take back the last move made on the board.
+        The board matrix, occupied set, full flag and connectivity structure are
+        restored in place, without rebuilding anything.
+
+        Returns:
+            IHexMove: The removed move
+
+        Raises:
+            InvalidMoveError: If no move has been made
+        """
+        move = self._memory_board.undo_move()
+        if self._shared:
+            self._ensure_private()
+        cell = move.cell
+        self._board_state[cell.x, cell.y] = self.EMPTY
+        self._occupied_cells.discard(cell)
+        self._is_full = False
+        self._connectivity.remove_last_stone()
+        return move
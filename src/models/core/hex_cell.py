@@ -1,11 +1,18 @@
-import numpy as np
+from typing import Dict
+
 
 class HexCell:
     """
     Represents a cell on the Hex board with x and y coordinates.
     Immutable to ensure thread safety and prevent accidental modifications.
+
+    Use HexCell.of(x, y) on hot paths: it returns one shared instance per
+    coordinate pair, so equal cells are usually the same object and compare by identity.
     """
-    __slots__ = ('_x', '_y')
+    __slots__ = ('_x', '_y', '_hash')
+
+    # Interned cells, keyed by x * 256 + y
+    _interned: Dict[int, 'HexCell'] = {}
 
     def __init__(self, x: int, y: int):
         """Initialize the HexCell with x and y coordinates."""
@@ -14,26 +21,57 @@ class HexCell:
         if not (0 <= y <= 255):
             raise ValueError("y coordinate must be between 0 and 255")
 
-        self._x = np.uint8(x)
-        self._y = np.uint8(y)
+        self._x = int(x)
+        self._y = int(y)
+        self._hash = hash((self._x, self._y))
+
+    @classmethod
+    def of(cls, x: int, y: int) -> 'HexCell':
+        """
+        Get the shared instance of a cell.
+
+        Args:
+            x, y: Coordinates of the cell
+
+        Returns:
+            HexCell: The interned cell
+
+        Raises:
+            ValueError: If a coordinate is not between 0 and 255
+        """
+        # Numpy coordinates (such as np.uint8) would overflow in the key
+        x, y = int(x), int(y)
+        if 0 <= x <= 255 and 0 <= y <= 255:
+            key = x * 256 + y
+            cell = cls._interned.get(key)
+            if cell is None:
+                cell = cls._interned[key] = cls(x, y)
+            return cell
+        return cls(x, y)
 
     @property
     def x(self) -> int:
         """Get the x coordinate of the cell."""
-        return int(self._x)
+        return self._x
 
     @property
     def y(self) -> int:
         """Get the y coordinate of the cell."""
-        return int(self._y)
+        return self._y
 
     def __repr__(self):
-        return f"HexCell(x={self.x}, y={self.y})"
+        return f"HexCell(x={self._x}, y={self._y})"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, HexCell):
-            return self.x == other.x and self.y == other.y
+            return self._x == other._x and self._y == other._y
         return False
 
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self._hash
+
+    def __reduce__(self):
+        # Unpickled cells are interned again
+        return HexCell.of, (self._x, self._y)
@@ -0,0 +1,67 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+
+from .hex_cell import HexCell
+from .hex_geometry import HexGeometry
+
+
+class HexCellTable:
+    """
+    Precomputed cell tables for a given board size.
+    Flat index i stands for the cell (x, y) with i = x * size + y.
+
+    Holds the interned cells and Python views of the HexGeometry tables (flat
+    neighbour lists, edges of each player, SGF coordinates), so boards, the win
+    detector, the AI and the SGF codec never rebuild cells or recompute
+    neighbourhoods in their loops.
+    Instances are shared per size through `for_size`.
+    """
+    BLUE = 1
+    RED = 2
+
+    # Neighbour offsets in the hexagonal grid, identical to HexWinDetector
+    DIRECTIONS = HexGeometry.DIRECTIONS
+
+    _cache: Dict[int, 'HexCellTable'] = {}
+
+    __slots__ = ('size', 'cells', 'neighbours', 'starts', 'ends', 'sgf', 'sgf_index')
+
+    def __init__(self, size: int):
+        """
+        Compute the tables for a board size.
+
+        Args:
+            size: The size of the board (n x n)
+        """
+        geometry = HexGeometry.for_size(size)
+        offsets = geometry.neighbour_offsets.tolist()
+        indices = geometry.neighbour_indices.tolist()
+        self.size = size
+        self.cells: List[HexCell] = [HexCell.of(x, y) for x in range(size) for y in range(size)]
+        self.neighbours: List[Tuple[int, ...]] = [
+            tuple(indices[offsets[index]:offsets[index + 1]]) for index in range(size * size)
+        ]
+        self.starts: Dict[int, Tuple[int, ...]] = {
+            player: tuple(np.flatnonzero(geometry.edge_masks[player][0]).tolist()) for player in (self.BLUE, self.RED)
+        }
+        self.ends: Dict[int, FrozenSet[int]] = {
+            player: frozenset(np.flatnonzero(geometry.edge_masks[player][1]).tolist()) for player in (self.BLUE, self.RED)
+        }
+        self.sgf: Optional[List[str]] = geometry.sgf
+        self.sgf_index: Dict[str, int] = geometry.sgf_index
+
+    @classmethod
+    def for_size(cls, size: int) -> 'HexCellTable':
+        """Get the shared tables for a board size."""
+        table = cls._cache.get(size)
+        if table is None:
+            table = cls._cache[size] = cls(size)
+        return table
+
+    def index(self, cell: HexCell) -> int:
+        """Get the flat index of a cell."""
+        return cell.x * self.size + cell.y
+
+    def cell(self, index: int) -> HexCell:
+        """Get the interned cell at a flat index."""
+        return self.cells[index]
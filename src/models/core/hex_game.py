@@ -44,6 +44,18 @@ class HexGame(IHexGame):
         self._last_pause_start_time = last_pause_start_time
         self._current_player = self.get_current_player()
 
+    # Pickles the game as its board and metadata; the state object is rebuilt from its class
+    def __getstate__(self) -> tuple:
+        return (self._board, type(self._state), self._game_end_reason, self._winner, self._start_time,
+                self._end_time, self._total_pause_duration, self._last_pause_start_time)
+
+    # Rebuilds the game from its pickled state
+    def __setstate__(self, state: tuple) -> None:
+        (self._board, state_class, self._game_end_reason, self._winner, self._start_time,
+         self._end_time, self._total_pause_duration, self._last_pause_start_time) = state
+        self._state = state_class()
+        self._current_player = self.get_current_player()
+
     # Property to access the game board
     @property
     def board(self) -> IHexBoard:
@@ -139,6 +151,36 @@ class HexGame(IHexGame):
             return True
         return False
 
+    # Takes back the last move, reopening the game if that move had won it
+    def undo_move(self) -> IHexMove:
+        """
+        Takes back the last move. The board restores its own state in place; if the game
+        had been won by that move, the winner is cleared and the game becomes active again.
+        Raises exceptions if the game ended for another reason or if there is no move to undo.
+        """
+        if self.is_game_over() and self._game_end_reason != GameEndReason.VICTORY:
+            raise GameOverError("The game is over.")
+
+        move = self.board.undo_move()
+        if self._game_end_reason == GameEndReason.VICTORY and self.board.get_winner() is None:
+            self._winner = None
+            self._game_end_reason = None
+            self._end_time = None
+            self.state = ActiveState()
+        self.switch_player()
+        return move
+
+    # Creates an independent copy of the game, the board storage being shared copy-on-write
+    def fork(self) -> 'HexGame':
+        """
+        Creates an independent copy of the game in O(1).
+        The board is forked (storage shared until one of the games plays or undoes a move),
+        and the state, end condition and timing fields are copied.
+        """
+        return HexGame(self._board.fork(), self._state, self._game_end_reason, self._winner,
+                       self._start_time, self._end_time, self._total_pause_duration,
+                       self._last_pause_start_time)
+
     # Returns the current player (either BLUE_PLAYER or RED_PLAYER)
     def get_current_player(self) -> int:
         # current player is determined by the number of moves made
@@ -329,6 +371,17 @@ class TimedHexGame(IHexGame):
             raise ValueError("Timestamp cannot be None for a timed game.")
         return self._hex_game.make_move(move)
 
+    # Takes back the last move
+    def undo_move(self) -> IHexMove:
+        return self._hex_game.undo_move()
+
+    # Creates an independent copy of the timed game
+    def fork(self) -> 'TimedHexGame':
+        """Creates an independent copy of the timed game, with the current timers, in O(1)."""
+        return TimedHexGame(self._hex_game.fork(), self._initial_time,
+                            self._player_timers[self._hex_game.BLUE_PLAYER],
+                            self._player_timers[self._hex_game.RED_PLAYER])
+
     # Returns the current player
     def get_current_player(self) -> int:
         return self._hex_game.get_current_player()
@@ -384,7 +437,7 @@ class TimedHexGame(IHexGame):
         - This is fair as pauses can occur during either player's turn
         """
         # Quick exits for edge cases
-        if not self._hex_game.board.get_moves():
+        if not self._hex_game.board.get_total_moves():
             return
 
         # Get current time only if game is active
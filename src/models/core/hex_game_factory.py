@@ -1,11 +1,15 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, Sequence
+import time
 import numpy as np
 
 from .hex_game import HexGame, TimedHexGame
 from .interfaces import IHexBoard, IHexMove, HexCell, GameEndReason, IHexState
 from .hex_state import NotStartedState, ActiveState, PausedState, FinishedState, CorruptedState
-from .exceptions import InvalidCellError, InvalidGameStateError
-from .hex_board import HexBoard, MemoryHexBoard  
+from .exceptions import InvalidCellError, InvalidGameStateError, GameOverError
+from .hex_board import HexBoard, MemoryHexBoard, _NO_TIMESTAMP
+from .bit_hex_board import BitHexBoard
+from .hex_union_find import HexUnionFind
+from .hex_win_detector import HexWinDetector
 
 
 class HexGameFactory:
@@ -22,13 +26,15 @@ class HexGameFactory:
                     blue_player_timer: Optional[float] = None,
                     red_player_timer: Optional[float] = None,
                     existing_game: Optional[HexGame] = None,
-                    use_memory_board: bool = False) -> HexGame:
+                    use_memory_board: bool = False,
+                    use_bit_board: bool = False) -> HexGame:
         """
         Creates a HexGame or TimedHexGame instance based on the provided parameters.
         If no board is provided, a default HexBoard is created.
         If initial_time is provided, a TimedHexGame is created.
-        If existing_game is provided, a new game is created based on the existing game.
+        If existing_game is provided, a new game is created based on the existing game (its board is forked, never shared).
         If use_memory_board is True, a MemoryHexBoard is used.
+        If use_bit_board is True, a BitHexBoard is used.
         """
         if existing_game:
             if not isinstance(existing_game, HexGame):
@@ -38,11 +44,13 @@ class HexGameFactory:
                 if board_size is None:
                     raise ValueError("Board size must be provided when using MemoryHexBoard.")
                 new_board = MemoryHexBoard(board_size)
-                # Copy the board state from the existing game
-                new_board._board_state = existing_game.board.get_board_state()
-                new_board._moves = existing_game.board.get_moves()
+                # Copy the moves from the existing game
+                new_board._load_moves(existing_game.board.get_moves())
+            elif use_bit_board:
+                new_board = BitHexBoard.from_board(existing_game.board)
             else:
-                new_board = existing_game.board
+                # Forked so that the new game does not alias the board of the existing one
+                new_board = existing_game.board.fork()
 
             if initial_time is not None:
                 new_hex_game = HexGame(new_board, existing_game.state, existing_game.game_end_reason,
@@ -59,6 +67,8 @@ class HexGameFactory:
 
         if use_memory_board:
             board = MemoryHexBoard(board_size)
+        elif use_bit_board:
+            board = BitHexBoard(board_size)
         else:
             board = HexBoard(board_size)
 
@@ -68,6 +78,110 @@ class HexGameFactory:
         else:
             return HexGame(board, state, game_end_reason, winner, start_time, end_time, total_pause_duration, last_pause_start_time)
 
+    @staticmethod
+    def create_from_moves(board_size: int,
+                          moves: Sequence,
+                          result: Optional[int] = None,
+                          verify: str = "end",
+                          game_end_reason: Optional[GameEndReason] = None,
+                          timestamps: Optional[Sequence[float]] = None) -> HexGame:
+        """
+        Creates a game from a complete move list in one batch (e.g. a game read from a library).
+        All stones are written at once instead of replaying make_move: the moves are checked
+        with one bounds test and one uniqueness test, and win detection runs at most once.
+
+        Args:
+            board_size: The size of the board (n x n)
+            moves: The moves in play order (BLUE first), as flat indices (x * size + y)
+                   or as an (n, 2) array of (x, y) coordinates
+            result: The recorded winner (BLUE=1, RED=2), or None if the record gives none
+            verify: How the end of the game is checked:
+                    "none" trusts result and detects nothing (moves after a win are not seen),
+                    "end" detects the winner of the final position, and of the position before
+                    the last move when somebody won: a win must be made by the last stone, so
+                    moves after a win are rejected,
+                    "each" replays the connectivity move by move and rejects moves played after a win
+            game_end_reason: Why the game ended when nobody connected (RESIGN by default)
+            timestamps: Timestamps of the moves (None for none)
+
+        Returns:
+            HexGame: An active game, or a finished one if somebody connected or a result is given
+
+        Raises:
+            ValueError: If verify is unknown or timestamps do not match the moves
+            InvalidCellError: If a move is off the board or a cell is played twice
+            GameOverError: If a move follows a winning move ("end" and "each" only)
+            InvalidGameStateError: If the winner on the board contradicts result or game_end_reason
+        """
+        if verify not in ("none", "end", "each"):
+            raise ValueError(f"Unknown verification mode: {verify}")
+
+        memory_board = MemoryHexBoard(board_size)
+        size = memory_board.size
+        indices = np.asarray(moves, dtype=np.int64)
+        if indices.ndim == 2:
+            if indices.shape[1] != 2:
+                raise ValueError("Coordinate moves must have shape (n, 2).")
+            if indices.size and (indices.min() < 0 or indices.max() >= size):
+                raise InvalidCellError("Invalid move.")
+            indices = indices[:, 0] * size + indices[:, 1]
+        indices = indices.ravel()
+        if indices.size:
+            if indices.min() < 0 or indices.max() >= size * size:
+                raise InvalidCellError("Invalid move.")
+            if np.bincount(indices, minlength=size * size).max() > 1:
+                raise InvalidCellError("Invalid move.")
+        if timestamps is None:
+            times = [_NO_TIMESTAMP] * indices.size
+        else:
+            times = [_NO_TIMESTAMP if t is None else t for t in timestamps]
+            if len(times) != indices.size:
+                raise ValueError("There must be one timestamp per move.")
+
+        # One vectorized write; the occupied set and connectivity are rebuilt lazily by the board
+        memory_board._load_storage(indices.tolist(), times)
+        board = HexBoard.__new__(HexBoard)
+        board.__setstate__((memory_board,))
+
+        winner = None
+        if verify == "end":
+            state = board.board_view()
+            winner = HexWinDetector.static_detect_winner(state)
+            if winner is not None:
+                # The winning stone must be the last one: the winner is the last mover, and
+                # nobody had won before it (positions only gain stones, so none of the earlier
+                # positions had a winner either)
+                if winner != (HexBoard.BLUE if indices.size % 2 == 1 else HexBoard.RED):
+                    raise GameOverError("The game is over.")
+                before = state.copy()
+                before.flat[indices[-1]] = HexBoard.EMPTY
+                if HexWinDetector.static_detect_winner(before) is not None:
+                    raise GameOverError("The game is over.")
+        elif verify == "each":
+            connectivity = HexUnionFind(size)
+            last = indices.size - 1
+            for number, index in enumerate(indices.tolist()):
+                player = HexBoard.BLUE if number % 2 == 0 else HexBoard.RED
+                if connectivity.add_stone(index // size, index % size, player) is not None and number != last:
+                    raise GameOverError("The game is over.")
+            board._connectivity = connectivity
+            winner = connectivity.winner
+
+        now = time.time()
+        if winner is not None:
+            if result is not None and result != winner:
+                raise InvalidGameStateError("The recorded result contradicts the board.")
+            if game_end_reason not in (None, GameEndReason.VICTORY):
+                raise InvalidGameStateError("The game was won on the board.")
+            return HexGame(board, FinishedState(), GameEndReason.VICTORY, winner, now, now)
+        if result is not None:
+            if game_end_reason is None:
+                game_end_reason = GameEndReason.VICTORY if verify == "none" else GameEndReason.RESIGN
+            elif game_end_reason == GameEndReason.VICTORY and verify != "none":
+                raise InvalidGameStateError("Nobody connected on the board.")
+            return HexGame(board, FinishedState(), game_end_reason, result, now, now)
+        return HexGame(board, ActiveState(), start_time=now)
+
     @staticmethod
     def convert_to_timed_game(hex_game: HexGame, initial_time: float,
                                blue_player_timer: Optional[float] = None,
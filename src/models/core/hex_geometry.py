@@ -0,0 +1,174 @@
+import os
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+
+class HexGeometry:
+    """
+    Precomputed geometry of a board size, as numpy arrays over flat indices.
+    Flat index i stands for the cell (x, y) with i = x * size + y.
+
+    Holds, for one size:
+    - the coordinates of every cell and the SGF codes (two letters, y then x, up to 26x26)
+    - the neighbours in CSR form: the neighbours of cell i are
+      neighbour_indices[neighbour_offsets[i]:neighbour_offsets[i + 1]]
+    - the bridges in the same form, with the two carrier cells of each bridge
+    - the edge masks and distance-to-edge maps of each player
+    - the distance to the centre used by the AI strategies
+
+    Instances are computed once per size and shared through `for_size`. They can
+    also be saved to a cache directory, so that worker processes start warm.
+    """
+    BLUE = 1
+    RED = 2
+
+    # Neighbour offsets in the hexagonal grid, in the order of HexWinDetector
+    DIRECTIONS = ((1, 0), (1, 1), (0, 1), (0, -1), (-1, 0), (-1, -1))
+
+    # Bridge offsets: two cells sharing exactly two common neighbours (the carrier)
+    BRIDGES = ((1, 2), (2, 1), (1, -1), (-1, 1), (-1, -2), (-2, -1))
+
+    _cache: Dict[int, 'HexGeometry'] = {}
+
+    # Arrays written to and read from the disk cache
+    _ARRAYS = ('coordinates', 'neighbour_offsets', 'neighbour_indices', 'bridge_offsets',
+               'bridge_indices', 'bridge_carriers', 'blue_edges', 'red_edges',
+               'blue_edge_distances', 'red_edge_distances', 'centre_distance')
+
+    __slots__ = ('size',) + _ARRAYS + ('edge_masks', 'edge_distances', 'sgf', 'sgf_index')
+
+    def __init__(self, size: int):
+        """
+        Compute the geometry of a board size.
+
+        Args:
+            size: The size of the board (n x n)
+        """
+        self.size = size
+        x, y = np.divmod(np.arange(size * size, dtype=np.int32), size)
+        self.coordinates = np.stack([x, y], axis=1)
+
+        self.neighbour_offsets, self.neighbour_indices = self._offsets_csr(x, y, self.DIRECTIONS)
+        self.bridge_offsets, self.bridge_indices = self._offsets_csr(x, y, self.BRIDGES)
+        # The carrier of a bridge are the two cells adjacent to both of its ends
+        carriers = {bridge: [d for d in self.DIRECTIONS if (bridge[0] - d[0], bridge[1] - d[1]) in self.DIRECTIONS]
+                    for bridge in self.BRIDGES}
+        bridge_carriers = []
+        for index in range(size * size):
+            cx, cy = int(x[index]), int(y[index])
+            for target in self.bridge_indices[self.bridge_offsets[index]:self.bridge_offsets[index + 1]].tolist():
+                (dx1, dy1), (dx2, dy2) = carriers[(target // size - cx, target % size - cy)]
+                bridge_carriers.append(((cx + dx1) * size + cy + dy1, (cx + dx2) * size + cy + dy2))
+        self.bridge_carriers = np.array(bridge_carriers, dtype=np.int32).reshape(-1, 2)
+
+        # BLUE connects x == 0 to x == size - 1, RED connects y == 0 to y == size - 1
+        last = size - 1
+        self.blue_edges = np.stack([x == 0, x == last])
+        self.red_edges = np.stack([y == 0, y == last])
+        self.blue_edge_distances = np.stack([x, last - x])
+        self.red_edge_distances = np.stack([y, last - y])
+        centre = size // 2
+        self.centre_distance = np.abs(x - centre) + np.abs(y - centre)
+        self._index_tables()
+
+    def _offsets_csr(self, x: np.ndarray, y: np.ndarray,
+                     offsets: Tuple[Tuple[int, int], ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the CSR arrays of the cells reached from every cell by a list of offsets.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The row offsets (n + 1) and the flat target indices
+        """
+        size = self.size
+        targets_x = x[:, None] + np.array([dx for dx, _ in offsets], dtype=np.int32)
+        targets_y = y[:, None] + np.array([dy for _, dy in offsets], dtype=np.int32)
+        inside = (targets_x >= 0) & (targets_x < size) & (targets_y >= 0) & (targets_y < size)
+        row_offsets = np.zeros(size * size + 1, dtype=np.int32)
+        np.cumsum(inside.sum(axis=1), out=row_offsets[1:])
+        return row_offsets, (targets_x * size + targets_y)[inside].astype(np.int32)
+
+    def _index_tables(self) -> None:
+        """Build the lookups derived from the arrays (player dictionaries and SGF codes)."""
+        self.edge_masks: Dict[int, np.ndarray] = {self.BLUE: self.blue_edges, self.RED: self.red_edges}
+        self.edge_distances: Dict[int, np.ndarray] = {self.BLUE: self.blue_edge_distances,
+                                                      self.RED: self.red_edge_distances}
+        # SGF coordinates are two letters (y then x), so they only exist up to 26x26
+        self.sgf: Optional[List[str]] = None
+        self.sgf_index: Dict[str, int] = {}
+        if self.size <= 26:
+            self.sgf = [chr(ord('a') + int(y)) + chr(ord('a') + int(x)) for x, y in self.coordinates]
+            self.sgf_index = {code: index for index, code in enumerate(self.sgf)}
+
+    @classmethod
+    def for_size(cls, size: int, cache_dir: Optional[str] = None) -> 'HexGeometry':
+        """
+        Get the shared geometry of a board size.
+
+        Args:
+            size: The size of the board (n x n)
+            cache_dir: Directory of the disk cache; the geometry is read from it when present,
+                       and written to it after being computed
+
+        Returns:
+            HexGeometry: The geometry
+        """
+        geometry = cls._cache.get(size)
+        if geometry is None:
+            path = None if cache_dir is None else os.path.join(cache_dir, f"hex_geometry_{size}.npz")
+            if path is not None and os.path.exists(path):
+                geometry = cls.load(path)
+            else:
+                geometry = cls(size)
+                if path is not None:
+                    geometry.save(path)
+            cls._cache[size] = geometry
+        return geometry
+
+    def save(self, path: str) -> None:
+        """
+        Write the arrays to a .npz file.
+
+        Args:
+            path: The file to write
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Written under a temporary name first, so that concurrent workers never read a partial file
+        temporary = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(temporary, size=self.size, **{name: getattr(self, name) for name in self._ARRAYS})
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'HexGeometry':
+        """
+        Read a geometry written by save.
+
+        Args:
+            path: The file to read
+
+        Returns:
+            HexGeometry: The geometry (not registered in the shared cache)
+        """
+        geometry = cls.__new__(cls)
+        with np.load(path) as data:
+            geometry.size = int(data['size'])
+            for name in cls._ARRAYS:
+                setattr(geometry, name, data[name])
+        geometry._index_tables()
+        return geometry
+
+    def neighbours(self, index: int) -> np.ndarray:
+        """Get the flat indices of the neighbours of a cell."""
+        return self.neighbour_indices[self.neighbour_offsets[index]:self.neighbour_offsets[index + 1]]
+
+    def bridges(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the bridges of a cell.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The flat indices of the bridge ends and, for each one,
+                                           the two carrier cells
+        """
+        start, end = self.bridge_offsets[index], self.bridge_offsets[index + 1]
+        return self.bridge_indices[start:end], self.bridge_carriers[start:end]
@@ -30,12 +30,29 @@ class HexMove(IHexMove):
         if isinstance(cell, HexCell):
             self._cell = cell
         elif isinstance(cell, tuple) and len(cell) == 2:
-            self._cell = HexCell(*cell)
+            self._cell = HexCell.of(*cell)
         else:
             raise ValueError("cell must be an instance of HexCell or a tuple of (x, y)")
 
         self._timestamp = timestamp if timestamp is not None else time.time()
 
+    @classmethod
+    def _restore(cls, cell: HexCell, timestamp: Optional[float]) -> 'HexMove':
+        """
+        Rebuild a stored move as is: no validation, and a missing timestamp stays None.
+
+        Args:
+            cell (HexCell): The cell of the move.
+            timestamp (Optional[float]): The stored timestamp.
+
+        Returns:
+            HexMove: The move.
+        """
+        move = cls.__new__(cls)
+        move._cell = cell
+        move._timestamp = timestamp
+        return move
+
     @property
     def cell(self) -> HexCell:
         """Get the cell of the move."""
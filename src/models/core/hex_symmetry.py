@@ -0,0 +1,182 @@
+from typing import Dict, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from .interfaces import IHexBoard
+from .hex_zobrist import HexZobrist
+
+
+class HexSymmetry:
+    """
+    Symmetries of the Hex board and canonical forms of positions and games.
+
+    The board has four symmetries, each one its own inverse:
+    - IDENTITY
+    - ROTATE_180: (x, y) -> (size - 1 - x, size - 1 - y)
+    - TRANSPOSE: (x, y) -> (y, x), with BLUE and RED swapped
+    - ANTI_TRANSPOSE: (x, y) -> (size - 1 - y, size - 1 - x), with BLUE and RED swapped
+
+    Transposing exchanges the x edges (BLUE) and the y edges (RED), so it is a
+    symmetry only together with a colour swap, and then the other player is to move.
+    Canonical positions therefore carry the side to move, and a value stored under a
+    canonical hash must be seen from the point of view of the player to move.
+
+    Move sequences always start with BLUE, so only IDENTITY and ROTATE_180 map a game
+    to another game: canonical move sequences use those two.
+
+    Instances hold the flat index permutations of one size and are shared through `for_size`.
+    """
+    EMPTY = 0
+    BLUE = 1
+    RED = 2
+
+    IDENTITY = 0
+    ROTATE_180 = 1
+    TRANSPOSE = 2
+    ANTI_TRANSPOSE = 3
+
+    # Does the symmetry swap the colours (and the side to move)?
+    SWAPS_COLOURS = (False, False, True, True)
+
+    # Colour maps applied to the cell values, indexed by symmetry
+    _COLOURS = np.array([[0, 1, 2], [0, 1, 2], [0, 2, 1], [0, 2, 1]], dtype=np.uint8)
+
+    _cache: Dict[int, 'HexSymmetry'] = {}
+
+    __slots__ = ('size', 'permutations', '_zobrist')
+
+    def __init__(self, size: int):
+        """
+        Compute the index permutations for a board size.
+
+        Args:
+            size: The size of the board (n x n)
+        """
+        x, y = np.divmod(np.arange(size * size), size)
+        last = size - 1
+        self.size = size
+        # permutations[s][i] is the flat index of cell i once symmetry s is applied
+        self.permutations = np.stack([
+            x * size + y,
+            (last - x) * size + (last - y),
+            y * size + x,
+            (last - y) * size + (last - x),
+        ])
+        self._zobrist = HexZobrist.for_size(size)
+
+    @classmethod
+    def for_size(cls, size: int) -> 'HexSymmetry':
+        """Get the shared symmetry tables for a board size."""
+        symmetry = cls._cache.get(size)
+        if symmetry is None:
+            symmetry = cls._cache[size] = cls(size)
+        return symmetry
+
+    @staticmethod
+    def _state_of(position: Union[IHexBoard, np.ndarray]) -> np.ndarray:
+        """Get the board state of a board without copying it."""
+        if isinstance(position, IHexBoard):
+            return position.board_view()
+        return np.asarray(position)
+
+    @classmethod
+    def _mover(cls, state: np.ndarray, to_move: Optional[int]) -> int:
+        """Get the player to move, from the stone counts when it is not given (BLUE starts)."""
+        if to_move is not None:
+            return to_move
+        return cls.BLUE if np.count_nonzero(state) % 2 == 0 else cls.RED
+
+    def transform_index(self, index: int, symmetry: int) -> int:
+        """
+        Apply a symmetry to a flat cell index (x * size + y).
+        Every symmetry is its own inverse, so this also maps canonical moves back.
+        """
+        return int(self.permutations[symmetry][index])
+
+    def transform_state(self, board_state: np.ndarray, symmetry: int) -> np.ndarray:
+        """
+        Apply a symmetry to a board state.
+
+        Args:
+            board_state: The (size, size) board state
+            symmetry: The symmetry to apply
+
+        Returns:
+            np.ndarray: The transformed board state (colours swapped for the transposes)
+        """
+        flat = np.asarray(board_state).ravel()
+        transformed = np.empty_like(flat)
+        transformed[self.permutations[symmetry]] = self._COLOURS[symmetry][flat]
+        return transformed.reshape(self.size, self.size)
+
+    def symmetric_hashes(self, position: Union[IHexBoard, np.ndarray], to_move: Optional[int] = None) -> np.ndarray:
+        """
+        Compute the hashes of the four images of a position, side to move included.
+
+        Args:
+            position: A board or a (size, size) board state
+            to_move: The player to move (BLUE=1, RED=2); deduced from the stone counts when None
+
+        Returns:
+            np.ndarray: uint64 array of 4 hashes, indexed by symmetry
+        """
+        flat = self._state_of(position).ravel()
+        mover = self._mover(flat, to_move)
+        keys = self._zobrist.table[self._COLOURS[:, flat], self.permutations]
+        hashes = np.bitwise_xor.reduce(keys, axis=1)
+        # The image of the mover is RED for the symmetries that keep colours iff the mover is RED
+        red_to_move = np.array(self.SWAPS_COLOURS) ^ (mover == self.RED)
+        return hashes ^ np.where(red_to_move, np.uint64(self._zobrist.red_to_move), np.uint64(0))
+
+    def canonical_symmetry(self, position: Union[IHexBoard, np.ndarray], to_move: Optional[int] = None) -> int:
+        """Get the symmetry mapping a position to its canonical form (the image with the smallest hash)."""
+        return int(np.argmin(self.symmetric_hashes(position, to_move)))
+
+    def canonical_hash(self, position: Union[IHexBoard, np.ndarray], to_move: Optional[int] = None) -> int:
+        """
+        Get a 64-bit hash shared by a position and all its symmetric images.
+
+        Args:
+            position: A board or a (size, size) board state
+            to_move: The player to move (BLUE=1, RED=2); deduced from the stone counts when None
+
+        Returns:
+            int: The canonical hash
+        """
+        return int(self.symmetric_hashes(position, to_move).min())
+
+    def canonical_state(self, position: Union[IHexBoard, np.ndarray],
+                        to_move: Optional[int] = None) -> Tuple[np.ndarray, int, int]:
+        """
+        Get the canonical form of a position.
+
+        Args:
+            position: A board or a (size, size) board state
+            to_move: The player to move (BLUE=1, RED=2); deduced from the stone counts when None
+
+        Returns:
+            Tuple[np.ndarray, int, int]: The canonical board state, the symmetry that produced it
+                                         and the player to move in it
+        """
+        state = self._state_of(position)
+        mover = self._mover(state, to_move)
+        symmetry = self.canonical_symmetry(state, mover)
+        if self.SWAPS_COLOURS[symmetry]:
+            mover = self.RED if mover == self.BLUE else self.BLUE
+        return self.transform_state(state, symmetry), symmetry, mover
+
+    def canonical_moves(self, indices: Sequence[int]) -> Tuple[Tuple[int, ...], int]:
+        """
+        Get the canonical form of a move sequence (flat indices, BLUE first).
+        The sequence and its 180 degree rotation describe the same game; the smaller one is kept.
+
+        Args:
+            indices: The flat indices of the moves, in play order
+
+        Returns:
+            Tuple[Tuple[int, ...], int]: The canonical sequence and the symmetry that produced it
+        """
+        moves = tuple(int(index) for index in indices)
+        rotated = tuple(self.permutations[self.ROTATE_180][list(moves)].tolist()) if moves else ()
+        if rotated < moves:
+            return rotated, self.ROTATE_180
+        return moves, self.IDENTITY
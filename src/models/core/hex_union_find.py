@@ -0,0 +1,172 @@
+from typing import List, Optional, Tuple
+
+from .hex_cell_table import HexCellTable
+
+
+class HexUnionFind:
+    """
+    Incremental connectivity structure for a Hex board.
+
+    Keeps a disjoint-set forest over the size * size cells plus four virtual
+    edge nodes (one per side of the board). Each stone is merged with its
+    same-coloured neighbours and with the virtual nodes of the edges it touches,
+    so a player has won as soon as both of its virtual edge nodes share a root.
+
+    Unions are done by size without path compression: the depth of every tree
+    stays bounded by log2(size * size), so `find` is cheap and a merge only ever
+    rewrites a single parent pointer. Each stone logs the pointers it rewrote,
+    which lets `remove_last_stone` take it back in constant time.
+
+    Layout of the cell nodes follows the board matrix (index = x * size + y):
+    - BLUE connects x == 0 to x == size - 1
+    - RED connects y == 0 to y == size - 1
+    """
+    EMPTY = 0
+    BLUE = 1
+    RED = 2
+
+    # Neighbour offsets in the hexagonal grid, identical to HexWinDetector
+    DIRECTIONS = ((1, 0), (1, 1), (0, 1), (0, -1), (-1, 0), (-1, -1))
+
+    __slots__ = ('_size', '_neighbours', '_parent', '_weight', '_owner', '_winner', '_history',
+                 'BLUE_START', 'BLUE_END', 'RED_START', 'RED_END')
+
+    def __init__(self, size: int):
+        """
+        Initialize an empty connectivity structure.
+
+        Args:
+            size: The size of the board (n x n)
+        """
+        cells = size * size
+        self._size = size
+        self._neighbours = HexCellTable.for_size(size).neighbours
+        self.BLUE_START = cells
+        self.BLUE_END = cells + 1
+        self.RED_START = cells + 2
+        self.RED_END = cells + 3
+        self._parent: List[int] = list(range(cells + 4))
+        self._weight: List[int] = [1] * (cells + 4)
+        self._owner: List[int] = [self.EMPTY] * cells
+        self._winner: Optional[int] = None
+        # One entry per stone: (index, winner before the stone, [(root, attached root), ...])
+        self._history: List[Tuple[int, Optional[int], List[Tuple[int, int]]]] = []
+
+    def copy(self) -> 'HexUnionFind':
+        """Get an independent copy of the structure (the lists are copied, the history entries are shared)."""
+        other = HexUnionFind.__new__(HexUnionFind)
+        other._size = self._size
+        other._neighbours = self._neighbours
+        other.BLUE_START, other.BLUE_END = self.BLUE_START, self.BLUE_END
+        other.RED_START, other.RED_END = self.RED_START, self.RED_END
+        other._parent = self._parent.copy()
+        other._weight = self._weight.copy()
+        other._owner = self._owner.copy()
+        other._winner = self._winner
+        other._history = self._history.copy()
+        return other
+
+    @property
+    def winner(self) -> Optional[int]:
+        """Get the winning player (BLUE=1, RED=2) or None if nobody is connected yet."""
+        return self._winner
+
+    def find(self, node: int) -> int:
+        """
+        Get the representative of the set containing a node.
+
+        Args:
+            node: Flat cell index or virtual edge node
+
+        Returns:
+            int: The root node of the set
+        """
+        parent = self._parent
+        while parent[node] != node:
+            node = parent[node]
+        return node
+
+    def union(self, a: int, b: int) -> Optional[Tuple[int, int]]:
+        """
+        Merge the sets containing two nodes (union by size).
+
+        Args:
+            a, b: Flat cell indices or virtual edge nodes
+
+        Returns:
+            Optional[Tuple[int, int]]: The (root, attached root) pair, or None if already merged
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return None
+        if self._weight[root_a] < self._weight[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._weight[root_a] += self._weight[root_b]
+        return root_a, root_b
+
+    def connected(self, a: int, b: int) -> bool:
+        """Check if two nodes belong to the same set."""
+        return self.find(a) == self.find(b)
+
+    def add_stone(self, x: int, y: int, player: int) -> Optional[int]:
+        """
+        Register a stone and merge it with its same-coloured neighbours.
+        Only the six neighbours of the placed stone are visited.
+
+        Args:
+            x, y: Coordinates of the placed stone
+            player: The player owning the stone (BLUE=1, RED=2)
+
+        Returns:
+            Optional[int]: The winner after this stone, or None if there is no winner
+        """
+        size = self._size
+        index = x * size + y
+        owner = self._owner
+        owner[index] = player
+
+        links = [neighbour for neighbour in self._neighbours[index] if owner[neighbour] == player]
+
+        if player == self.BLUE:
+            start, end = self.BLUE_START, self.BLUE_END
+            if x == 0:
+                links.append(start)
+            if x == size - 1:
+                links.append(end)
+        else:
+            start, end = self.RED_START, self.RED_END
+            if y == 0:
+                links.append(start)
+            if y == size - 1:
+                links.append(end)
+
+        merges = []
+        for node in links:
+            merged = self.union(index, node)
+            if merged is not None:
+                merges.append(merged)
+
+        self._history.append((index, self._winner, merges))
+        if self._winner is None and self.connected(start, end):
+            self._winner = player
+
+        return self._winner
+
+    def remove_last_stone(self) -> None:
+        """
+        Take back the last stone registered with add_stone.
+        The parent pointers rewritten by its merges are restored in reverse order.
+
+        Raises:
+            IndexError: If no stone has been registered
+        """
+        index, previous_winner, merges = self._history.pop()
+        parent = self._parent
+        weight = self._weight
+        for root, attached in reversed(merges):
+            parent[attached] = attached
+            weight[root] -= weight[attached]
+        self._owner[index] = self.EMPTY
+        self._winner = previous_winner
@@ -1,11 +1,17 @@
+from collections import OrderedDict
+import threading
 import numpy as np
 from typing import Optional, List, Tuple
 
+from .hex_zobrist import HexZobrist
+from .hex_cell_table import HexCellTable
+
 
 class HexWinDetector:
     """
     HexWinDetector class for determining the winner in a Hex game.
-    Uses depth-first search (DFS) to find winning paths and implements caching for performance.
+    Uses an iterative depth-first search (DFS) to find winning paths and implements caching for performance.
+    Boards larger than LARGE_BOARD_THRESHOLD switch to vectorized NumPy component labeling.
     
     The board is represented as a numpy array where:
     - 0 represents an empty cell
@@ -13,42 +19,68 @@ class HexWinDetector:
     - 2 represents a red cell (player connecting top to bottom)
     
     The class provides both static methods for one-time checks and instance methods
-    with caching for repeated checks on the same board state.
+    with caching for repeated checks on the same board state. The cache is guarded by
+    a lock, so one detector can be shared by boards used from several threads.
     """
     EMPTY = 0
     BLUE = 1
     RED = 2
 
-    def __init__(self):
+    # Boards larger than this are handled by the vectorized large board mode
+    LARGE_BOARD_THRESHOLD = 32
+
+    # Hexagonal directions, in reverse order of exploration for the DFS stacks
+    _BLUE_DIRECTIONS = ((-1, -1), (-1, 0), (0, -1), (0, 1), (1, 1), (1, 0))
+    _RED_DIRECTIONS = ((-1, -1), (0, -1), (-1, 0), (1, 0), (1, 1), (0, 1))
+
+    def __init__(self, cache_size: int = 4096):
         """
         Initialize the HexWinDetector with an empty cache.
-        The cache stores the latest board state hash and its corresponding winner.
+        The cache is a bounded LRU mapping position hashes to their winner.
+
+        Args:
+            cache_size: Maximum number of positions kept in the cache
         """
-        self.cache_hash: Optional[int] = None
-        self.cache_result: Optional[int] = None
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[Tuple[int, ...], int], Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
 
-    def detect_winner(self, board_state: np.ndarray) -> Optional[int]:
+    def detect_winner(self, board_state: np.ndarray, position_hash: Optional[int] = None) -> Optional[int]:
         """
         Detect the winner on the board using caching for performance.
         
         Args:
             board_state: The current state of the board as a numpy array
+            position_hash: The Zobrist hash of the position when the caller already maintains it;
+                           computed from the board state otherwise
             
         Returns:
             Optional[int]: The winning player (BLUE=1, RED=2) or None if no winner
         """
-        board_hash = hash(board_state.tobytes())
-        
+        if position_hash is None:
+            position_hash = HexZobrist.for_size(max(board_state.shape)).hash_board(board_state)
+        key = (board_state.shape, position_hash)
+
         # Return cached result if available
-        if board_hash == self.cache_hash:
-            return self.cache_result
-            
-        # Calculate winner and update cache
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        # Calculate winner (outside the lock) and update cache, evicting the least recently used position
         winner = self.static_detect_winner(board_state)
-        self.cache_hash = board_hash
-        self.cache_result = winner
+        with self._lock:
+            self._cache[key] = winner
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
         return winner
 
+    def clear_cache(self) -> None:
+        """Remove every cached position."""
+        with self._lock:
+            self._cache.clear()
+
     @staticmethod
     def static_detect_winner(board_state: np.ndarray) -> Optional[int]:
         """
@@ -61,6 +93,12 @@ class HexWinDetector:
             Optional[int]: The winning player (BLUE=1, RED=2) or None if no winner
         """
         size = board_state.shape[0]
+
+        if size > HexWinDetector.LARGE_BOARD_THRESHOLD:
+            return HexWinDetector._static_vectorized_detect_winner(board_state)
+
+        if board_state.shape == (size, size):
+            return HexWinDetector._static_flat_detect_winner(board_state)
         
         if HexWinDetector._static_check_blue_win(board_state, size):
             return HexWinDetector.BLUE
@@ -116,98 +154,330 @@ class HexWinDetector:
     def _static_dfs_blue(board_state: np.ndarray, x: int, y: int, visited: np.ndarray, size: int) -> bool:
         """
         Static DFS for blue player to check if they have connected left to right.
+        Uses an explicit stack, so chain length is not bounded by the recursion limit.
         The order of checks is optimized for performance
         
         Args:
             board_state: The current state of the board
-            x, y: Current position coordinates
+            x, y: Starting position coordinates
             visited: Matrix tracking visited cells
             size: The size of the board
             
         Returns:
             bool: True if a winning path is found, False otherwise
         """
-        # Fast bounds check first
-        if x < 0 or x >= size or y < 0 or y >= size:
-            return False
-            
-        # Fast visited check second
-        if visited[x, y]:
-            return False
-        
-        # Mark as visited
-        visited[x, y] = True
-            
-        # Cell color check last (slower array access)
-        if board_state[x, y] != HexWinDetector.BLUE:
-            return False
-            
-        # Victory condition third (likely to be true when close to edge)
-        if x == size - 1:
-            return True
-        
-        # Try all possible directions in hexagonal grid
-        directions = [
-            (1, 0),    # right (priority)
-            (1, 1),    # up-right
-            (0, 1),    # up
-            (0, -1),   # down
-            (-1, 0),   # left
-            (-1, -1)   # down-left
-        ]
-        
-        for dx, dy in directions:
-            if HexWinDetector._static_dfs_blue(board_state, x + dx, y + dy, visited, size):
+        stack = [(x, y)]
+        while stack:
+            x, y = stack.pop()
+
+            # Fast bounds check first
+            if x < 0 or x >= size or y < 0 or y >= size:
+                continue
+
+            # Fast visited check second
+            if visited[x, y]:
+                continue
+
+            # Mark as visited
+            visited[x, y] = True
+
+            # Cell color check last (slower array access)
+            if board_state[x, y] != HexWinDetector.BLUE:
+                continue
+
+            # Victory condition third (likely to be true when close to edge)
+            if x == size - 1:
                 return True
-                
+
+            # Pushed in reverse priority order: right is explored first
+            for dx, dy in HexWinDetector._BLUE_DIRECTIONS:
+                stack.append((x + dx, y + dy))
+
         return False
 
     @staticmethod
     def _static_dfs_red(board_state: np.ndarray, x: int, y: int, visited: np.ndarray, size: int) -> bool:
         """
         Static DFS for red player to check if they have connected top to bottom.
+        Uses an explicit stack, so chain length is not bounded by the recursion limit.
         The order of checks is optimized for performance
         
         Args:
             board_state: The current state of the board
-            x, y: Current position coordinates
+            x, y: Starting position coordinates
             visited: Matrix tracking visited cells
             size: The size of the board
             
         Returns:
             bool: True if a winning path is found, False otherwise
         """
-        # Fast bounds check first
-        if x < 0 or x >= size or y < 0 or y >= size:
-            return False
-            
-        # Fast visited check second
-        if visited[x, y]:
-            return False
-            
-        # Mark as visited
-        visited[x, y] = True
-            
-        # Cell color check last (slower array access)
-        if board_state[x, y] != HexWinDetector.RED:
-            return False
+        stack = [(x, y)]
+        while stack:
+            x, y = stack.pop()
+
+            # Fast bounds check first
+            if x < 0 or x >= size or y < 0 or y >= size:
+                continue
+
+            # Fast visited check second
+            if visited[x, y]:
+                continue
+
+            # Mark as visited
+            visited[x, y] = True
+
+            # Cell color check last (slower array access)
+            if board_state[x, y] != HexWinDetector.RED:
+                continue
+
+            # Victory condition third (likely to be true when close to edge)
+            if y == size - 1:
+                return True
+
+            # Pushed in reverse priority order: up is explored first
+            for dx, dy in HexWinDetector._RED_DIRECTIONS:
+                stack.append((x + dx, y + dy))
+
+        return False
+
+    @staticmethod
+    def _static_flat_detect_winner(board_state: np.ndarray) -> Optional[int]:
+        """
+        Detect the winner on a square board with a flat search over the shared neighbour lists.
+        The board is converted to a Python list once, so the search never indexes numpy arrays.
+
+        Args:
+            board_state: The current state of the board as a square numpy array
+
+        Returns:
+            Optional[int]: The winning player (BLUE=1, RED=2) or None if no winner
+        """
+        table = HexCellTable.for_size(board_state.shape[0])
+        owners = board_state.ravel().tolist()
+
+        for player in (HexWinDetector.BLUE, HexWinDetector.RED):
+            if HexWinDetector._static_flat_connects(table, owners, player):
+                return player
+
+        return None
+
+    @staticmethod
+    def _static_flat_connects(table: HexCellTable, owners: List[int], player: int) -> bool:
+        """
+        Check if a player connects their two edges, with a flat search over the shared neighbour lists.
+
+        Args:
+            table: The cell tables of the board size
+            owners: The flat board state as a Python list
+            player: The player to check (BLUE=1, RED=2)
+
+        Returns:
+            bool: True if the player's stones connect their edges
+        """
+        neighbours = table.neighbours
+        ends = table.ends[player]
+        stack = [index for index in table.starts[player] if owners[index] == player]
+        visited = set(stack)
+        while stack:
+            index = stack.pop()
+            if index in ends:
+                return True
+            for neighbour in neighbours[index]:
+                if owners[neighbour] == player and neighbour not in visited:
+                    visited.add(neighbour)
+                    stack.append(neighbour)
+        return False
+
+    @staticmethod
+    def static_detect_full_board_winner(board_state: np.ndarray) -> int:
+        """
+        Detect the winner of a square board with no empty cell.
+        Hex has no draws, so exactly one player connects: only BLUE is searched.
+
+        Args:
+            board_state: The full board as a square numpy array
+
+        Returns:
+            int: The winning player (BLUE=1, RED=2)
+        """
+        table = HexCellTable.for_size(board_state.shape[0])
+        if HexWinDetector._static_flat_connects(table, board_state.ravel().tolist(), HexWinDetector.BLUE):
+            return HexWinDetector.BLUE
+        return HexWinDetector.RED
+
+    @staticmethod
+    def _label_components(stones: np.ndarray) -> np.ndarray:
+        """
+        Label the connected groups of a boolean stone mask in a few vectorized passes.
+
+        Every cell starts as its own root. Each pass hooks the larger root of every
+        edge joining two groups onto the smaller one, then shortcuts parent pointers
+        (pointer jumping) until every cell points at its root. Straight runs and
+        snakes collapse in O(log n) passes instead of one pass per cell of path.
+
+        Args:
+            stones: Boolean mask of shape (..., size, size); leading axes are independent boards
+
+        Returns:
+            np.ndarray: Flat array of root indices, one per cell of the mask
+        """
+        index = np.arange(stones.size).reshape(stones.shape)
+        sources, targets = [], []
+        # The three "forward" hexagonal directions: (1, 0), (0, 1) and (1, 1)
+        for head, tail in (((slice(None, -1), slice(None)), (slice(1, None), slice(None))),
+                           ((slice(None), slice(None, -1)), (slice(None), slice(1, None))),
+                           ((slice(None, -1), slice(None, -1)), (slice(1, None), slice(1, None)))):
+            head, tail = (Ellipsis,) + head, (Ellipsis,) + tail
+            linked = stones[head] & stones[tail]
+            sources.append(index[head][linked])
+            targets.append(index[tail][linked])
+
+        sources = np.concatenate(sources)
+        targets = np.concatenate(targets)
+        parent = np.arange(stones.size)
+
+        while True:
+            root_a = parent[sources]
+            root_b = parent[targets]
+            pending = root_a != root_b
+            if not pending.any():
+                return parent
+
+            # Edges whose ends already share a root never matter again
+            sources, targets = sources[pending], targets[pending]
+            root_a, root_b = root_a[pending], root_b[pending]
+            np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+
+            while True:
+                grand_parent = parent[parent]
+                if np.array_equal(grand_parent, parent):
+                    break
+                parent = grand_parent
+
+    @staticmethod
+    def _static_vectorized_detect_winner(board_state: np.ndarray) -> Optional[int]:
+        """
+        Large board mode: detect the winner with vectorized NumPy component labeling.
+        
+        Args:
+            board_state: The current state of the board as a numpy array
             
-        # Victory condition third (likely to be true when close to edge)
-        if y == size - 1:
-            return True
+        Returns:
+            Optional[int]: The winning player (BLUE=1, RED=2) or None if no winner
+        """
+        size = board_state.shape[0]
+
+        blue = board_state == HexWinDetector.BLUE
+        roots = HexWinDetector._label_components(blue).reshape(board_state.shape)
+        if np.intersect1d(roots[0][blue[0]], roots[size - 1][blue[size - 1]]).size:
+            return HexWinDetector.BLUE
+
+        red = board_state == HexWinDetector.RED
+        roots = HexWinDetector._label_components(red).reshape(board_state.shape)
+        if np.intersect1d(roots[:, 0][red[:, 0]], roots[:, size - 1][red[:, size - 1]]).size:
+            return HexWinDetector.RED
+
+        return None
+
+    @staticmethod
+    def _static_connected_boards(stones: np.ndarray) -> np.ndarray:
+        """
+        Check, for every board of a stack, if the stones connect x == 0 to x == size - 1.
+        Red connections are checked by passing the transposed stack, the hexagonal
+        neighbourhood being symmetric under transposition.
+
+        Up to 64 columns, each row is packed into a uint64 and the reached stones
+        grow by bit shifts, row by row, for all boards at once. Boards leave the
+        working set as soon as they connect or stop growing. Wider boards fall back
+        to component labeling.
         
-        # Try all possible directions in hexagonal grid
-        directions = [
-            (0, 1),    # up (priority)
-            (1, 1),    # up-right
-            (1, 0),    # right
-            (-1, 0),   # left
-            (0, -1),   # down
-            (-1, -1)   # down-left
-        ]
+        Args:
+            stones: Boolean stone masks of shape (N, size, size)
+            
+        Returns:
+            np.ndarray: Boolean array of shape (N,)
+        """
+        count, size = stones.shape[0], stones.shape[1]
+
+        if size > 64:
+            roots = HexWinDetector._label_components(stones).reshape(stones.shape)
+            touches_first = np.zeros(stones.size, dtype=bool)
+            touches_first[roots[:, 0][stones[:, 0]]] = True
+            touches_last = np.zeros(stones.size, dtype=bool)
+            touches_last[roots[:, -1][stones[:, -1]]] = True
+            return (touches_first & touches_last).reshape(count, -1).any(axis=1)
+
+        one = np.uint64(1)
+        weights = np.left_shift(one, np.arange(size, dtype=np.uint64))
+        rows = (stones * weights).sum(axis=2, dtype=np.uint64)
+
+        connected = np.zeros(count, dtype=bool)
+        active = np.flatnonzero(rows[:, 0])
+        rows = rows[active]
+        reached = np.zeros_like(rows)
+        reached[:, 0] = rows[:, 0]
+
+        while active.size:
+            # Same row (y +/- 1), previous row (x - 1: y and y - 1), next row (x + 1: y and y + 1)
+            grown = reached | (reached << one) | (reached >> one)
+            grown[:, 1:] |= reached[:, :-1] | (reached[:, :-1] << one)
+            grown[:, :-1] |= reached[:, 1:] | (reached[:, 1:] >> one)
+            grown &= rows
+
+            won = grown[:, -1] != 0
+            connected[active[won]] = True
+            keep = ~won & (grown != reached).any(axis=1)
+            active, rows, reached = active[keep], rows[keep], grown[keep]
+
+        return connected
+
+    @staticmethod
+    def detect_full_board_winners(boards: np.ndarray) -> np.ndarray:
+        """
+        Detect the winner of every board of a stack of full boards in one vectorized pass.
+        Hex has no draws, so exactly one player connects on each board: only BLUE is searched.
+
+        Args:
+            boards: Full board states of shape (N, size, size)
+
+        Returns:
+            np.ndarray: uint8 array of shape (N,) holding BLUE=1 or RED=2
+        """
+        boards = np.asarray(boards)
+        if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+            raise ValueError("boards must have the shape (N, size, size)")
+        if boards.shape[0] == 0:
+            return np.zeros(0, dtype=np.uint8)
+        blue_wins = HexWinDetector._static_connected_boards(boards == HexWinDetector.BLUE)
+        return np.where(blue_wins, HexWinDetector.BLUE, HexWinDetector.RED).astype(np.uint8)
+
+    @staticmethod
+    def detect_winners(boards: np.ndarray) -> np.ndarray:
+        """
+        Detect the winner of every board of a stack in one vectorized pass.
+        Blue is checked first, as in static_detect_winner.
         
-        for dx, dy in directions:
-            if HexWinDetector._static_dfs_red(board_state, x + dx, y + dy, visited, size):
-                return True
-                
-        return False
+        Args:
+            boards: Board states of shape (N, size, size)
+            
+        Returns:
+            np.ndarray: uint8 array of shape (N,) holding BLUE=1, RED=2 or EMPTY=0 when there is no winner
+        """
+        boards = np.asarray(boards)
+        if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+            raise ValueError("boards must have the shape (N, size, size)")
+
+        winners = np.zeros(boards.shape[0], dtype=np.uint8)
+        if boards.shape[0] == 0:
+            return winners
+
+        blue_wins = HexWinDetector._static_connected_boards(boards == HexWinDetector.BLUE)
+        winners[blue_wins] = HexWinDetector.BLUE
+
+        remaining = np.flatnonzero(~blue_wins)
+        if remaining.size:
+            red_stones = boards[remaining].transpose(0, 2, 1) == HexWinDetector.RED
+            red_wins = HexWinDetector._static_connected_boards(red_stones)
+            winners[remaining[red_wins]] = HexWinDetector.RED
+
+        return winners
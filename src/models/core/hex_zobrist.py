@@ -0,0 +1,77 @@
+from typing import Dict, List
+import numpy as np
+
+
+class HexZobrist:
+    """
+    Zobrist keys for Hex positions.
+
+    Every (player, cell) pair gets a random 64-bit key, and the hash of a position
+    is the XOR of the keys of its stones. Placing or removing a stone is a single
+    XOR, so boards can keep their hash up to date in add_move / undo_move.
+
+    Keys are drawn from a fixed seed per board size, so a given position has the
+    same hash in every process and every run (transposition tables, dataset
+    dedupe and disk caches can rely on it).
+    """
+    EMPTY = 0
+    BLUE = 1
+    RED = 2
+
+    SEED = 0x4E58
+
+    _cache: Dict[int, 'HexZobrist'] = {}
+
+    __slots__ = ('size', 'table', 'keys', 'red_to_move')
+
+    def __init__(self, size: int):
+        """
+        Draw the keys for a board size.
+
+        Args:
+            size: The size of the board (n x n)
+        """
+        rng = np.random.default_rng([self.SEED, size])
+        cells = size * size
+        self.size = size
+        # Row EMPTY is all zeros so that empty cells do not change the hash
+        self.table = np.zeros((3, cells), dtype=np.uint64)
+        self.table[1:] = rng.integers(1, 2 ** 64, size=(2, cells), dtype=np.uint64, endpoint=False)
+        self.keys: List[List[int]] = self.table.tolist()
+        # XORed in by hashes that must tell the side to move (position hashes leave it implicit)
+        self.red_to_move = int(rng.integers(1, 2 ** 64, dtype=np.uint64, endpoint=False))
+
+    @classmethod
+    def for_size(cls, size: int) -> 'HexZobrist':
+        """Get the shared keys for a board size."""
+        zobrist = cls._cache.get(size)
+        if zobrist is None:
+            zobrist = cls._cache[size] = cls(size)
+        return zobrist
+
+    def key(self, index: int, player: int) -> int:
+        """
+        Get the key of a stone.
+
+        Args:
+            index: Flat index of the cell (x * size + y)
+            player: The player owning the stone (BLUE=1, RED=2)
+
+        Returns:
+            int: The 64-bit key
+        """
+        return self.keys[player][index]
+
+    def hash_board(self, board_state: np.ndarray) -> int:
+        """
+        Compute the hash of a board state from scratch (vectorized).
+
+        Args:
+            board_state: The board state as a numpy array of at most size * size cells
+
+        Returns:
+            int: The 64-bit position hash
+        """
+        values = np.asarray(board_state).ravel()
+        stones = self.table[values, np.arange(values.size)]
+        return int(np.bitwise_xor.reduce(stones)) if stones.size else 0
@@ -52,11 +52,42 @@ class IHexBoard(ABC):
         """Get the size lenth of the square board."""
         pass
 
+    @property
+    @abstractmethod
+    def position_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the current position."""
+        pass
+
     @abstractmethod
     def get_board_state(self) -> np.ndarray:
         """Get the current board state as a numpy array."""
         pass
 
+    @abstractmethod
+    def board_view(self) -> np.ndarray:
+        """Get a read-only view of the current board state (no copy, follows later moves until the board is forked)."""
+        pass
+
+    @abstractmethod
+    def legal_mask(self) -> np.ndarray:
+        """Get a boolean (size, size) mask of the empty cells."""
+        pass
+
+    @abstractmethod
+    def empty_indices(self) -> np.ndarray:
+        """Get the flat indices (x * size + y) of the empty cells, in increasing order."""
+        pass
+
+    @abstractmethod
+    def stones(self, player: int) -> np.ndarray:
+        """Get a boolean (size, size) mask of the stones of a player."""
+        pass
+
+    @abstractmethod
+    def move_indices(self) -> np.ndarray:
+        """Get the flat indices of the played cells, in move order."""
+        pass
+
     @abstractmethod
     def is_valid_move(self, cell: HexCell) -> bool:
         """Check if a move is valid."""
@@ -97,6 +128,11 @@ class IHexBoard(ABC):
         """Get the board state at a specific move index."""
         pass
 
+    @abstractmethod
+    def get_history_tensor(self) -> np.ndarray:
+        """Get every position of the game as a (total moves + 1, size, size) array."""
+        pass
+
     @abstractmethod
     def get_total_moves(self) -> int:
         """Get the total number of moves made."""
@@ -117,6 +153,16 @@ class IHexBoard(ABC):
         """Get the list of all moves made on the board."""
         pass
 
+    @abstractmethod
+    def undo_move(self) -> 'IHexMove':
+        """Take back the last move made on the board and return it."""
+        pass
+
+    @abstractmethod
+    def fork(self) -> 'IHexBoard':
+        """Get an independent copy of the board in O(1), sharing storage until one of the two boards writes."""
+        pass
+
 
 # Interface for HexGameState (State Design Pattern)
 class IHexState(ABC):
@@ -228,6 +274,16 @@ class IHexGame(ABC):
         """Make a move on the board."""
         pass
 
+    @abstractmethod
+    def undo_move(self) -> IHexMove:
+        """Take back the last move made on the board."""
+        pass
+
+    @abstractmethod
+    def fork(self) -> 'IHexGame':
+        """Get an independent copy of the game whose board shares storage until one side writes."""
+        pass
+
     @abstractmethod
     def get_current_player(self) -> int:
         """Get the current player."""
@@ -0,0 +1,143 @@
+from typing import Optional
+import numpy as np
+
+from .interfaces import IHexBoard, IHexGame, GameEndReason
+from .hex_board import HexBoard
+from .hex_game import HexGame
+from .hex_state import ActiveState, FinishedState
+
+
+class SimHexGame:
+    """
+    Minimal game core for simulations (bots, playouts, self-play).
+
+    Moves are flat cell indices (x * size + y) played straight on a HexBoard:
+    no state machine, no clock, no HexMove objects and no exceptions. The
+    winner comes from the board's incremental connectivity structure, so each
+    move costs one union-find update. Play may continue after a win (e.g.
+    fill-the-board playouts); the first winner is kept.
+
+    The board is a regular IHexBoard, and games convert to and from HexGame
+    for persistence with from_game / to_game.
+    """
+    BLUE_PLAYER = 1
+    RED_PLAYER = 2
+
+    __slots__ = ('_board',)
+
+    def __init__(self, size: Optional[int] = None, board: Optional[HexBoard] = None):
+        """
+        Initialize a simulation on an empty board or on an existing HexBoard (used as is).
+
+        Args:
+            size: The size of the board (n x n), when no board is given
+            board: The board to play on
+
+        Raises:
+            ValueError: If neither a size nor a board is given
+        """
+        if board is None:
+            if size is None:
+                raise ValueError("Board size must be provided.")
+            board = HexBoard(size)
+        self._board = board
+
+    @classmethod
+    def from_board(cls, board: IHexBoard) -> 'SimHexGame':
+        """
+        Build a simulation from a copy of any board.
+
+        Args:
+            board: The board to start from (left untouched)
+
+        Returns:
+            SimHexGame: The new simulation
+        """
+        # fork first: HexBoard.to_hex_board returns the board itself
+        return cls(board=board.fork().to_hex_board())
+
+    @classmethod
+    def from_game(cls, game: IHexGame) -> 'SimHexGame':
+        """
+        Build a simulation from the position of a game.
+
+        Args:
+            game: The game to start from (left untouched)
+
+        Returns:
+            SimHexGame: The new simulation
+        """
+        return cls.from_board(game.board)
+
+    def to_game(self) -> HexGame:
+        """
+        Convert to a full HexGame holding a fork of the board.
+        A won simulation gives a finished game ended by victory, otherwise the game is active.
+
+        Returns:
+            HexGame: The game
+        """
+        winner = self.winner
+        if winner is not None:
+            return HexGame(self._board.fork(), FinishedState(), GameEndReason.VICTORY, winner)
+        return HexGame(self._board.fork(), ActiveState())
+
+    @property
+    def board(self) -> HexBoard:
+        """Get the board of the simulation."""
+        return self._board
+
+    @property
+    def size(self) -> int:
+        """Get the size of the board."""
+        return self._board.size
+
+    @property
+    def winner(self) -> Optional[int]:
+        """Get the winner (BLUE=1, RED=2) or None if nobody has connected yet."""
+        return self._board._connectivity.winner
+
+    @property
+    def total_moves(self) -> int:
+        """Get the number of moves played."""
+        return len(self._board._memory_board._cells)
+
+    @property
+    def current_player(self) -> int:
+        """Get the player to move (blue always starts)."""
+        return self.BLUE_PLAYER if self.total_moves % 2 == 0 else self.RED_PLAYER
+
+    def is_legal(self, cell_index: int) -> bool:
+        """Check if a flat cell index is on the board and empty."""
+        return 0 <= cell_index < len(self._board._memory_board._occupancy) \
+            and not self._board._memory_board._occupancy[cell_index]
+
+    def legal_moves(self) -> np.ndarray:
+        """Get the flat indices of the empty cells."""
+        return self._board.empty_indices()
+
+    def play(self, cell_index: int) -> Optional[int]:
+        """
+        Play the current player's stone on an empty cell.
+        Nothing is validated: the caller picks cell_index among legal_moves() (or checks is_legal).
+
+        Args:
+            cell_index: Flat index (x * size + y) of an empty cell
+
+        Returns:
+            Optional[int]: The winner after this move, or None if there is no winner
+        """
+        return self._board._play_index(cell_index)
+
+    def undo(self) -> int:
+        """
+        Take back the last move (there must be one).
+
+        Returns:
+            int: The flat index of the removed stone
+        """
+        return self._board._undo_index()
+
+    def fork(self) -> 'SimHexGame':
+        """Get an independent copy of the simulation in O(1) (copy-on-write board)."""
+        return SimHexGame(board=self._board.fork())
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 from src.models.data_management.saved_game import SavedGame
 from src.models.core.hex_game_factory import HexGameFactory
-from src.models.core.hex_move import HexMove
+from src.models.core.hex_game import HexGame
+from src.models.core.interfaces import GameEndReason
+from src.models.core.exceptions import GameOverError
+from src.models.core.hex_cell_table import HexCellTable
+from src.models.core.hex_symmetry import HexSymmetry
 
 
 class ReadGameMonitoring():
@@ -79,36 +83,35 @@ class ReadSGFV4(ReadGameStrategy):
         """
         Construit l'objet HexGame à partir des données récupérées dans le dictionnaire.
         """
-        # Creation de l'objet HexGame à l'aide d'une factory
-        hex_game_factory = HexGameFactory()
-        hex_game = hex_game_factory.create_game(board_size=board_size)
-
-        # A partir de maintenant on va construire la partie en la simulant
-        # On fait ça car la gestion des differentes erreurs possibles est implémentée
-
-        hex_game.start_game()
-
+        # On convertit d'abord tous les coups SGF en indices plats (x * taille + y)
+        sgf_index = HexCellTable.for_size(board_size).sgf_index
+        indices = []
+        winner = None
         for move in moves:
             for color, position in move.items():
+                if winner is not None:
+                    # aucun coup ne peut suivre un abandon
+                    raise GameOverError("The game is over.")
                 if position == "resign":
                     # cas d'abandon d'un joueur
-                    if color == "W":
-                        hex_game.resign_game(hex_game.RED_PLAYER)
-                    else:
-                        hex_game.resign_game(hex_game.BLUE_PLAYER)
+                    winner = HexGame.BLUE_PLAYER if color == "W" else HexGame.RED_PLAYER
                     break
                 elif position == "swap":
                     # On ne gère le swap dans notre implementation pour l'instant
                     raise ValueError("Le swap n'est pas pris en charge par notre application")
                 else:
-                    # On convertit la position SGF en coordonnées (x, y)
-                    x, y = ReadSGFV4.convert_sgf_to_coordinates(position, board_size)
-                    hex_move = HexMove((x, y))
-
-                    # On applique le mouvement
-                    hex_game.make_move(hex_move)
-
-        return hex_game
+                    index = sgf_index.get(position)
+                    if index is None:
+                        # majuscules ou position invalide : conversion complète
+                        x, y = ReadSGFV4.convert_sgf_to_coordinates(position, board_size)
+                        index = x * board_size + y
+                    indices.append(index)
+
+        # La partie est construite en une fois par la factory : les coups sont écrits ensemble,
+        # les doublons sont refusés, et le vainqueur est cherché sur la position finale et celle
+        # d'avant le dernier coup (un coup joué après une victoire est refusé)
+        return HexGameFactory.create_from_moves(board_size, indices, result=winner, verify="end",
+                                                game_end_reason=GameEndReason.RESIGN if winner else None)
 
     @staticmethod
     def convert_sgf_to_coordinates(position, board_size):
@@ -119,6 +122,11 @@ class ReadSGFV4(ReadGameStrategy):
         :return: Coordonnées (x, y) correspondantes.
         """
 
+        # Cas courant : lecture directe dans la table partagée de la taille du plateau
+        index = HexCellTable.for_size(board_size).sgf_index.get(position.lower())
+        if index is not None:
+            return divmod(index, board_size)
+
         # Cas standard pour les plateaux jusqu'à 26x26
         if len(position) != 2:
             raise ValueError(f"Position SGF invalide : {position}")
@@ -133,6 +141,24 @@ class ReadSGFV4(ReadGameStrategy):
 
         return row, col
 
+    @staticmethod
+    def convert_sgf_to_canonical_moves(moves, board_size):
+        """
+        Convertit les coups SGF d'une partie en sa séquence canonique d'indices plats (x * taille + y).
+        Une partie et sa rotation à 180 degrés donnent la même séquence, ce qui permet de dédoublonner
+        la bibliothèque. Les coups "resign" et "swap" sont ignorés.
+        :param moves: Liste des coups au format SGF (dictionnaires couleur -> position).
+        :param board_size: Taille du plateau.
+        :return: Tuple des indices canoniques.
+        """
+        indices = []
+        for move in moves:
+            for position in move.values():
+                if position not in ("resign", "swap"):
+                    x, y = ReadSGFV4.convert_sgf_to_coordinates(position, board_size)
+                    indices.append(x * board_size + y)
+        return HexSymmetry.for_size(board_size).canonical_moves(indices)[0]
+
 
 class ReadOther(ReadGameStrategy):
     def read_game(self, dictionary: dict) -> SavedGame:
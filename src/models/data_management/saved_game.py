@@ -38,6 +38,18 @@ class SavedGame:
         if winner is None:
             self._winner = "blue" if self.game.winner == 1 else "red"
 
+    def __getstate__(self):
+        """
+        Sérialisation compacte : la partie, les joueurs et les métadonnées, sans dictionnaire d'attributs.
+        Le compteur d'identifiants n'est pas modifié au chargement.
+        """
+        return (self._game, self._blue_player, self._red_player, self._winner, self._name, self._id,
+                self._date_time)
+
+    def __setstate__(self, state):
+        (self._game, self._blue_player, self._red_player, self._winner, self._name, self._id,
+         self._date_time) = state
+
     # Getters et setters
     @property
     def game(self):
@@ -1,6 +1,6 @@
 import asyncio
 from collections import deque
-from typing import List, Set, Any
+from typing import List, Optional, Set, Any
 from .interfaces import IGameManager, ICommand, IPlayer
 from .exceptions import GameAlreadyStartedError, GameNotStartedError
 from .command import CommandResult, PauseCommand, ResumeCommand
@@ -30,6 +30,9 @@ class GameManager(IGameManager):
         self.running = False
         self.blue_player_name = blue_player_name if blue_player_name is not None else "BluePlayer"
         self.red_player_name = red_player_name if red_player_name is not None else "RedPlayer"
+        # Set when a command arrives or the manager stops, while the main loop runs
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def add_command(self, command: ICommand) -> None:
         """Add a command to the command queue.
@@ -38,6 +41,13 @@ class GameManager(IGameManager):
             command: The command to add.
         """
         self.command_queue.append(command)
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake the main loop up if it waits for commands (safe from any thread)."""
+        loop, wakeup = self._loop, self._wakeup
+        if wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
 
     async def start(self) -> None:
         """Start the game manager's main loop.
@@ -49,12 +59,19 @@ class GameManager(IGameManager):
             raise GameAlreadyStartedError("Game is already running")
             
         self.running = True
-        while self.running:
-            if self.command_queue:
-                command = self.command_queue.popleft()
-                await self.execute_command(command)
-            else:
-                await asyncio.sleep(0.05)  # Small delay to prevent CPU overuse
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        try:
+            while self.running:
+                if self.command_queue:
+                    command = self.command_queue.popleft()
+                    await self.execute_command(command)
+                else:
+                    # Sleep until add_command or stop sets the event
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+        finally:
+            self._loop = self._wakeup = None
 
     async def execute_command(self, command: ICommand) -> None:
         """Execute a command and notify observers.
@@ -69,6 +86,7 @@ class GameManager(IGameManager):
     def stop(self) -> None:
         """Stop the game manager's main loop."""
         self.running = False
+        self._wake()
 
     def get_current_player(self) -> str:
         """Get the current player.
@@ -170,9 +170,10 @@ class Player(IPlayer):
         ]
 
     def get_valid_moves(self) -> List[Tuple[int, int]]:
-        """Get all valid moves for the current player."""
+        """Get all valid moves for the current player, as (x, y) coordinates of the empty cells."""
         self._check_attached()
-        return self._game_manager.game_board.board.get_moves()
+        board = self._game_manager.game_board.board
+        return [divmod(index, board.size) for index in board.empty_indices().tolist()]
 
     def get_player_stats(self) -> Dict[str, Any]:
         """Get statistics about the player's performance."""
@@ -194,9 +195,10 @@ class Player(IPlayer):
         return (self._game_manager.game_board.game_end_reason, winner_name)
 
     def is_move_valid(self, x: int, y: int) -> bool:
-        """Check if a move is valid."""
+        """Check if a move is valid (inside the board and on an empty cell), without raising."""
         self._check_attached()
-        return self._game_manager.game_board.board.is_valid_move(HexCell(x, y))
+        board = self._game_manager.game_board.board
+        return 0 <= x < board.size and 0 <= y < board.size and board.board_view()[x, y] == board.EMPTY
 
     def set_notification_callback(self, callback):
         """Set a callback to be called when the player receives a notification."""
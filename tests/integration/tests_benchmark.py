@@ -1,7 +1,18 @@
 import pytest
 import os
+import pickle
+import random
+import time
+import numpy as np
 from tests.conftest import client
 from werkzeug.datastructures import FileStorage
+from src.models.core import (HexBoard, BitHexBoard, HexMove, HexWinDetector, HexGame, SimHexGame, HexCellTable,
+                             TimedHexGame)
+from src.models.data_management.read_game import ReadSGFV4
+from src.models.ai import (MCTSStrategy, RandomStrategy, ShortestPathStrategy, RolloutEngine, ParallelSearch,
+                           ParallelStrategy, SharedTranspositionTable, ShortestPathEvaluator, TwoDistanceEvaluator,
+                           ResistanceEvaluator, AlphaBetaStrategy, TimeManager, HSearch, DFPNSolver,
+                           SolvedPositionStore)
 
 
 def test_benchmark_games_reading(benchmark, client):
@@ -34,3 +45,525 @@ def test_benchmark_index(client, benchmark):
     """Benchmark de la route '/' (Page d'accueil)"""
     result = benchmark(client.get, '/')
     assert benchmark.stats["mean"] < 0.1
+
+
+def _random_cells(size, count, seed=0):
+    """Liste de cases distinctes tirées aléatoirement (reproductible)"""
+    rng = random.Random(seed)
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    rng.shuffle(cells)
+    return cells[:count]
+
+
+def _replay_incremental(size, cells, board_class=HexBoard):
+    """Rejoue les coups en interrogeant la détection incrémentale du plateau"""
+    board = board_class(size)
+    for cell in cells:
+        board.add_move(HexMove(cell))
+        board.get_winner()
+    return board
+
+
+def _replay_full_detection(size, cells):
+    """Rejoue les coups en relançant une détection complète à chaque coup (ancien comportement)"""
+    board = HexBoard(size)
+    for cell in cells:
+        board.add_move(HexMove(cell))
+        HexWinDetector.static_detect_winner(board.get_board_state())
+    return board
+
+
+@pytest.mark.parametrize("size,count", [(11, 121), (19, 361), (255, 400)])
+def test_benchmark_incremental_winner(benchmark, size, count):
+    """Benchmark de la détection de victoire incrémentale (union-find) coup par coup"""
+    cells = _random_cells(size, count)
+    benchmark(_replay_incremental, size, cells)
+
+
+@pytest.mark.parametrize("size,count", [(11, 121), (19, 361), (255, 400)])
+def test_benchmark_full_winner_detection(benchmark, size, count):
+    """Benchmark de référence : DFS complet après chaque coup"""
+    cells = _random_cells(size, count)
+    benchmark(_replay_full_detection, size, cells)
+
+
+@pytest.mark.parametrize("size,count", [(11, 121), (19, 361), (255, 400)])
+def test_benchmark_bit_board_winner(benchmark, size, count):
+    """Benchmark du plateau bitboard (remplissage par dilatation de masques)"""
+    cells = _random_cells(size, count)
+    benchmark(_replay_incremental, size, cells, BitHexBoard)
+
+
+def _snake_board(size):
+    """Chaîne bleue unique en zigzag : pire cas pour un parcours case par case"""
+    board = np.zeros((size, size), dtype=np.uint8)
+    for x in range(size):
+        if x % 2 == 0:
+            board[x, :] = 1
+        else:
+            board[x, size - 1 if x % 4 == 1 else 0] = 1
+    return board
+
+
+@pytest.mark.parametrize("size", [31, 128, 255])
+def test_benchmark_snake_iterative_dfs(benchmark, size):
+    """Benchmark du DFS itératif sur une chaîne serpent"""
+    board = _snake_board(size)
+    assert benchmark(HexWinDetector._static_check_blue_win, board, size)
+
+
+@pytest.mark.parametrize("size", [31, 128, 255])
+def test_benchmark_snake_large_board_mode(benchmark, size):
+    """Benchmark du mode grand plateau (étiquetage vectorisé) sur une chaîne serpent"""
+    board = _snake_board(size)
+    assert benchmark(HexWinDetector._static_vectorized_detect_winner, board) == 1
+
+
+def _random_full_boards(count, size, seed=0):
+    """Pile de plateaux pleins tirés aléatoirement"""
+    rng = np.random.default_rng(seed)
+    return rng.integers(1, 3, (count, size, size)).astype(np.uint8)
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_detect_winners_batch(benchmark, size):
+    """Benchmark de la détection vectorisée sur 10 000 plateaux"""
+    boards = _random_full_boards(10000, size)
+    benchmark(HexWinDetector.detect_winners, boards)
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_detect_winners_loop(benchmark, size):
+    """Benchmark de référence : boucle Python sur static_detect_winner (10 000 plateaux)"""
+    boards = _random_full_boards(10000, size)
+    benchmark.pedantic(lambda: [HexWinDetector.static_detect_winner(board) for board in boards], rounds=3)
+
+
+def _midgame_board(size, count):
+    """Plateau en milieu de partie et liste de ses cases libres"""
+    cells = _random_cells(size, size * size)
+    board = HexBoard(size)
+    for cell in cells[:count]:
+        board.add_move(HexMove(cell))
+    return board, cells[count:]
+
+
+def _explore_with_undo(board, candidates):
+    """Explore chaque coup candidat par coup / retour arrière sur le même plateau"""
+    for cell in candidates:
+        board.add_move(HexMove(cell))
+        board.get_winner()
+        board.undo_move()
+
+
+def _explore_with_replay(board, candidates):
+    """Explore chaque coup candidat en reconstruisant le plateau depuis get_moves()"""
+    moves = board.get_moves()
+    for cell in candidates:
+        copy = HexBoard(board.size)
+        for move in moves:
+            copy.add_move(move)
+        copy.add_move(HexMove(cell))
+        copy.get_winner()
+
+
+@pytest.mark.parametrize("size,count", [(11, 60), (19, 180)])
+def test_benchmark_explore_undo(benchmark, size, count):
+    """Benchmark de l'exploration des coups fils avec undo_move"""
+    board, candidates = _midgame_board(size, count)
+    benchmark(_explore_with_undo, board, candidates)
+
+
+@pytest.mark.parametrize("size,count", [(11, 60), (19, 180)])
+def test_benchmark_explore_replay(benchmark, size, count):
+    """Benchmark de référence : copie et rejeu de la partie pour chaque coup fils"""
+    board, candidates = _midgame_board(size, count)
+    benchmark(_explore_with_replay, board, candidates)
+
+
+def _all_states_at_move(board):
+    """Parcourt toutes les positions d'une partie comme le mode replay"""
+    for move_index in range(board.get_total_moves() + 1):
+        board.get_board_state_at_move(move_index)
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_states_at_move(benchmark, size):
+    """Benchmark de get_board_state_at_move sur toutes les positions d'une partie"""
+    board, _ = _midgame_board(size, size * size)
+    benchmark(_all_states_at_move, board)
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_history_tensor(benchmark, size):
+    """Benchmark de get_history_tensor (toutes les positions en une fois)"""
+    board, _ = _midgame_board(size, size * size)
+    benchmark(board.get_history_tensor)
+
+
+def _hex_game_playout(size, order):
+    """Partie aléatoire jouée avec HexGame.make_move jusqu'à la victoire"""
+    game = HexGame(HexBoard(size))
+    game.start_game()
+    for index in order:
+        game.make_move(HexMove((index // size, index % size)))
+        if game.is_game_over():
+            break
+    return game
+
+
+def _sim_hex_game_playout(size, order):
+    """Même partie jouée avec SimHexGame.play"""
+    game = SimHexGame(size)
+    for index in order:
+        if game.play(index) is not None:
+            break
+    return game
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_hex_game_playout(benchmark, size):
+    """Benchmark de référence : coups par seconde avec HexGame"""
+    order = [int(i) for i in np.random.default_rng(0).permutation(size * size)]
+    game = benchmark(_hex_game_playout, size, order)
+    if benchmark.stats:
+        benchmark.extra_info["moves_per_second"] = game.board.get_total_moves() / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_sim_hex_game_playout(benchmark, size):
+    """Benchmark des coups par seconde avec SimHexGame"""
+    order = [int(i) for i in np.random.default_rng(0).permutation(size * size)]
+    game = benchmark(_sim_hex_game_playout, size, order)
+    if benchmark.stats:
+        benchmark.extra_info["moves_per_second"] = game.total_moves / benchmark.stats["mean"]
+
+
+def _pickle_round_trip(obj):
+    """Aller-retour pickle, comme pour un envoi vers un processus de travail"""
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_pickle_game(benchmark, size):
+    """Benchmark de la sérialisation compacte d'une partie (taille en octets dans extra_info)"""
+    board, _ = _midgame_board(size, size * size // 2)
+    game = HexGame(board)
+    benchmark.extra_info["pickle_bytes"] = len(pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL))
+    benchmark(_pickle_round_trip, game)
+
+
+def _sgf_record(size, seed=0):
+    """Coups SGF d'une partie aléatoire arrêtée au coup gagnant"""
+    cells = HexCellTable.for_size(size)
+    state = np.zeros((size, size), dtype=np.uint8)
+    moves = []
+    for number, index in enumerate(np.random.default_rng(seed).permutation(size * size).tolist()):
+        state[divmod(index, size)] = 1 if number % 2 == 0 else 2
+        moves.append({"W" if number % 2 == 0 else "B": cells.sgf[index]})
+        if HexWinDetector.static_detect_winner(state) is not None:
+            return moves
+
+
+def _make_game_move_by_move(size, moves):
+    """Import de référence : un make_move par coup"""
+    game = HexGame(HexBoard(size))
+    game.start_game()
+    for move in moves:
+        for position in move.values():
+            game.make_move(HexMove(ReadSGFV4.convert_sgf_to_coordinates(position, size)))
+    return game
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_import_move_by_move(benchmark, size):
+    """Benchmark de référence : import d'une partie SGF coup par coup"""
+    benchmark(_make_game_move_by_move, size, _sgf_record(size))
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_import_batch(benchmark, size):
+    """Benchmark de l'import d'une partie SGF par ReadSGFV4.make_game (HexGameFactory.create_from_moves)"""
+    benchmark(ReadSGFV4.make_game, size, _sgf_record(size))
+
+
+@pytest.mark.parametrize("size", [7, 11])
+def test_benchmark_mcts_playouts(benchmark, size):
+    """Benchmark des playouts MCTS par seconde (remplissage du plateau, un seul test de victoire)"""
+    player = MCTSStrategy("1", "mcts", True, playouts=500, seed=0)
+    benchmark.pedantic(player.search, args=(HexBoard(size),), rounds=3)
+    if benchmark.stats:
+        benchmark.extra_info["playouts_per_second"] = 500 / benchmark.stats["mean"]
+
+
+def _play_ai_game(blue, red, size):
+    """Partie complète entre deux joueurs IA, renvoie le vainqueur"""
+    game = HexGame(HexBoard(size))
+    game.start_game()
+    while not game.is_game_over():
+        player = blue if game.get_current_player() == HexGame.BLUE_PLAYER else red
+        game.make_move(HexMove(player.select_move(game)))
+    return game.winner
+
+
+@pytest.mark.parametrize("opponent", [RandomStrategy, ShortestPathStrategy])
+def test_benchmark_mcts_win_rate(benchmark, opponent):
+    """Taux de victoire de MCTS (300 playouts par coup, 7x7) contre les stratégies existantes, couleurs alternées"""
+    def match():
+        wins = 0
+        for game_number in range(10):
+            mcts_is_blue = game_number % 2 == 0
+            mcts = MCTSStrategy("1", "mcts", mcts_is_blue, playouts=300, seed=game_number)
+            other = opponent("2", "other", not mcts_is_blue, 0)
+            winner = _play_ai_game(mcts, other, 7) if mcts_is_blue else _play_ai_game(other, mcts, 7)
+            wins += winner == (HexGame.BLUE_PLAYER if mcts_is_blue else HexGame.RED_PLAYER)
+        return wins / 10
+    benchmark.extra_info["win_rate"] = benchmark.pedantic(match, rounds=1)
+
+
+def _loop_rollouts(state, count, player):
+    """Référence : une complétion à la fois avec MCTSStrategy._playout"""
+    flat = state.ravel()
+    return [player._playout(flat.copy(), 1, state.shape[0]) for _ in range(count)]
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_rollouts_loop(benchmark, size):
+    """Benchmark de référence : 1024 complétions aléatoires en boucle Python"""
+    player = MCTSStrategy("1", "mcts", True, seed=0)
+    benchmark.pedantic(_loop_rollouts, args=(np.zeros((size, size), dtype=np.uint8), 1024, player), rounds=3)
+    if benchmark.stats:
+        benchmark.extra_info["rollouts_per_second"] = 1024 / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("size", [11, 19])
+def test_benchmark_rollouts_vectorized(benchmark, size):
+    """Benchmark de 1024 complétions aléatoires simulées ensemble par RolloutEngine"""
+    engine = RolloutEngine(seed=0)
+    benchmark.pedantic(engine.run, args=(np.zeros((size, size), dtype=np.uint8), 1024), rounds=3)
+    if benchmark.stats:
+        benchmark.extra_info["rollouts_per_second"] = 1024 / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_benchmark_parallel_search_scaling(benchmark, workers):
+    """
+    Passage à l'échelle de la recherche parallèle à la racine : playouts par seconde (tous processus
+    confondus) et taux de victoire contre un MCTS mono-processus au même temps par coup (7x7, 100 ms)
+    """
+    with ParallelSearch(MCTSStrategy, workers=workers, sizes=(7, 11), seed=0, playouts=None,
+                        time_limit_ms=10000) as driver:
+        result = benchmark.pedantic(driver.search, args=(HexBoard(11),), kwargs={"time_limit_ms": 500}, rounds=1)
+        benchmark.extra_info["playouts_per_second"] = result.total_visits / 0.5
+
+        wins = 0
+        for game_number in range(4):
+            parallel_is_blue = game_number % 2 == 0
+            parallel = ParallelStrategy("1", "parallel", parallel_is_blue, time_limit_ms=100, driver=driver)
+            single = MCTSStrategy("2", "single", not parallel_is_blue, playouts=None, time_limit_ms=100,
+                                  seed=game_number)
+            if parallel_is_blue:
+                winner = _play_ai_game(parallel, single, 7)
+            else:
+                winner = _play_ai_game(single, parallel, 7)
+            wins += winner == (HexGame.BLUE_PLAYER if parallel_is_blue else HexGame.RED_PLAYER)
+        benchmark.extra_info["win_rate_vs_single"] = wins / 4
+
+
+def _table_round_trip(table, keys):
+    for key in keys:
+        table.store(key, 100, 0.5, 3, 1)
+    for key in keys:
+        table.lookup(key)
+
+
+def test_benchmark_transposition_table(benchmark):
+    """Benchmark de 10 000 écritures et lectures dans la table de transposition partagée"""
+    keys = np.random.default_rng(0).integers(0, 2 ** 63, size=10000).tolist()
+    with SharedTranspositionTable(buckets=1 << 16) as table:
+        benchmark.pedantic(_table_round_trip, args=(table, keys), rounds=3)
+        if benchmark.stats:
+            benchmark.extra_info["operations_per_second"] = 20000 / benchmark.stats["mean"]
+        benchmark.extra_info["table_bytes"] = table.nbytes
+
+
+@pytest.mark.parametrize("shared_table", [False, True])
+def test_benchmark_parallel_search_transposition_table(benchmark, shared_table):
+    """
+    Recherche parallèle à la racine avec ou sans table de transposition partagée :
+    taux de victoire contre un MCTS mono-processus au même temps par coup (7x7, 100 ms)
+    """
+    with SharedTranspositionTable() as table:
+        with ParallelSearch(MCTSStrategy, workers=2, sizes=(7,), seed=0, playouts=None, time_limit_ms=10000,
+                            transposition_table=table if shared_table else None) as driver:
+            def match():
+                wins = 0
+                for game_number in range(4):
+                    parallel_is_blue = game_number % 2 == 0
+                    parallel = ParallelStrategy("1", "parallel", parallel_is_blue, time_limit_ms=100, driver=driver)
+                    single = MCTSStrategy("2", "single", not parallel_is_blue, playouts=None, time_limit_ms=100,
+                                          seed=game_number)
+                    if parallel_is_blue:
+                        winner = _play_ai_game(parallel, single, 7)
+                    else:
+                        winner = _play_ai_game(single, parallel, 7)
+                    wins += winner == (HexGame.BLUE_PLAYER if parallel_is_blue else HexGame.RED_PLAYER)
+                return wins / 4
+            benchmark.extra_info["win_rate_vs_single"] = benchmark.pedantic(match, rounds=1)
+            benchmark.extra_info["entries"] = len(table)
+
+
+def _random_position(size, stones, seed=0):
+    """Position aléatoire de `stones` pierres (bleu commence)"""
+    state = np.zeros(size * size, dtype=np.uint8)
+    order = np.random.default_rng(seed).permutation(size * size)[:stones]
+    state[order[0::2]] = 1
+    state[order[1::2]] = 2
+    return state.reshape(size, size)
+
+
+def _evaluate_moves_one_by_one(evaluator, state, player):
+    indices = np.flatnonzero(state.ravel() == 0)
+    return [evaluator.evaluate_moves(state, indices[i:i + 1], player) for i in range(len(indices))]
+
+
+@pytest.mark.parametrize("evaluator", [ShortestPathEvaluator, TwoDistanceEvaluator, ResistanceEvaluator])
+@pytest.mark.parametrize("batched", [False, True])
+def test_benchmark_connection_evaluators(benchmark, evaluator, batched):
+    """Benchmark de l'évaluation de tous les coups d'une position 11x11 (un seul lot ou un coup à la fois)"""
+    state = _random_position(11, 30)
+    evaluator = evaluator()
+    if batched:
+        indices = np.flatnonzero(state.ravel() == 0)
+        benchmark.pedantic(evaluator.evaluate_moves, args=(state, indices, 1), rounds=3)
+    else:
+        benchmark.pedantic(_evaluate_moves_one_by_one, args=(evaluator, state, 1), rounds=3)
+
+
+@pytest.mark.parametrize("size", [7, 11])
+def test_benchmark_alpha_beta_nodes(benchmark, size):
+    """Benchmark des nœuds par seconde de l'alpha-beta (approfondissement itératif, 0,5 s par coup)"""
+    player = AlphaBetaStrategy("1", "ab", True)
+    benchmark.pedantic(player.search, args=(HexBoard(size), 0.5), rounds=3)
+    if benchmark.stats:
+        benchmark.extra_info["nodes_per_second"] = player.nodes / benchmark.stats["mean"]
+    benchmark.extra_info["depth"] = player.depth
+
+
+def test_benchmark_alpha_beta_time_accuracy(benchmark):
+    """
+    Précision de la gestion du temps : rapport entre le temps de réflexion réel et le budget
+    sur une partie 9x9 à 10 s par joueur, et temps restant en fin de partie
+    """
+    def timed_game():
+        game = TimedHexGame(HexGame(HexBoard(9)), initial_time=10.0)
+        game.start_game()
+        players = {HexGame.BLUE_PLAYER: AlphaBetaStrategy("1", "blue", True, time_manager=TimeManager()),
+                   HexGame.RED_PLAYER: AlphaBetaStrategy("2", "red", False, time_manager=TimeManager())}
+        ratios = []
+        while not game.is_game_over():
+            current = game.get_current_player()
+            budget = players[current].time_manager.think_time(game, current)
+            start = time.perf_counter()
+            cell = players[current].select_move(game)
+            ratios.append((time.perf_counter() - start) / budget)
+            game.make_move(HexMove(cell))
+        return ratios, min(game.get_remaining_time(player) for player in players)
+    ratios, remaining = benchmark.pedantic(timed_game, rounds=1)
+    benchmark.extra_info["mean_time_ratio"] = float(np.mean(ratios))
+    benchmark.extra_info["max_time_ratio"] = float(np.max(ratios))
+    benchmark.extra_info["min_remaining_time"] = remaining
+
+
+@pytest.mark.parametrize("size", [7, 11])
+def test_benchmark_h_search(benchmark, size):
+    """
+    Benchmark de la recherche des connexions virtuelles des deux joueurs (positions de 20 pierres,
+    sans cache), et réduction du nombre de coups à la racine par la zone à jouer
+    """
+    states = [_random_position(size, 20, seed) for seed in range(5)]
+
+    def search_all():
+        search = HSearch(cache_size=0)
+        for state in states:
+            search.connections(state, 1)
+            search.connections(state, 2)
+    benchmark.pedantic(search_all, rounds=3)
+    search = HSearch()
+    if benchmark.stats:
+        benchmark.extra_info["seconds_per_position"] = benchmark.stats["mean"] / len(states)
+    benchmark.extra_info["must_play_fraction"] = float(np.mean(
+        [search.must_play(state).sum() / np.count_nonzero(state == 0) for state in states]))
+
+
+@pytest.mark.parametrize("size", [4, 5])
+def test_benchmark_dfpn_empty_board(benchmark, size):
+    """Benchmark de la résolution exacte du plateau vide (DFPN, sans base de positions)"""
+    def solve():
+        solver = DFPNSolver()
+        return solver.solve(np.zeros((size, size), dtype=np.uint8)), solver.nodes
+    result, nodes = benchmark.pedantic(solve, rounds=1)
+    benchmark.extra_info["winner"] = result.winner
+    benchmark.extra_info["nodes"] = nodes
+
+
+def test_benchmark_dfpn_store(benchmark):
+    """
+    Benchmark de la résolution de positions 7x7 de 24 pierres, puis des positions qui suivent
+    le coup gagnant et une réponse, avec la base de positions résolues (taux de succès de la base)
+    """
+    states = [_random_position(7, 24, seed) for seed in range(10)]
+
+    def solve_all():
+        with SolvedPositionStore() as store:
+            solver = DFPNSolver(store)
+            results = [solver.solve(state) for state in states]
+            answered = []
+            for state, result in zip(states, results):
+                if result.move < 0:
+                    continue
+                child = state.ravel().copy()
+                child[result.move] = result.to_move
+                for reply in np.flatnonzero(child == 0)[:5].tolist():
+                    grandchild = child.copy()
+                    grandchild[reply] = 3 - result.to_move
+                    answered.append(DFPNSolver(store).solve(grandchild.reshape(7, 7)).from_store)
+            return float(np.mean(answered)), store.hit_rate
+    positions_hit_rate, hit_rate = benchmark.pedantic(solve_all, rounds=1)
+    if benchmark.stats:
+        benchmark.extra_info["seconds_per_position"] = benchmark.stats["mean"] / len(states)
+    benchmark.extra_info["positions_from_store"] = positions_hit_rate
+    benchmark.extra_info["store_hit_rate"] = hit_rate
+
+
+def test_benchmark_mcts_pondering(benchmark):
+    """
+    Taux de victoire d'un MCTS qui réfléchit pendant le tour de l'adversaire contre le même MCTS
+    sans réflexion (300 playouts par coup, 7x7, couleurs alternées), et temps moyen par coup de chacun
+    """
+    def match():
+        wins, times = 0, {True: [], False: []}
+        for game_number in range(10):
+            ponder_is_blue = game_number % 2 == 0
+            players = {ponder_is_blue: MCTSStrategy("1", "ponder", ponder_is_blue, playouts=300, seed=game_number),
+                       not ponder_is_blue: MCTSStrategy("2", "plain", not ponder_is_blue, playouts=300,
+                                                        seed=100 + game_number)}
+            pondering = players[ponder_is_blue]
+            game = HexGame(HexBoard(7))
+            game.start_game()
+            while not game.is_game_over():
+                is_blue = game.get_current_player() == HexGame.BLUE_PLAYER
+                start = time.perf_counter()
+                game.make_move(HexMove(players[is_blue].select_move(game)))
+                elapsed = time.perf_counter() - start
+                times[is_blue == ponder_is_blue].append(elapsed)
+                if is_blue == ponder_is_blue and not game.is_game_over():
+                    # Pondering lasts as long as a move (the opponent thinks as long)
+                    end = time.perf_counter() + elapsed
+                    pondering.ponder(game.board, lambda: time.perf_counter() > end)
+            wins += game.winner == (HexGame.BLUE_PLAYER if ponder_is_blue else HexGame.RED_PLAYER)
+        return wins / 10, float(np.mean(times[True])), float(np.mean(times[False]))
+    win_rate, ponder_time, plain_time = benchmark.pedantic(match, rounds=1)
+    benchmark.extra_info["win_rate"] = win_rate
+    benchmark.extra_info["ponder_move_seconds"] = ponder_time
+    benchmark.extra_info["plain_move_seconds"] = plain_time
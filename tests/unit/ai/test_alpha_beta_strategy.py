@@ -0,0 +1,109 @@
+import pytest
+import time
+import numpy as np
+
+from src.models.ai import AlphaBetaStrategy, ShortestPathEvaluator, TimeManager
+from src.models.core import HexBoard, HexCell, HexGame, HexGeometry, HexMove, HexWinDetector, TimedHexGame
+
+
+def _game(size, cells):
+    """Active game after the given moves (blue first)."""
+    game = HexGame(HexBoard(size))
+    game.start_game()
+    for cell in cells:
+        game.make_move(HexMove(HexCell(*cell)))
+    return game
+
+
+def _negamax(board, depth, ply):
+    """Plain negamax with the evaluation of AlphaBetaStrategy, without pruning or tables."""
+    evaluator = ShortestPathEvaluator()
+    size = board.size
+    prior = -HexGeometry.for_size(size).centre_distance * 1e-3
+    moves = board.empty_indices()
+    player = 1 if board.get_total_moves() % 2 == 0 else 2
+    if depth == 1 or len(moves) == 1:
+        boards = np.repeat(board.board_view().reshape(1, -1), len(moves), axis=0)
+        boards[np.arange(len(moves)), moves] = player
+        boards = boards.reshape(-1, size, size)
+        won = HexWinDetector.detect_winners(boards) == player
+        scores = evaluator.measure(boards, 3 - player) - evaluator.measure(boards, player)
+        return float((np.where(won, AlphaBetaStrategy.WIN_SCORE - ply - 1, scores) + prior[moves]).max())
+    best = -np.inf
+    for move in moves.tolist():
+        if board._play_index(move) is not None:
+            score = AlphaBetaStrategy.WIN_SCORE - ply - 1
+        else:
+            score = -_negamax(board, depth - 1, ply + 1)
+        board._undo_index()
+        best = max(best, score)
+    return best
+
+
+def test_plays_winning_move():
+    """Test that the search completes a connection when it can."""
+    game = _game(3, [(0, 0), (1, 1), (1, 0), (2, 1)])
+    player = AlphaBetaStrategy("1", "ab", True, time_manager=TimeManager(move_time=1.0))
+    assert player.select_move(game) == HexCell(2, 0)
+    assert player.score >= AlphaBetaStrategy.WIN_SCORE / 2
+
+
+def test_blocks_losing_move():
+    """Test that the search blocks a connection that would win at once."""
+    game = _game(3, [(0, 0), (1, 0), (2, 2), (1, 1)])
+    player = AlphaBetaStrategy("1", "ab", True, max_depth=2)
+    assert player.select_move(game) == HexCell(1, 2)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_plain_negamax(seed):
+    """Test that pruning, tables, move ordering and aspiration windows do not change the score."""
+    rng = np.random.default_rng(seed)
+    board = HexBoard(4)
+    for index in rng.permutation(16)[:4].tolist():
+        board._play_index(index)
+    for depth in (2, 3):
+        player = AlphaBetaStrategy("1", "ab", True, max_depth=depth)
+        player.search(board, 100.0)
+        if player.depth == depth:
+            assert player.score == pytest.approx(_negamax(board, depth, 0))
+
+
+def test_board_untouched():
+    """Test that the searched board is left as it was."""
+    board = HexBoard(5)
+    board.add_move(HexMove(HexCell(2, 2)))
+    state = board.get_board_state()
+    player = AlphaBetaStrategy("1", "ab", False, max_depth=2)
+    index = player.search(board, 10.0)
+    assert board.get_total_moves() == 1
+    assert np.array_equal(board.get_board_state(), state)
+    assert index != 12 and player.depth == 2 and player.nodes > 0
+
+
+def test_think_time_is_respected():
+    """Test that the search stops at the end of its think time."""
+    player = AlphaBetaStrategy("1", "ab", True)
+    start = time.perf_counter()
+    index = player.search(HexBoard(11), 0.2)
+    assert time.perf_counter() - start < 0.5
+    assert 0 <= index < 121
+    # Even a search stopped at once returns a move
+    assert player.search(HexBoard(11), 0.0) is not None
+
+
+def test_timed_game_budget():
+    """Test that the think time comes from the player's clock."""
+    game = TimedHexGame(HexGame(HexBoard(7)), initial_time=2.0)
+    game.start_game()
+    player = AlphaBetaStrategy("1", "ab", True, time_manager=TimeManager(safety_margin=0.0))
+    start = time.perf_counter()
+    assert player.select_move(game) is not None
+    # 2 s shared between 25 moves left
+    assert time.perf_counter() - start < 0.08 + 0.1
+
+
+def test_invalid_depth():
+    """Test that the depth limit must be positive."""
+    with pytest.raises(ValueError):
+        AlphaBetaStrategy("1", "ab", True, max_depth=0)
@@ -0,0 +1,111 @@
+import pytest
+import numpy as np
+
+from src.models.ai import (ResistanceEvaluator, ShortestPathEvaluator, ShortestPathStrategy, TwoDistanceEvaluator)
+from src.models.core import HexBoard, HexCell, HexGame, HexMove
+
+EVALUATORS = [ShortestPathEvaluator, TwoDistanceEvaluator, ResistanceEvaluator]
+
+
+def _random_boards(size, count, seed=0):
+    """Random positions with alternating stone counts (blue first)."""
+    rng = np.random.default_rng(seed)
+    boards = np.zeros((count, size * size), dtype=np.uint8)
+    for board in boards:
+        order = rng.permutation(size * size)[:rng.integers(0, size * size)]
+        board[order[0::2]] = 1
+        board[order[1::2]] = 2
+    return boards.reshape(count, size, size)
+
+
+@pytest.mark.parametrize("size", [3, 5, 7])
+def test_batched_distances_match_bfs(size):
+    """Test that the batched sweeps give the distances of the 0-1 BFS."""
+    evaluator = ShortestPathEvaluator()
+    boards = _random_boards(size, 100, seed=size)
+    for player in (1, 2):
+        batched = evaluator.measure(boards, player)
+        assert batched.tolist() == [evaluator.distance(board, player) for board in boards]
+
+
+def test_shortest_path_values():
+    """Test the distances of simple positions."""
+    evaluator = ShortestPathEvaluator()
+    board = np.zeros((5, 5), dtype=np.uint8)
+    assert evaluator.distance(board, 1) == 5
+    board[:, 2] = 1
+    assert evaluator.distance(board, 1) == 0
+    assert evaluator.distance(board, 2) == 26
+    board[4, 2] = 0
+    assert evaluator.distance(board, 1) == 1
+
+
+def test_two_distance_values():
+    """Test that the two-distance is symmetric and never below the shortest connection."""
+    evaluator = TwoDistanceEvaluator()
+    empty = np.zeros((1, 7, 7), dtype=np.uint8)
+    assert evaluator.measure(empty, 1)[0] == evaluator.measure(empty, 2)[0] == 7
+    boards = _random_boards(5, 50)
+    for player in (1, 2):
+        assert (evaluator.measure(boards, player) >= ShortestPathEvaluator().measure(boards, player)).all()
+    chain = np.zeros((1, 5, 5), dtype=np.uint8)
+    chain[0, :, 2] = 1
+    assert evaluator.measure(chain, 1)[0] == 0
+    assert evaluator.measure(chain, 2)[0] == 26
+
+
+def test_resistance_values():
+    """Test the resistance of simple positions."""
+    evaluator = ResistanceEvaluator()
+    empty = np.zeros((1, 5, 5), dtype=np.uint8)
+    chain = np.zeros((1, 5, 5), dtype=np.uint8)
+    chain[0, :, 2] = 1
+    base = evaluator.resistance(empty, 1)[0]
+    # Blue and red have the same resistance on the empty board (the board is symmetric)
+    assert evaluator.resistance(empty, 2)[0] == pytest.approx(base)
+    assert evaluator.resistance(chain, 1)[0] < base
+    assert evaluator.resistance(chain, 2)[0] > 1e6
+
+
+def test_resistance_batches():
+    """Test that the systems give the same result whatever the batch size."""
+    boards = _random_boards(4, 20)
+    single = ResistanceEvaluator(batch_size=1).resistance(boards, 2)
+    assert np.allclose(ResistanceEvaluator(batch_size=7).resistance(boards, 2), single)
+    with pytest.raises(ValueError):
+        ResistanceEvaluator(batch_size=0)
+
+
+@pytest.mark.parametrize("evaluator", EVALUATORS)
+def test_evaluate_moves_prefers_winning_move(evaluator):
+    """Test that completing a connection gets the best score."""
+    # Blue owns (0, 1), (1, 1) and (2, 1) on a 4x4 board: (3, 1) wins
+    board = np.zeros((4, 4), dtype=np.uint8)
+    board[0:3, 1] = 1
+    board[[0, 1, 3], [3, 3, 3]] = 2
+    indices = np.flatnonzero(board.ravel() == 0)
+    scores = evaluator().evaluate_moves(board, indices, 1)
+    assert scores.shape == indices.shape
+    assert indices[int(np.argmax(scores))] == 3 * 4 + 1
+
+
+@pytest.mark.parametrize("evaluator", EVALUATORS)
+def test_strategy_uses_evaluator(evaluator):
+    """Test that the strategy blocks a connection that would win at once, with every evaluator."""
+    # Red owns (1, 0) and (1, 1) on a 3x3 board: blue must take (1, 2)
+    game = HexGame(HexBoard(3))
+    game.start_game()
+    for cell in [(0, 0), (1, 0), (2, 2), (1, 1)]:
+        game.make_move(HexMove(HexCell(*cell)))
+    player = ShortestPathStrategy("1", "sp", True, 0, evaluator=evaluator())
+    assert isinstance(player.evaluator, evaluator)
+    assert player.select_move(game) == HexCell(1, 2)
+
+
+def test_strategy_ties_go_to_centre():
+    """Test that the default evaluator opens in the centre, where every move scores the same."""
+    game = HexGame(HexBoard(5))
+    game.start_game()
+    player = ShortestPathStrategy("1", "sp", True, 0)
+    assert isinstance(player.evaluator, ShortestPathEvaluator)
+    assert player.select_move(game) == HexCell(2, 2)
@@ -0,0 +1,123 @@
+import pytest
+import numpy as np
+from functools import lru_cache
+
+from src.models.ai import AlphaBetaStrategy, DFPNSolver, SolvedPositionStore
+from src.models.core import HexBoard, HexWinDetector
+
+
+def _minimax(size):
+    """Exhaustive solver of tiny boards: winner of a position with a given player to move."""
+    @lru_cache(maxsize=None)
+    def solve(state_bytes, to_move):
+        state = np.frombuffer(state_bytes, dtype=np.uint8)
+        winner = HexWinDetector.static_detect_winner(state.reshape(size, size))
+        if winner:
+            return int(winner)
+        for index in np.flatnonzero(state == 0).tolist():
+            child = state.copy()
+            child[index] = to_move
+            if solve(child.tobytes(), 3 - to_move) == to_move:
+                return to_move
+        return 3 - to_move
+    return solve
+
+
+def _random_positions(size, count, seed, fewest=0):
+    """Random positions (blue first), with at least `fewest` stones."""
+    rng = np.random.default_rng(seed)
+    positions = []
+    for _ in range(count):
+        state = np.zeros(size * size, dtype=np.uint8)
+        order = rng.permutation(size * size)[:rng.integers(fewest, size * size + 1)]
+        state[order[0::2]] = 1
+        state[order[1::2]] = 2
+        positions.append(state.reshape(size, size))
+    return positions
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_first_player_wins_empty_board(size):
+    """Test that the first player wins the empty board (strategy stealing)."""
+    result = DFPNSolver().solve(np.zeros((size, size), dtype=np.uint8))
+    assert result.winner == result.to_move == 1
+    assert result.nodes > 0
+
+
+def test_matches_exhaustive_search():
+    """Test the results and the winning moves against an exhaustive search of 3x3 positions."""
+    solver, minimax = DFPNSolver(), _minimax(3)
+    for state in _random_positions(3, 100, seed=1):
+        for to_move in (1, 2):
+            result = solver.solve(state, to_move)
+            expected = HexWinDetector.static_detect_winner(state) or minimax(state.tobytes(), to_move)
+            assert result.winner == expected
+            if result.move != SolvedPositionStore.NO_MOVE:
+                child = state.ravel().copy()
+                child[result.move] = to_move
+                assert solver.solve(child.reshape(3, 3), 3 - to_move).winner == to_move
+
+
+@pytest.mark.parametrize("size", [4, 5])
+def test_oracle_for_win_detector(size):
+    """Test that the detectors agree with the solver on finished positions."""
+    boards = np.stack(_random_positions(size, 50, seed=size, fewest=size * size))
+    solver = DFPNSolver()
+    winners = HexWinDetector.detect_winners(boards)
+    for board, winner in zip(boards, winners):
+        assert solver.solve(board).winner == HexWinDetector.static_detect_winner(board) == winner
+
+
+def test_oracle_for_alpha_beta():
+    """Test that a full-depth alpha-beta only plays moves the solver proves winning."""
+    solver = DFPNSolver()
+    checked = 0
+    for state in _random_positions(4, 40, seed=3, fewest=8):
+        if HexWinDetector.static_detect_winner(state):
+            continue
+        result = solver.solve(state)
+        if result.winner != result.to_move:
+            continue
+        # Replay the stones in turn (blue has as many stones as red, or one more)
+        board = HexBoard(4)
+        blue, red = np.flatnonzero(state.ravel() == 1).tolist(), np.flatnonzero(state.ravel() == 2).tolist()
+        for index in [cell for pair in zip(blue, red) for cell in pair] + blue[len(red):]:
+            board._play_index(index)
+        move = AlphaBetaStrategy("1", "ab", result.to_move == 1).search(board, 10.0)
+        child = state.ravel().copy()
+        child[move] = result.to_move
+        assert solver.solve(child.reshape(4, 4), 3 - result.to_move).winner == result.to_move
+        checked += 1
+    assert checked > 0
+
+
+def test_node_budget():
+    """Test that the solve gives up when the budget runs out."""
+    solver = DFPNSolver()
+    assert solver.solve(np.zeros((5, 5), dtype=np.uint8), max_nodes=10) is None
+    with pytest.raises(ValueError):
+        DFPNSolver(epsilon=-1)
+
+
+def test_store_is_filled_and_read():
+    """Test that solved positions are written to the store and read back by later solves."""
+    with SolvedPositionStore() as store:
+        solver = DFPNSolver(store, store_plies=2)
+        empty = np.zeros((4, 4), dtype=np.uint8)
+        first = solver.solve(empty)
+        assert len(store) > 1
+        again = DFPNSolver(store).solve(empty)
+        assert again.from_store and (again.winner, again.move) == (first.winner, first.move)
+        # The answers to the winning move are stored too
+        child = empty.ravel().copy()
+        child[first.move] = 1
+        assert store.lookup(child.reshape(4, 4)) == (1, SolvedPositionStore.NO_MOVE)
+
+
+def test_alpha_beta_plays_stored_move():
+    """Test that a stored win is played without searching."""
+    with SolvedPositionStore() as store:
+        result = DFPNSolver(store).solve(np.zeros((4, 4), dtype=np.uint8))
+        player = AlphaBetaStrategy("1", "ab", True, solved_store=store)
+        assert player.search(HexBoard(4), 10.0) == result.move
+        assert player.nodes == 0
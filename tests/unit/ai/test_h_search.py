@@ -0,0 +1,159 @@
+import pytest
+import numpy as np
+from functools import lru_cache
+
+from src.models.ai import AlphaBetaStrategy, HSearch, VirtualConnections
+from src.models.core import HexBoard, HexWinDetector
+
+
+@lru_cache(maxsize=None)
+def _solver(size):
+    """Exact solver of small boards (shared by the tests): winner of a position with a given player to move."""
+    @lru_cache(maxsize=None)
+    def solve(state_bytes, to_move):
+        state = np.frombuffer(state_bytes, dtype=np.uint8)
+        winner = HexWinDetector.static_detect_winner(state.reshape(size, size))
+        if winner:
+            return int(winner)
+        for index in np.flatnonzero(state == 0).tolist():
+            child = state.copy()
+            child[index] = to_move
+            if solve(child.tobytes(), 3 - to_move) == to_move:
+                return to_move
+        return 3 - to_move
+    return solve
+
+
+def _random_positions(size, count, seed):
+    """Random unfinished positions (blue first), half full or more on boards larger than 3x3."""
+    rng = np.random.default_rng(seed)
+    fewest = 0 if size <= 3 else size * size // 2
+    positions = []
+    while len(positions) < count:
+        state = np.zeros(size * size, dtype=np.uint8)
+        order = rng.permutation(size * size)[:rng.integers(fewest, size * size - 2)]
+        state[order[0::2]] = 1
+        state[order[1::2]] = 2
+        if not HexWinDetector.static_detect_winner(state.reshape(size, size)):
+            positions.append(state.reshape(size, size))
+    return positions
+
+
+def test_bridge_and_edge_template():
+    """Test that a bridge and the edge template II are full connections."""
+    search = HSearch()
+    state = np.zeros((5, 5), dtype=np.uint8)
+    state[1, 1] = state[2, 3] = 1
+    connections = search.connections(state, 1)
+    # (1, 1) and (2, 3) form a bridge through (1, 2) and (2, 2)
+    assert (1 << 7) | (1 << 12) in connections.full(connections.node(6), connections.node(13))
+    # (1, 1) reaches the x == 0 edge through (0, 0) or (0, 1)
+    start = connections.edge_node(VirtualConnections.START)
+    assert (1 << 0) | (1 << 1) in connections.full(connections.node(6), start)
+    with pytest.raises(ValueError):
+        search.connections(state, 2).node(6)
+
+
+def test_virtual_win():
+    """Test the virtual winner of simple positions."""
+    search = HSearch()
+    state = np.zeros((5, 5), dtype=np.uint8)
+    state[1:4, 2] = 1
+    # Blue (1, 2)-(3, 2) reaches both edges by edge template II
+    assert search.connections(state, 1).is_connected()
+    assert search.virtual_winner(state, to_move=2) == 1
+    assert search.virtual_winner(np.zeros((5, 5), dtype=np.uint8), to_move=1) in (1, None)
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_virtual_connections_are_sound(size):
+    """Test that every virtual win found is a real win."""
+    search = HSearch()
+    solve = _solver(size)
+    for state in _random_positions(size, 30, seed=size):
+        for to_move in (1, 2):
+            winner = search.virtual_winner(state, to_move)
+            if winner is not None:
+                assert winner == solve(state.tobytes(), to_move)
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_inferior_cells_are_sound(size):
+    """Test that dead cells can take either colour and captured cells their captor's colour."""
+    search = HSearch()
+    solve = _solver(size)
+    for state in _random_positions(size, 30, seed=10 + size):
+        flat = state.ravel()
+        for to_move in (1, 2):
+            value = solve(flat.tobytes(), to_move)
+            for index in np.flatnonzero(search.dead_cells(state).ravel()).tolist():
+                for colour in (1, 2):
+                    filled = flat.copy()
+                    filled[index] = colour
+                    winner = HexWinDetector.static_detect_winner(filled.reshape(size, size))
+                    assert (winner or solve(filled.tobytes(), to_move)) == value
+            for player in (1, 2):
+                captured = search.captured_cells(state, player).ravel()
+                if captured.any():
+                    filled = flat.copy()
+                    filled[captured] = player
+                    winner = HexWinDetector.static_detect_winner(filled.reshape(size, size))
+                    assert (winner or solve(filled.tobytes(), to_move)) == value
+
+
+@pytest.mark.parametrize("size", [3, 4])
+def test_must_play_keeps_winning_moves(size):
+    """Test that the moves left out of the must-play region (dead cells aside) all lose."""
+    search = HSearch()
+    solve = _solver(size)
+    for state in _random_positions(size, 30, seed=20 + size):
+        flat = state.ravel()
+        dead = search.dead_cells(state).ravel()
+        for to_move in (1, 2):
+            region = search.must_play(state, to_move).ravel()
+            assert region.any()
+            for index in np.flatnonzero((flat == 0) & ~region & ~dead).tolist():
+                child = flat.copy()
+                child[index] = to_move
+                winner = HexWinDetector.static_detect_winner(child.reshape(size, size))
+                assert (winner or solve(child.tobytes(), 3 - to_move)) != to_move
+
+
+def test_dead_and_captured_patterns():
+    """Test the neighbourhood patterns of dead and captured cells."""
+    search = HSearch()
+    state = np.zeros((5, 5), dtype=np.uint8)
+    # Four consecutive blue neighbours around (2, 2)
+    for x, y in [(3, 2), (3, 3), (2, 3), (1, 2)]:
+        state[x, y] = 1
+    assert search.dead_cells(state)[2, 2]
+    assert not search.dead_cells(np.zeros((5, 5), dtype=np.uint8)).any()
+    filled = search.fill_in(state)
+    assert filled[2, 2] != 0
+
+
+def test_connections_are_cached():
+    """Test that a position is searched once per player."""
+    search = HSearch(cache_size=1)
+    state = np.zeros((4, 4), dtype=np.uint8)
+    first = search.connections(state, 1)
+    assert search.connections(state, 1) is first
+    search.connections(state, 2)
+    assert search.connections(state, 1) is not first
+    with pytest.raises(ValueError):
+        HSearch(full_limit=0)
+
+
+def test_alpha_beta_root_restricted():
+    """Test that the alpha-beta root only considers the must-play region."""
+    board = HexBoard(4)
+    # Red has a semi connection between its edges: blue must break it
+    for index in [0, 1, 15, 5, 3, 9]:
+        board._play_index(index)
+    search = HSearch()
+    region = search.must_play(board.board_view())
+    assert region.sum() < len(board.empty_indices())
+    player = AlphaBetaStrategy("1", "ab", True, max_depth=2, h_search=search)
+    move = player.search(board, 10.0)
+    assert region.ravel()[move]
+    assert player.nodes > 0
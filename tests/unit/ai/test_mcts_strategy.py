@@ -0,0 +1,260 @@
+import asyncio
+import pytest
+import threading
+import time
+import numpy as np
+
+from src.models.ai import (AIPlayer, AlphaBetaStrategy, MCTSStrategy, RandomStrategy, ShortestPathStrategy,
+                           SimpleAIPlayer, SolvedPositionStore)
+from src.models.core import HexBoard, HexCell, HexGame, HexMove
+from src.models.game_management import GameManager, MoveCommand, PauseCommand, ResignCommand, ResumeCommand
+from src.models.game_management.player import Player
+
+
+def _game(size, cells):
+    """Active game after the given moves (blue first)."""
+    game = HexGame(HexBoard(size))
+    game.start_game()
+    for cell in cells:
+        game.make_move(HexMove(HexCell(*cell)))
+    return game
+
+
+@pytest.mark.parametrize("strategy", [RandomStrategy, ShortestPathStrategy, SimpleAIPlayer, MCTSStrategy,
+                                      AlphaBetaStrategy])
+def test_strategies_are_players(strategy):
+    """Test that every strategy is a player that only moves on its turn, on an empty cell."""
+    blue = strategy("1", "blue", True, 0)
+    red = strategy("2", "red", False, 0)
+    assert isinstance(blue, AIPlayer) and isinstance(blue, Player)
+    assert blue.name == "blue" and blue.player_id == "1" and blue.is_blue
+    game = _game(3, [(1, 1)])
+    assert blue.select_move(game) is None
+    cell = red.select_move(game)
+    assert cell is not None and cell != HexCell(1, 1)
+
+
+def test_mcts_plays_winning_move():
+    """Test that MCTS completes a connection when it can."""
+    # Blue owns (0, 0) and (1, 0): (2, 0) wins at once, any other move lets red connect
+    game = _game(3, [(0, 0), (1, 1), (1, 0), (2, 1)])
+    player = MCTSStrategy("1", "mcts", True, playouts=300, seed=0)
+    assert player.select_move(game) == HexCell(2, 0)
+
+
+def test_mcts_blocks_losing_move():
+    """Test that MCTS blocks a connection that would win at once."""
+    # Red owns (1, 0) and (1, 1) (a red chain reaching y == 1); (1, 2) must be taken by blue
+    game = _game(3, [(0, 0), (1, 0), (2, 2), (1, 1)])
+    player = MCTSStrategy("1", "mcts", True, playouts=500, seed=0)
+    assert player.select_move(game) == HexCell(1, 2)
+
+
+def test_mcts_playout_budget():
+    """Test that a playout budget gives exactly that many root visits."""
+    player = MCTSStrategy("1", "mcts", True, playouts=200, seed=1)
+    index = player.search(HexBoard(5))
+    assert 0 <= index < 25
+    assert player.root.total == 200
+    assert player.root.visits.sum() == 200
+    assert index == player.root.best_move()
+
+
+def test_mcts_time_budget():
+    """Test that a time budget stops the search."""
+    player = MCTSStrategy("1", "mcts", True, playouts=None, time_limit_ms=50, seed=2)
+    start = time.perf_counter()
+    player.search(HexBoard(7))
+    assert time.perf_counter() - start < 0.5
+    assert player.root.total > 0
+
+
+def test_mcts_needs_a_budget():
+    """Test that a search needs a budget."""
+    with pytest.raises(ValueError):
+        MCTSStrategy("1", "mcts", True, playouts=None)
+
+
+def test_mcts_full_board():
+    """Test that a full board gives no move."""
+    board = HexBoard(3)
+    for index in range(9):
+        board._play_index(index)
+    assert MCTSStrategy("1", "mcts", True, playouts=10).search(board) is None
+
+
+def test_mcts_playout_fills_board():
+    """Test that a playout fills every empty cell, alternating from the player to move."""
+    player = MCTSStrategy("1", "mcts", True, playouts=1, seed=3)
+    state = np.array([1, 0, 0, 2, 0, 0, 0, 0, 0], dtype=np.uint8)
+    winner = player._playout(state, 1, 3)
+    assert np.count_nonzero(state == 0) == 0
+    assert np.count_nonzero(state == 1) == 5
+    assert winner in (1, 2)
+
+
+def _stop_after(player, playouts):
+    """Stop condition of a ponder: the pondered root has the given number of playouts."""
+    return lambda: player._ponder_root is not None and player._ponder_root.total >= playouts
+
+
+def test_mcts_ponder_reuses_subtree():
+    """Test that the search after the opponent's move starts from the pondered subtree of that move."""
+    board = HexBoard(5)
+    board._play_index(12)
+    player = MCTSStrategy("2", "mcts", False, playouts=100, seed=4)
+    board._play_index(player.search(board))
+    player.ponder(board, _stop_after(player, 300))
+    pondered = player._ponder_root
+    # The tree of the last search is continued
+    assert pondered.total >= 300 and pondered.total > 100
+    reply = pondered.best_move()
+    subtree = pondered.children[int(np.flatnonzero(pondered.moves == reply)[0])]
+    kept = subtree.total
+    board._play_index(reply)
+    player.search(board)
+    assert player.root is subtree
+    assert player.root.total == kept + 100
+    # Another move than the pondered ones starts a new tree
+    player.ponder(board.fork(), lambda: True)
+    other = HexBoard(5)
+    other._play_index(0)
+    player.search(other)
+    assert player.root.total == 100
+
+
+async def _wait_for(condition):
+    """Wait until a condition holds, letting the game manager's loop run (5 s at most)."""
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+    await asyncio.wait_for(poll(), 5.0)
+
+
+def _attach(game, bot):
+    """Attach a human (blue) and a bot (red) to a new game manager of a started game."""
+    game.start_game()
+    manager = GameManager(game, "human", bot.name)
+    human = Player("human", min_think_time=0)
+    human.attach_to_game(manager)
+    bot.attach_to_game(manager)
+    return manager, human
+
+
+def test_ai_player_ponders_in_game():
+    """Test that an attached MCTS bot plays its turns and ponders during the opponent's."""
+    game = HexGame(HexBoard(5))
+    bot = MCTSStrategy("2", "bot", False, playouts=50, seed=5)
+    manager, human = _attach(game, bot)
+    wait_for = _wait_for
+
+    async def scenario():
+        task = asyncio.ensure_future(manager.start())
+        await human.send_command(MoveCommand(human, 2, 2))
+        await wait_for(lambda: game.board.get_total_moves() == 2)
+        # The bot ponders the human's move
+        await wait_for(lambda: bot._ponder_root is not None and bot._ponder_root.total >= 200)
+        x, y = divmod(bot._ponder_root.best_move(), 5)
+        await human.send_command(MoveCommand(human, x, y))
+        await wait_for(lambda: game.board.get_total_moves() == 4)
+        assert bot.root.total > 50
+        await human.send_command(ResignCommand(human))
+        await wait_for(lambda: bot._ponder_future is None and game.is_game_over())
+        manager.stop()
+        await task
+
+    asyncio.run(scenario())
+
+
+class _GatedPlayer(AIPlayer):
+    """AI player whose searches wait for a gate, then answer the next of the given cells."""
+
+    def __init__(self, answers):
+        super().__init__("2", "bot", False, min_think_time=0)
+        self.gate = threading.Event()
+        self.answers = list(answers)
+        self.searches = 0
+        self.games = []
+        self.sent = []
+
+    async def send_command(self, command):
+        self.sent.append(command)
+        await super().send_command(command)
+
+    def select_move(self, game):
+        self.searches += 1
+        self.games.append(game)
+        assert self.gate.wait(5.0)
+        self.gate.clear()
+        return self.answers.pop(0)
+
+
+def test_ai_player_with_store_in_game():
+    """Test that a bot reading a solved-position store plays through the game manager (worker threads)."""
+    with SolvedPositionStore() as store:
+        game = HexGame(HexBoard(4))
+        bot = AlphaBetaStrategy("2", "bot", False, max_depth=2, solved_store=store)
+        manager, human = _attach(game, bot)
+
+        async def scenario():
+            task = asyncio.ensure_future(manager.start())
+            await human.send_command(MoveCommand(human, 1, 1))
+            await _wait_for(lambda: game.board.get_total_moves() == 2)
+            manager.stop()
+            await task
+
+        asyncio.run(scenario())
+        assert store.lookups == 1
+
+
+def test_ai_player_drops_stale_move():
+    """Test that a move found while the game was paused is not sent, and the bot searches again on resume."""
+    game = HexGame(HexBoard(5))
+    bot = _GatedPlayer([HexCell(0, 0), HexCell(1, 1)])
+    manager, human = _attach(game, bot)
+
+    async def scenario():
+        task = asyncio.ensure_future(manager.start())
+        await human.send_command(MoveCommand(human, 2, 2))
+        await _wait_for(lambda: bot.searches == 1)
+        await human.send_command(PauseCommand(human))
+        await _wait_for(lambda: not manager.command_queue)
+        bot.gate.set()
+        await _wait_for(lambda: not bot._thinking)
+        assert not bot.sent
+        await human.send_command(ResumeCommand(human))
+        await _wait_for(lambda: bot.searches == 2)
+        bot.gate.set()
+        await _wait_for(lambda: game.board.get_total_moves() == 2)
+        manager.stop()
+        await task
+
+    asyncio.run(scenario())
+    # The searches get a fork of the game, which the manager's loop does not change
+    assert all(searched is not game for searched in bot.games)
+    assert len(bot.sent) == 1
+    assert game.board.get_last_move().cell == HexCell(1, 1)
+
+
+def test_ai_player_acts_on_notifications_received_while_thinking():
+    """Test that the bot acts again after a search when the game changed during it."""
+    game = HexGame(HexBoard(5))
+    # The first search finds no move; the pause and resume it missed make the bot search again
+    bot = _GatedPlayer([None, HexCell(1, 1)])
+    manager, human = _attach(game, bot)
+
+    async def scenario():
+        task = asyncio.ensure_future(manager.start())
+        await human.send_command(MoveCommand(human, 2, 2))
+        await _wait_for(lambda: bot.searches == 1)
+        await human.send_command(PauseCommand(human))
+        await human.send_command(ResumeCommand(human))
+        await _wait_for(lambda: not manager.command_queue)
+        bot.gate.set()
+        await _wait_for(lambda: bot.searches == 2)
+        bot.gate.set()
+        await _wait_for(lambda: game.board.get_total_moves() == 2)
+        manager.stop()
+        await task
+
+    asyncio.run(scenario())
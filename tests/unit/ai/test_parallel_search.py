@@ -0,0 +1,86 @@
+import pytest
+import threading
+import time
+import numpy as np
+
+from src.models.ai import (MCTSStrategy, ParallelSearch, ParallelSearchResult, ParallelStrategy,
+                           ShortestPathStrategy)
+from src.models.core import HexBoard, HexCell, HexGame, HexMove
+
+
+@pytest.fixture(scope="module")
+def mcts_driver():
+    """Driver with two warm MCTS workers, shared by the tests of this module."""
+    driver = ParallelSearch(MCTSStrategy, workers=2, sizes=(5,), seed=0, playouts=None, time_limit_ms=5000)
+    yield driver
+    driver.close()
+
+
+def test_merged_statistics(mcts_driver):
+    """Test that the root statistics of all searches are merged."""
+    board = HexBoard(5)
+    board.add_move(HexMove(HexCell(2, 2)))
+    result = mcts_driver.search(board, time_limit_ms=100, searches=3)
+    assert isinstance(result, ParallelSearchResult)
+    assert result.searches == 3
+    assert result.total_visits > 0
+    # The occupied cell is never visited, and the best move is the most visited one
+    assert result.visits[12] == 0
+    assert result.best_move() == int(np.argmax(result.visits))
+    values = result.values()
+    assert np.isnan(values[12]) or result.visits[12] > 0
+    assert np.nanmax(values) <= 1.0
+
+
+def test_shared_deadline(mcts_driver):
+    """Test that every search stops at the shared deadline."""
+    start = time.time()
+    result = mcts_driver.search(HexBoard(5), deadline=start + 0.2)
+    assert time.time() - start < 2.0
+    assert result.searches == 2
+
+
+def test_cancel(mcts_driver):
+    """Test that cancelling returns the statistics gathered so far, and that the driver stays usable."""
+    start = time.time()
+    threading.Timer(0.1, mcts_driver.cancel).start()
+    result = mcts_driver.search(HexBoard(5))
+    assert time.time() - start < 2.0
+    assert result.best_move() is not None
+    assert mcts_driver.search(HexBoard(5), time_limit_ms=50).total_visits > 0
+
+
+def test_any_strategy():
+    """Test that strategies without a search tree are driven through AIPlayer.analyse."""
+    with ParallelSearch(ShortestPathStrategy, workers=1) as driver:
+        result = driver.search(HexBoard(5), searches=2)
+    assert result.best_move() == 12
+    assert result.visits[12] == 2
+
+
+def test_parallel_strategy():
+    """Test a parallel player in a game."""
+    player = ParallelStrategy("1", "parallel", True, workers=2, time_limit_ms=50, seed=1)
+    try:
+        game = HexGame(HexBoard(5))
+        cell = player.select_move(game)
+        assert cell is not None
+        game.make_move(HexMove(cell))
+        assert player.select_move(game) is None
+    finally:
+        player.close()
+
+
+def test_parallel_strategy_shared_driver(mcts_driver):
+    """Test that a player given a driver leaves it running."""
+    player = ParallelStrategy("1", "parallel", True, time_limit_ms=50, driver=mcts_driver)
+    assert player.driver is mcts_driver
+    assert player.select_move(HexGame(HexBoard(5))) is not None
+    player.close()
+    assert mcts_driver.search(HexBoard(5), time_limit_ms=20).searches == 2
+
+
+def test_needs_a_worker():
+    """Test that a driver needs at least one worker."""
+    with pytest.raises(ValueError):
+        ParallelSearch(MCTSStrategy, workers=0)
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+
+from src.models.ai import RolloutEngine, RolloutResult, MCTSStrategy
+from src.models.core import HexBoard, HexCell, HexMove, HexWinDetector
+
+
+def _position():
+    """5x5 board after three moves (red to move)."""
+    board = HexBoard(5)
+    for cell in [(2, 2), (0, 4), (1, 2)]:
+        board.add_move(HexMove(HexCell(*cell)))
+    return board.get_board_state()
+
+
+def test_completions_fill_the_board():
+    """Test that completions keep the stones and fill the empties alternately from the player to move."""
+    state = _position()
+    boards = RolloutEngine(seed=0).completions(state, 50)
+    assert boards.shape == (50, 5, 5)
+    assert not (boards == 0).any()
+    assert (boards[:, state != 0] == state[state != 0]).all()
+    # 22 empties, red to move: red takes 11 of them, blue the 11 others
+    assert ((boards == 2).sum(axis=(1, 2)) == 1 + 11).all()
+    assert ((boards == 1).sum(axis=(1, 2)) == 2 + 11).all()
+    # The completions differ from each other
+    assert len({board.tobytes() for board in boards}) > 45
+
+
+def test_run_statistics():
+    """Test that the statistics agree with the completions they come from."""
+    state = _position()
+    result = RolloutEngine(seed=1, batch_size=64).run(state, 300)
+    boards = RolloutEngine(seed=1, batch_size=64).completions(state, 64)
+    assert isinstance(result, RolloutResult)
+    assert result.count == 300 and result.to_move == 2
+    assert 0 <= result.wins <= 300
+    assert result.ownership[2, 2] == 1.0 and result.ownership[0, 4] == 0.0
+    assert np.all((result.ownership >= 0) & (result.ownership <= 1))
+    # The player to move owns its stones in every completion, and never the opponent's
+    assert result.owned[0, 4] == 300 and result.owned[2, 2] == 0
+    assert (result.owned_wins <= result.owned).all()
+    assert np.isnan(result.amaf_values()[2, 2])
+    assert result.amaf_values()[0, 4] == pytest.approx(result.win_rate)
+    assert boards.shape[0] == 64
+
+
+def test_run_on_decided_position():
+    """Test that a won position is won by every completion."""
+    board = HexBoard(3)
+    for index in [0, 1, 3, 2, 6]:
+        board._play_index(index)
+    result = RolloutEngine(seed=2).run(board.get_board_state(), 20, to_move=HexBoard.BLUE)
+    assert result.wins == 20
+
+
+def test_merge():
+    """Test that merging two batches adds their counts."""
+    engine = RolloutEngine(seed=3)
+    first, second = engine.run(_position(), 100), engine.run(_position(), 50)
+    merged = first.merge(second)
+    assert merged.count == 150
+    assert merged.wins == first.wins + second.wins
+    assert (merged.owned == first.owned + second.owned).all()
+
+
+def test_full_board_winners_match_detect_winners():
+    """Test that the full board detector agrees with detect_winners on completions."""
+    boards = RolloutEngine(seed=4).completions(np.zeros((7, 7), dtype=np.uint8), 200)
+    assert np.array_equal(HexWinDetector.detect_full_board_winners(boards), HexWinDetector.detect_winners(boards))
+
+
+def test_mcts_leaf_rollouts():
+    """Test that batched leaf evaluation counts every completion as a playout."""
+    player = MCTSStrategy("1", "mcts", True, playouts=320, seed=5, leaf_rollouts=32)
+    player.search(HexBoard(5))
+    assert player.root.total == 320
+    assert player.root.amaf_visits.sum() > 0
+    with pytest.raises(ValueError):
+        MCTSStrategy("1", "mcts", True, leaf_rollouts=0)
@@ -0,0 +1,86 @@
+import threading
+import pytest
+import numpy as np
+
+from src.models.ai import SolvedPositionStore
+from src.models.core import HexSymmetry
+
+
+@pytest.fixture
+def store():
+    """In-memory store closed at the end of each test."""
+    with SolvedPositionStore() as store:
+        yield store
+
+
+def test_store_and_lookup(store):
+    """Test that a result is read back, from the point of view of the player to move."""
+    state = np.zeros((4, 4), dtype=np.uint8)
+    state[1, 1] = 1
+    assert store.lookup(state) is None
+    store.store(state, 2, 6)
+    assert store.lookup(state) == (2, 6)
+    # Same stones, blue to move: not the same position
+    assert store.lookup(state, to_move=1) is None
+    store.store(state, 2, to_move=1)
+    assert store.lookup(state, to_move=1) == (2, SolvedPositionStore.NO_MOVE)
+    assert len(store) == 2
+    assert store.hits == 2 and store.lookups == 4
+    assert store.hit_rate == 0.5
+
+
+def test_symmetric_images_share_results(store):
+    """Test that the images of a position by the board symmetries find its result, moves mapped."""
+    state = np.zeros((5, 5), dtype=np.uint8)
+    state[0, 1] = 1
+    state[3, 3] = 2
+    store.store(state, 1, 7)
+    symmetry = HexSymmetry.for_size(5)
+    for image in range(4):
+        to_move = 2 if HexSymmetry.SWAPS_COLOURS[image] else 1
+        winner = 2 if HexSymmetry.SWAPS_COLOURS[image] else 1
+        assert store.lookup(symmetry.transform_state(state, image), to_move) \
+            == (winner, symmetry.transform_index(7, image))
+    assert len(store) == 1
+
+
+def test_store_persists(tmp_path):
+    """Test that the results are kept in the file."""
+    path = str(tmp_path / "solved.sqlite")
+    state = np.zeros((3, 3), dtype=np.uint8)
+    with SolvedPositionStore(path) as store:
+        store.store(state, 1, 4)
+        assert store.path == path
+    with SolvedPositionStore(path) as store:
+        assert store.lookup(state) == (1, 4)
+        store.clear()
+        assert len(store) == 0
+
+
+def test_won_position_needs_move(store):
+    """Test that a win of the player to move is only stored with its move."""
+    with pytest.raises(ValueError):
+        store.store(np.zeros((3, 3), dtype=np.uint8), 1)
+
+
+def test_store_used_from_threads(store):
+    """Test that a store opened in one thread can be read and filled from others at once."""
+    state = np.zeros((4, 4), dtype=np.uint8)
+    errors = []
+
+    def fill(index):
+        try:
+            image = state.ravel().copy()
+            image[index] = 1
+            store.store(image.reshape(4, 4), 1, to_move=2)
+            assert store.lookup(image.reshape(4, 4)) == (1, SolvedPositionStore.NO_MOVE)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=fill, args=(index,)) for index in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert store.lookups == 16 and store.hits == 16
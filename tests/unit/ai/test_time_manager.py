@@ -0,0 +1,44 @@
+import pytest
+
+from src.models.ai import TimeManager
+from src.models.core import HexBoard, HexGame, TimedHexGame
+
+
+def test_untimed_budget():
+    """Test that an untimed game gets the fixed time per move."""
+    manager = TimeManager(move_time=0.5)
+    assert manager.budget(None, 100) == 0.5
+    assert manager.budget(None, 100, minimum=2.0) == 2.0
+    game = HexGame(HexBoard(5))
+    game.start_game()
+    assert manager.think_time(game, HexGame.BLUE_PLAYER) == 0.5
+
+
+def test_timed_budget():
+    """Test that the remaining time is shared between the moves left."""
+    manager = TimeManager(safety_margin=1.0, max_fraction=0.25, min_moves_left=4)
+    # 121 empty cells: 61 moves left for the player
+    assert manager.budget(62.0, 121) == pytest.approx(1.0)
+    # Near the end, a move never takes more than a quarter of the clock
+    assert manager.budget(9.0, 3) == pytest.approx(2.0)
+    # The minimum think time never empties the clock
+    assert manager.budget(9.0, 121, minimum=5.0) == pytest.approx(5.0)
+    assert manager.budget(3.0, 121, minimum=5.0) == pytest.approx(2.0)
+    assert manager.budget(0.5, 121) == 0.0
+
+
+def test_think_time_reads_clock():
+    """Test that the think time comes from the clock of a timed game."""
+    game = TimedHexGame(HexGame(HexBoard(5)), initial_time=30.0)
+    manager = TimeManager(safety_margin=0.0)
+    assert manager.think_time(game, HexGame.RED_PLAYER) == pytest.approx(30.0 / 13)
+
+
+def test_invalid_settings():
+    """Test that invalid settings are rejected."""
+    with pytest.raises(ValueError):
+        TimeManager(move_time=-1.0)
+    with pytest.raises(ValueError):
+        TimeManager(max_fraction=0.0)
+    with pytest.raises(ValueError):
+        TimeManager(min_moves_left=0)
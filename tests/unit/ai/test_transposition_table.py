@@ -0,0 +1,98 @@
+import multiprocessing
+import pytest
+
+from src.models.ai import MCTSStrategy, ParallelSearch, SharedTranspositionTable
+from src.models.core import HexBoard, HexCell, HexMove, HexZobrist
+
+
+@pytest.fixture
+def table():
+    """Small table freed at the end of each test."""
+    with SharedTranspositionTable(buckets=8, stripes=4) as table:
+        yield table
+
+
+def _store_in_child(table: SharedTranspositionTable, key: int) -> None:
+    """Write an entry from a child process."""
+    table.store(key, 100, 0.75, 12, 3)
+    table.close()
+
+
+def test_store_and_lookup(table):
+    """Test that an entry is read back and updated in place."""
+    assert table.lookup(42) is None
+    table.store(42, 10, 0.5, 7, 1)
+    assert table.lookup(42) == (10, 0.5, 7, 1)
+    table.store(42, 20, 0.25, 8, 2)
+    assert table.lookup(42) == (20, 0.25, 8, 2)
+    assert len(table) == 1
+
+
+def test_bounded_replacement(table):
+    """Test that a bucket keeps its deepest entry and the most recent other one."""
+    # The keys 1, 9, 17 and 25 share bucket 1
+    table.store(1, 100, 0.5, 0, 5)
+    table.store(9, 10, 0.5, 1, 1)
+    table.store(17, 10, 0.5, 2, 1)
+    assert table.lookup(1) is not None
+    assert table.lookup(9) is None
+    assert table.lookup(17) == (10, 0.5, 2, 1)
+    # A deeper search takes the depth-preferred entry, the old one moves down
+    table.store(25, 10, 0.5, 3, 6)
+    assert table.lookup(25) == (10, 0.5, 3, 6)
+    assert table.lookup(1) == (100, 0.5, 0, 5)
+    assert table.lookup(17) is None
+    for key in range(100):
+        table.store(key, 1, 0.5)
+    assert len(table) <= table.buckets * SharedTranspositionTable.WAYS
+    table.clear()
+    assert len(table) == 0
+
+
+def test_invalid_size():
+    """Test that a table needs buckets and locks."""
+    with pytest.raises(ValueError):
+        SharedTranspositionTable(buckets=0)
+
+
+def test_position_key_depends_on_size():
+    """Test that the empty boards of different sizes have different keys."""
+    assert SharedTranspositionTable.position_key(0, 5) != SharedTranspositionTable.position_key(0, 7)
+    assert SharedTranspositionTable.position_key(2 ** 64 - 1, 11) < 2 ** 64
+
+
+def test_shared_between_processes(table):
+    """Test that an entry written by a child process is seen by its parent."""
+    process = multiprocessing.Process(target=_store_in_child, args=(table, 5))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert table.lookup(5) == (100, 0.75, 12, 3)
+
+
+def test_mcts_stores_and_reuses_positions(table):
+    """Test that a search writes its tree to the table and that a new search starts from it."""
+    board = HexBoard(3)
+    board.add_move(HexMove(HexCell(1, 1)))
+    strategy = MCTSStrategy("p1", "MCTS", False, playouts=300, seed=0, transposition_table=table)
+    best = strategy.search(board)
+    key = SharedTranspositionTable.position_key(HexZobrist.for_size(3).hash_board(board.get_board_state()), 3)
+    visits, value, best_move, _ = table.lookup(key)
+    assert best_move == best
+    assert visits >= MCTSStrategy.TT_MIN_VISITS
+    assert 0.0 <= value <= 1.0
+
+    # The root of the next search starts with a prior on the stored move
+    fresh = MCTSStrategy("p2", "MCTS", False, playouts=0, transposition_table=table)
+    assert fresh.search(board) == best
+    assert fresh.root.total == MCTSStrategy.TT_PRIOR_VISITS
+
+
+def test_parallel_workers_share_table():
+    """Test that the workers of a driver fill the caller's table."""
+    with SharedTranspositionTable(buckets=1024) as table:
+        with ParallelSearch(MCTSStrategy, workers=2, seed=0, transposition_table=table, playouts=200) as driver:
+            result = driver.search(HexBoard(4))
+        assert result.searches == 2
+        key = SharedTranspositionTable.position_key(0, 4)
+        assert table.lookup(key) is not None
@@ -1,15 +1,22 @@
 import pytest
 import numpy as np
 from src.models.core.hex_board import HexBoard, MemoryHexBoard
+from src.models.core.bit_hex_board import BitHexBoard
 from src.models.core.hex_cell import HexCell
 from src.models.core.hex_move import HexMove
-from src.models.core.exceptions import InvalidCellError, BoardFullError, CellAlreadyOccupiedError
+from src.models.core.exceptions import InvalidCellError, BoardFullError, CellAlreadyOccupiedError, InvalidMoveError
+
+
+@pytest.fixture(params=[HexBoard, BitHexBoard])
+def board_class(request):
+    """Fixture to run the board contract against every computation-oriented board."""
+    return request.param
 
 
 @pytest.fixture
-def empty_board():
+def empty_board(board_class):
     """Fixture to provide a fresh empty board for each test."""
-    return HexBoard(3)
+    return board_class(3)
 
 
 @pytest.fixture
@@ -24,9 +31,9 @@ def memory_board():
     11, # Large size
     255 # Maximum size
 ])
-def test_board_initialization(size):
+def test_board_initialization(board_class, size):
     """Test board initialization with different sizes."""
-    board = HexBoard(size)
+    board = board_class(size)
     assert board.size == size
     assert np.all(board.get_board_state() == 0)
     assert len(board.get_occupied_cells()) == 0
@@ -38,10 +45,10 @@ def test_board_initialization(size):
 @pytest.mark.parametrize("invalid_size", [
     0, 1, 2, 256, 1000
 ])
-def test_invalid_board_size(invalid_size):
+def test_invalid_board_size(board_class, invalid_size):
     """Test board initialization with invalid sizes."""
     with pytest.raises(ValueError, match="Board size must be between 3 and 255"):
-        HexBoard(invalid_size)
+        board_class(invalid_size)
 
 
 def test_add_move(empty_board):
@@ -80,9 +87,9 @@ def test_occupied_cell_move(empty_board):
         empty_board.add_move(move2)
 
 
-def test_full_board():
+def test_full_board(board_class):
     """Test behavior when board is full."""
-    board = HexBoard(3)  # Small board for testing
+    board = board_class(3)  # Small board for testing
     moves = [
         HexMove(HexCell(0, 0)),
         HexMove(HexCell(0, 1)),
@@ -103,10 +110,10 @@ def test_full_board():
         board.add_move(HexMove(HexCell(0, 0)))
 
 
-def test_winner_detection():
+def test_winner_detection(board_class):
     """Test winner detection in different scenarios."""
     # Blue win (left to right)
-    board = HexBoard(3)
+    board = board_class(3)
     moves = [
         HexMove(HexCell(0, 0)),  # Blue
         HexMove(HexCell(0, 1)),  # Red
@@ -119,7 +126,7 @@ def test_winner_detection():
     assert board.get_winner() == 1
     
     # Red win (top to bottom)
-    board = HexBoard(3)
+    board = board_class(3)
     moves = [
         HexMove(HexCell(0, 0)),  # Blue
         HexMove(HexCell(0, 1)),  # Red
@@ -135,9 +142,9 @@ def test_winner_detection():
     assert board.get_winner() == 2
 
 
-def test_board_state_at_move():
+def test_board_state_at_move(board_class):
     """Test getting board state at specific move indices."""
-    board = HexBoard(3)
+    board = board_class(3)
     moves = [
         HexMove(HexCell(0, 0)),  # Blue
         HexMove(HexCell(1, 1)),  # Red
@@ -172,9 +179,9 @@ def test_board_state_at_move():
     assert np.sum(current_state) == 4
 
 
-def test_empty_board_state():
+def test_empty_board_state(board_class):
     """Test board state of an empty board."""
-    board = HexBoard(3)
+    board = board_class(3)
     state = board.get_board_state()
     assert isinstance(state, np.ndarray)
     assert state.shape == (3, 3)
@@ -182,9 +189,9 @@ def test_empty_board_state():
     assert np.sum(state) == 0
 
 
-def test_full_board_state():
+def test_full_board_state(board_class):
     """Test board state of a full board."""
-    board = HexBoard(3)
+    board = board_class(3)
     # Fill the board with alternating moves
     for i in range(3):
         for j in range(3):
@@ -226,9 +233,9 @@ def test_memory_board_conversion(empty_board):
     assert np.array_equal(new_board.get_board_state(), empty_board.get_board_state())
 
 
-def test_get_player_at():
+def test_get_player_at(board_class):
     """Test getting player at specific cells."""
-    board = HexBoard(3)
+    board = board_class(3)
     moves = [
         HexMove(HexCell(0, 0)),  # Blue
         HexMove(HexCell(1, 1))   # Red
@@ -241,9 +248,9 @@ def test_get_player_at():
     assert board.get_player_at(HexCell(2, 2)) is None
 
 
-def test_total_moves():
+def test_total_moves(board_class):
     """Test getting total number of moves."""
-    board = HexBoard(3)
+    board = board_class(3)
     moves = [
         HexMove(HexCell(0, 0)),
         HexMove(HexCell(1, 1)),
@@ -252,4 +259,243 @@ def test_total_moves():
     for move in moves:
         board.add_move(move)
     
-    assert board.get_total_moves() == 3 
\ No newline at end of file
+    assert board.get_total_moves() == 3
+
+
+def test_undo_move(empty_board):
+    """Test that undoing a move restores the previous board."""
+    move1 = HexMove(HexCell(0, 0))
+    move2 = HexMove(HexCell(1, 1))
+    empty_board.add_move(move1)
+    empty_board.add_move(move2)
+
+    assert empty_board.undo_move() == move2
+    assert empty_board.get_total_moves() == 1
+    assert empty_board.get_last_move() == move1
+    assert empty_board.get_player_at(HexCell(1, 1)) is None
+    assert HexCell(1, 1) not in empty_board.get_occupied_cells()
+
+    # The freed cell can be played again, by the same player
+    empty_board.add_move(HexMove(HexCell(1, 1)))
+    assert empty_board.get_player_at(HexCell(1, 1)) == 2
+
+
+def test_undo_move_empty_board(empty_board, memory_board):
+    """Test that undoing on an empty board raises an error."""
+    with pytest.raises(InvalidMoveError):
+        empty_board.undo_move()
+    with pytest.raises(InvalidMoveError):
+        memory_board.undo_move()
+
+
+def test_undo_restores_full_flag_and_winner(board_class):
+    """Test that undo clears the full flag and the winner of the removed move."""
+    board = board_class(3)
+    moves = [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]  # Blue wins on the last move
+    for cell in moves:
+        board.add_move(HexMove(cell))
+    assert board.get_winner() == 1
+
+    board.undo_move()
+    assert board.get_winner() is None
+
+    for i in range(3):
+        for j in range(3):
+            if board.get_player_at(HexCell(i, j)) is None:
+                board.add_move(HexMove(HexCell(i, j)))
+    assert board.is_full()
+    board.undo_move()
+    assert not board.is_full()
+
+
+@pytest.mark.parametrize("size", [3, 5, 8])
+def test_undo_matches_rebuilt_board(board_class, size):
+    """Test that any sequence of moves and undos matches a board rebuilt from scratch."""
+    rng = np.random.default_rng(size)
+    board = board_class(size)
+    for _ in range(200):
+        empties = np.argwhere(board.get_board_state() == 0)
+        if len(empties) and (board.get_total_moves() == 0 or rng.random() < 0.6):
+            x, y = empties[rng.integers(len(empties))]
+            board.add_move(HexMove((int(x), int(y))))
+        else:
+            board.undo_move()
+
+        rebuilt = board_class(size)
+        for move in board.get_moves():
+            rebuilt.add_move(move)
+        assert np.array_equal(board.get_board_state(), rebuilt.get_board_state())
+        assert board.get_winner() == rebuilt.get_winner()
+        assert board.is_full() == rebuilt.is_full()
+
+
+
+def _replayed_state(moves, size, move_index):
+    """Board state after move_index moves, rebuilt move by move."""
+    state = np.zeros((size, size), dtype=np.uint8)
+    for i, move in enumerate(moves[:move_index]):
+        state[move.cell.x, move.cell.y] = 1 if i % 2 == 0 else 2
+    return state
+
+
+@pytest.mark.parametrize("use_memory_board", [False, True])
+def test_board_state_at_every_move(board_class, use_memory_board):
+    """Test historical states against a move-by-move replay, including after undo."""
+    board = MemoryHexBoard(5) if use_memory_board else board_class(5)
+    rng = np.random.default_rng(1)
+    for index in rng.permutation(25)[:15]:
+        board.add_move(HexMove((int(index) // 5, int(index) % 5)))
+    board.undo_move()
+    board.undo_move()
+
+    moves = board.get_moves()
+    for move_index in range(len(moves) + 1):
+        expected = _replayed_state(moves, 5, move_index)
+        state = board.get_board_state_at_move(move_index)
+        assert state.dtype == np.uint8
+        assert np.array_equal(state, expected)
+
+    with pytest.raises(ValueError):
+        board.get_board_state_at_move(len(moves) + 1)
+
+
+def test_history_tensor(board_class):
+    """Test that the history tensor stacks every position of the game."""
+    board = board_class(3)
+    for cell in [(0, 0), (1, 1), (2, 2)]:
+        board.add_move(HexMove(cell))
+
+    history = board.get_history_tensor()
+    assert history.shape == (4, 3, 3)
+    assert history.dtype == np.uint8
+    assert np.all(history[0] == 0)
+    for move_index in range(4):
+        assert np.array_equal(history[move_index], board.get_board_state_at_move(move_index))
+    assert np.array_equal(history[-1], board.get_board_state())
+
+
+def test_history_tensor_empty_board(memory_board):
+    """Test the history tensor of a board without moves."""
+    history = memory_board.get_history_tensor()
+    assert history.shape == (1, 3, 3)
+    assert np.all(history == 0)
+
+
+def test_memory_board_keeps_moves_and_timestamps(memory_board):
+    """Test that moves are rebuilt with their cells and timestamps, in order."""
+    moves = [HexMove((0, 0), 10.0), HexMove((2, 1), 12.5), HexMove((1, 2), 20.25)]
+    for move in moves:
+        memory_board.add_move(move)
+
+    restored = memory_board.get_moves()
+    assert restored == moves
+    assert [move.timestamp for move in restored] == [10.0, 12.5, 20.25]
+    assert memory_board.get_last_move().timestamp == 20.25
+    assert memory_board.undo_move().timestamp == 20.25
+    assert memory_board.get_occupied_cells() == {HexCell(0, 0), HexCell(2, 1)}
+    assert memory_board.is_valid_move(HexCell(1, 2))
+    assert not memory_board.is_valid_move(HexCell(2, 1))
+
+
+def test_memory_board_move_grid_follows_updates(memory_board):
+    """Test historical states once the move grid exists and the board keeps changing."""
+    memory_board.add_move(HexMove((0, 0)))
+    memory_board.add_move(HexMove((1, 1)))
+    memory_board.get_history_tensor()  # builds the grid
+    memory_board.undo_move()
+    memory_board.add_move(HexMove((2, 2)))
+    memory_board.add_move(HexMove((0, 1)))
+
+    moves = memory_board.get_moves()
+    for move_index in range(len(moves) + 1):
+        assert np.array_equal(memory_board.get_board_state_at_move(move_index),
+                              _replayed_state(moves, 3, move_index))
+
+
+@pytest.mark.parametrize("board_type", [HexBoard, MemoryHexBoard, BitHexBoard])
+def test_numpy_queries(board_type):
+    """Test the vectorized board queries against the board state."""
+    board = board_type(3)
+    view = board.board_view()
+    for cell in [(0, 0), (1, 2), (2, 1)]:
+        board.add_move(HexMove(cell))
+
+    state = board.get_board_state()
+    assert np.array_equal(view, state)  # the view follows the board without copying
+    assert not view.flags.writeable
+    with pytest.raises(ValueError):
+        view[0, 1] = 1
+
+    assert np.array_equal(board.legal_mask(), state == 0)
+    assert board.empty_indices().tolist() == [1, 2, 3, 4, 6, 8]
+    assert np.array_equal(board.stones(1), state == 1)
+    assert board.stones(2).sum() == 1 and board.stones(2)[1, 2]
+    assert board.move_indices().tolist() == [0, 5, 7]
+
+    board.undo_move()
+    assert view[2, 1] == 0
+    assert board.empty_indices().tolist() == [1, 2, 3, 4, 6, 7, 8]
+
+
+@pytest.mark.parametrize("board_type", [HexBoard, MemoryHexBoard, BitHexBoard])
+def test_fork_is_copy_on_write(board_type):
+    """Test that a fork and its parent never see each other's moves."""
+    board = board_type(3)
+    for cell in [(0, 0), (1, 1)]:
+        board.add_move(HexMove(cell))
+    state = board.get_board_state()
+    fork = board.fork()
+    assert np.array_equal(fork.get_board_state(), state)
+    assert fork.position_hash == board.position_hash
+
+    for cell in [(1, 0), (0, 2), (2, 0)]:
+        fork.add_move(HexMove(cell))
+    assert fork.get_winner() == 1
+    assert board.get_winner() is None
+    assert np.array_equal(board.get_board_state(), state)
+    assert board.get_total_moves() == 2
+
+    board.undo_move()
+    board.add_move(HexMove((2, 2)))
+    assert fork.get_player_at(HexCell(1, 1)) == 2
+    assert fork.get_player_at(HexCell(2, 2)) is None
+    assert fork.get_total_moves() == 5
+    assert fork.get_history_tensor().shape == (6, 3, 3)
+
+
+def test_conversions_do_not_alias():
+    """Test that converting between board types gives independent boards."""
+    memory_board = MemoryHexBoard(3)
+    memory_board.add_move(HexMove((0, 0)))
+    hex_board = memory_board.to_hex_board()
+    hex_board.add_move(HexMove((1, 1)))
+    assert memory_board.get_total_moves() == 1
+
+    copy = hex_board.to_memory_hex_board()
+    copy.add_move(HexMove((2, 2)))
+    assert hex_board.get_total_moves() == 2
+    assert copy.get_total_moves() == 3
+
+
+@pytest.mark.parametrize("board_type", [HexBoard, MemoryHexBoard, BitHexBoard])
+def test_pickle_round_trip(board_type):
+    """Test that a pickled board keeps its moves, timestamps, hash and winner, and stays playable."""
+    import pickle
+    board = board_type(3)
+    for cell, timestamp in [((0, 0), 1.0), ((0, 1), 2.0), ((1, 0), 3.0), ((1, 1), 4.5)]:
+        board.add_move(HexMove(cell, timestamp))
+
+    restored = pickle.loads(pickle.dumps(board))
+    assert type(restored) is board_type
+    assert np.array_equal(restored.get_board_state(), board.get_board_state())
+    assert [move.timestamp for move in restored.get_moves()] == [1.0, 2.0, 3.0, 4.5]
+    assert restored.position_hash == board.position_hash
+    assert restored.get_last_move().cell is HexCell.of(1, 1)
+
+    restored.add_move(HexMove((2, 0)))
+    assert restored.get_winner() == 1
+    restored.undo_move()
+    restored.undo_move()
+    assert restored.get_winner() is None
+    assert restored.get_occupied_cells() == {HexCell(0, 0), HexCell(0, 1), HexCell(1, 0)}
+    assert board.get_total_moves() == 4
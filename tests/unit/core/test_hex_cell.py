@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 from src.models.core.hex_cell import HexCell
 
@@ -68,4 +69,27 @@ def test_hex_cell_hash(cell1, cell2, expected):
 def test_hex_cell_repr(x, y, expected_repr):
     """Test string representation."""
     cell = HexCell(x, y)
-    assert repr(cell) == expected_repr 
\ No newline at end of file
+    assert repr(cell) == expected_repr 
+
+def test_hex_cell_of_is_interned():
+    """Test that HexCell.of returns one shared instance per coordinate pair."""
+    cell = HexCell.of(5, 10)
+    assert HexCell.of(5, 10) is cell
+    assert cell == HexCell(5, 10)
+    assert HexCell.of(10, 5) is not cell
+    assert type(cell.x) is int and type(cell.y) is int
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.int64])
+def test_hex_cell_of_numpy_coordinates(dtype):
+    """Test that HexCell.of accepts numpy integer coordinates and interns them as Python ints."""
+    cell = HexCell.of(dtype(3), dtype(255))
+    assert cell is HexCell.of(3, 255)
+    assert type(cell.x) is int and type(cell.y) is int
+
+
+@pytest.mark.parametrize("x,y", [(-1, 0), (0, 256)])
+def test_hex_cell_of_invalid_coordinates(x, y):
+    """Test that HexCell.of validates coordinates like the constructor."""
+    with pytest.raises(ValueError):
+        HexCell.of(x, y)
@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+
+from src.models.core.hex_cell import HexCell
+from src.models.core.hex_cell_table import HexCellTable
+from src.models.core.hex_win_detector import HexWinDetector
+from src.models.data_management.read_game import ReadSGFV4
+from src.models.data_management.write_game import WriteGameSGFV4
+
+
+@pytest.mark.parametrize("size", [3, 5, 11])
+def test_cells_and_indices(size):
+    """Test that flat indices map to the interned cells."""
+    table = HexCellTable.for_size(size)
+    assert HexCellTable.for_size(size) is table
+    assert len(table.cells) == size * size
+    for index, cell in enumerate(table.cells):
+        assert cell is HexCell.of(index // size, index % size)
+        assert table.index(cell) == index
+        assert table.cell(index) is cell
+
+
+def test_neighbours():
+    """Test the flat neighbour lists on a 3x3 board."""
+    table = HexCellTable.for_size(3)
+    assert sorted(table.neighbours[4]) == [0, 1, 3, 5, 7, 8]
+    assert sorted(table.neighbours[0]) == [1, 3, 4]
+    assert sorted(table.neighbours[2]) == [1, 5]
+    for index, neighbours in enumerate(table.neighbours):
+        assert all(index in table.neighbours[neighbour] for neighbour in neighbours)
+
+
+def test_edges():
+    """Test the start and end edges of each player."""
+    table = HexCellTable.for_size(3)
+    assert table.starts[HexCellTable.BLUE] == (0, 1, 2)
+    assert table.ends[HexCellTable.BLUE] == {6, 7, 8}
+    assert table.starts[HexCellTable.RED] == (0, 3, 6)
+    assert table.ends[HexCellTable.RED] == {2, 5, 8}
+
+
+def test_sgf_coordinates_match_codec():
+    """Test that the SGF table agrees with the SGF reader and writer."""
+    table = HexCellTable.for_size(11)
+    for index, code in enumerate(table.sgf):
+        x, y = divmod(index, 11)
+        assert WriteGameSGFV4.convert_coordinates_to_sgf(x, y) == code
+        assert ReadSGFV4.convert_sgf_to_coordinates(code, 11) == (x, y)
+    assert HexCellTable.for_size(30).sgf is None
+
+
+@pytest.mark.parametrize("size", [3, 6, 11])
+def test_flat_detection_matches_labeling(size):
+    """Test the flat neighbour-list search against component labeling on random boards."""
+    rng = np.random.default_rng(size)
+    for _ in range(200):
+        board_state = rng.integers(0, 3, size=(size, size)).astype(np.uint8)
+        assert (HexWinDetector.static_detect_winner(board_state)
+                == HexWinDetector._static_vectorized_detect_winner(board_state))
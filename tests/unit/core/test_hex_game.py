@@ -280,4 +280,97 @@ def test_game_state_persistence(empty_game):
     
     # Verify board state is preserved
     assert empty_game.board.get_player_at(HexCell(0, 0)) == empty_game.BLUE_PLAYER
-    assert empty_game.board.get_player_at(HexCell(1, 1)) == empty_game.RED_PLAYER 
\ No newline at end of file
+    assert empty_game.board.get_player_at(HexCell(1, 1)) == empty_game.RED_PLAYER
+
+
+def test_undo_move(empty_game):
+    """Test that undo restores the board and the current player."""
+    empty_game.start_game()
+    empty_game.make_move(HexMove(HexCell(0, 0)))
+    empty_game.make_move(HexMove(HexCell(1, 1)))
+
+    undone = empty_game.undo_move()
+    assert undone.cell == HexCell(1, 1)
+    assert empty_game.get_current_player() == empty_game.RED_PLAYER
+    assert empty_game.board.get_player_at(HexCell(1, 1)) is None
+
+
+def test_undo_winning_move_reopens_game():
+    """Test that undoing a winning move clears the winner and reactivates the game."""
+    game = HexGame(HexBoard(3))
+    game.start_game()
+    for cell in [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]:
+        game.make_move(HexMove(cell))
+    assert game.winner == game.BLUE_PLAYER
+    assert game.is_game_over()
+
+    game.undo_move()
+    assert game.winner is None
+    assert game.game_end_reason is None
+    assert game.end_time is None
+    assert isinstance(game.state, ActiveState)
+    assert not game.is_game_over()
+
+    # The game can go on with another move
+    game.make_move(HexMove(HexCell(2, 2)))
+    assert game.get_current_player() == game.RED_PLAYER
+
+
+def test_undo_after_resign_is_refused(empty_game):
+    """Test that a resigned game cannot be taken back."""
+    empty_game.start_game()
+    empty_game.make_move(HexMove(HexCell(0, 0)))
+    empty_game.resign_game(empty_game.RED_PLAYER)
+    with pytest.raises(GameOverError):
+        empty_game.undo_move()
+
+
+def test_timed_game_undo(timed_game):
+    """Test that a timed game delegates undo to its wrapped game."""
+    timed_game.start_game()
+    timed_game.make_move(HexMove(HexCell(0, 0)))
+    timed_game.undo_move()
+    assert timed_game.board.get_total_moves() == 0
+    assert timed_game.get_current_player() == timed_game._hex_game.BLUE_PLAYER
+
+
+
+def test_fork_game(empty_game):
+    """Test that a forked game plays independently of the original."""
+    empty_game.start_game()
+    empty_game.make_move(HexMove(HexCell(0, 0)))
+    fork = empty_game.fork()
+    assert isinstance(fork.state, ActiveState)
+    assert fork.start_time == empty_game.start_time
+    assert fork.get_current_player() == empty_game.RED_PLAYER
+
+    fork.make_move(HexMove(HexCell(1, 1)))
+    assert empty_game.board.get_total_moves() == 1
+    assert empty_game.get_current_player() == empty_game.RED_PLAYER
+
+
+def test_fork_timed_game(timed_game):
+    """Test that a forked timed game keeps its type and timers."""
+    timed_game.start_game()
+    timed_game.make_move(HexMove(HexCell(0, 0)))
+    fork = timed_game.fork()
+    assert isinstance(fork, TimedHexGame)
+    assert fork.player_timers[fork.BLUE_PLAYER] == pytest.approx(timed_game.player_timers[fork.BLUE_PLAYER], abs=1)
+    fork.undo_move()
+    assert timed_game.board.get_total_moves() == 1
+
+
+def test_pickle_game(empty_game):
+    """Test that a pickled game keeps its board and metadata."""
+    import pickle
+    empty_game.start_game()
+    empty_game.make_move(HexMove(HexCell(0, 0)))
+    empty_game.resign_game(empty_game.RED_PLAYER)
+
+    restored = pickle.loads(pickle.dumps(empty_game))
+    assert isinstance(restored.state, FinishedState)
+    assert restored.game_end_reason == GameEndReason.RESIGN
+    assert restored.winner == empty_game.BLUE_PLAYER
+    assert restored.start_time == empty_game.start_time
+    assert restored.board.get_player_at(HexCell(0, 0)) == empty_game.BLUE_PLAYER
+    assert restored.get_current_player() == empty_game.RED_PLAYER
@@ -6,10 +6,11 @@ import numpy as np
 from src.models.core.hex_game_factory import HexGameFactory
 from src.models.core.hex_game import HexGame, TimedHexGame
 from src.models.core.hex_board import HexBoard, MemoryHexBoard
+from src.models.core.bit_hex_board import BitHexBoard
 from src.models.core.hex_cell import HexCell
 from src.models.core.hex_move import HexMove
 from src.models.core.interfaces import GameEndReason, HexState
-from src.models.core.exceptions import InvalidGameStateError
+from src.models.core.exceptions import InvalidGameStateError, InvalidCellError, GameOverError
 from src.models.core.hex_state import NotStartedState, ActiveState, PausedState, FinishedState, CorruptedState
 
 @pytest.fixture
@@ -38,6 +39,22 @@ def test_create_memory_game():
     assert game.board.size == 3
     assert isinstance(game.board, MemoryHexBoard)
 
+def test_create_bit_board_game():
+    """Test creating a game with BitHexBoard."""
+    game = HexGameFactory.create_game(board_size=3, use_bit_board=True)
+    assert isinstance(game, HexGame)
+    assert isinstance(game.board, BitHexBoard)
+    game.start_game()
+    for cell in [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]:
+        game.make_move(HexMove(cell))
+    assert game.winner == game.BLUE_PLAYER
+
+def test_create_bit_board_game_from_existing(sample_game):
+    """Test converting an existing game to a BitHexBoard."""
+    new_game = HexGameFactory.create_game(existing_game=sample_game, use_bit_board=True)
+    assert isinstance(new_game.board, BitHexBoard)
+    assert np.array_equal(new_game.board.get_board_state(), sample_game.board.get_board_state())
+
 def test_create_timed_game():
     """Test creating a timed game."""
     game = HexGameFactory.create_game(board_size=3, initial_time=300.0)
@@ -91,6 +108,11 @@ def test_create_game_from_existing(sample_game):
     assert new_game.state, sample_game.state
     assert new_game.board.get_total_moves() == sample_game.board.get_total_moves()
 
+    # The boards are forked, not shared
+    assert new_game.board is not sample_game.board
+    new_game.make_move(HexMove(HexCell(2, 2)))
+    assert sample_game.board.get_total_moves() == 2
+
 def test_create_memory_game_from_existing(sample_game):
     """Test creating a memory game from an existing game."""
     # Get the original board state
@@ -204,4 +226,74 @@ def test_create_game_with_full_state():
 def test_create_from_file_not_implemented():
     """Test that create_from_file raises NotImplementedError."""
     with pytest.raises(NotImplementedError, match="File parsing logic is not implemented"):
-        HexGameFactory.create_from_file("test.txt") 
\ No newline at end of file
+        HexGameFactory.create_from_file("test.txt") 
+def test_create_from_moves():
+    """Test building a game from a move list in one batch."""
+    game = HexGameFactory.create_from_moves(3, [4, 0, 1])
+    assert isinstance(game.board, HexBoard)
+    assert isinstance(game.state, ActiveState)
+    assert game.winner is None
+    assert [(move.cell.x, move.cell.y) for move in game.board.get_moves()] == [(1, 1), (0, 0), (0, 1)]
+    assert game.board.get_player_at(HexCell(0, 0)) == HexBoard.RED
+    assert game.get_current_player() == HexGame.RED_PLAYER
+    # The lazily rebuilt structures match the stones
+    assert game.board.is_valid_move(HexCell(2, 2))
+    game.make_move(HexMove(HexCell(2, 2)))
+    assert game.board.get_total_moves() == 4
+
+def test_create_from_moves_coordinates():
+    """Test that (x, y) coordinates and flat indices give the same game."""
+    game = HexGameFactory.create_from_moves(3, np.array([[1, 1], [0, 0]]))
+    assert game.board.move_indices().tolist() == [4, 0]
+
+@pytest.mark.parametrize("verify", ["end", "each"])
+def test_create_from_moves_victory(verify):
+    """Test that a winning move list gives a finished game, like replaying it."""
+    moves = [0, 1, 3, 2, 6]
+    game = HexGameFactory.create_from_moves(3, moves, verify=verify)
+    assert isinstance(game.state, FinishedState)
+    assert game.game_end_reason == GameEndReason.VICTORY
+    assert game.winner == HexBoard.BLUE
+    assert game.board.get_winner() == HexBoard.BLUE
+    # The recorded winner must agree with the board
+    with pytest.raises(InvalidGameStateError):
+        HexGameFactory.create_from_moves(3, moves, result=HexBoard.RED, verify=verify)
+
+def test_create_from_moves_result():
+    """Test finishing a game from the recorded result when nobody connected."""
+    game = HexGameFactory.create_from_moves(3, [4, 0], result=HexBoard.RED)
+    assert game.game_end_reason == GameEndReason.RESIGN
+    assert game.winner == HexBoard.RED
+    game = HexGameFactory.create_from_moves(3, [4, 0], result=HexBoard.RED, verify="none")
+    assert game.game_end_reason == GameEndReason.VICTORY
+    with pytest.raises(InvalidGameStateError):
+        HexGameFactory.create_from_moves(3, [4, 0], result=HexBoard.RED, game_end_reason=GameEndReason.VICTORY)
+
+def test_create_from_moves_invalid():
+    """Test that invalid move lists are rejected."""
+    with pytest.raises(InvalidCellError):
+        HexGameFactory.create_from_moves(3, [4, 0, 4])
+    with pytest.raises(InvalidCellError):
+        HexGameFactory.create_from_moves(3, [9])
+    with pytest.raises(InvalidCellError):
+        HexGameFactory.create_from_moves(3, [[0, 3]])
+    with pytest.raises(ValueError):
+        HexGameFactory.create_from_moves(3, [4], verify="sometimes")
+    # Moves after the winning one: "end" sees that the last mover lost, "each" sees the early win
+    with pytest.raises(GameOverError):
+        HexGameFactory.create_from_moves(3, [0, 1, 3, 2, 6, 5])
+    with pytest.raises(GameOverError):
+        HexGameFactory.create_from_moves(3, [0, 1, 3, 2, 6, 5, 8], verify="each")
+
+@pytest.mark.parametrize("verify", ["end", "each"])
+def test_create_from_moves_blue_plays_on_after_win(verify):
+    """Test that a Blue win followed by a Red move and another Blue stone is rejected, not read as a Blue win."""
+    # Blue connects with 6 at ply 5, then Red plays 5 and Blue plays 8
+    with pytest.raises(GameOverError):
+        HexGameFactory.create_from_moves(3, [0, 1, 3, 2, 6, 5, 8], verify=verify)
+
+def test_create_from_moves_timestamps():
+    """Test that timestamps are kept, and that moves without one stay without one."""
+    game = HexGameFactory.create_from_moves(3, [4, 0], timestamps=[1.0, None])
+    assert [move.timestamp for move in game.board.get_moves()] == [1.0, None]
+    assert HexGameFactory.create_from_moves(3, [4]).board.get_moves()[0].timestamp is None
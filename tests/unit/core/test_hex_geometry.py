@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+
+from src.models.core.hex_geometry import HexGeometry
+from src.models.core.hex_cell_table import HexCellTable
+
+
+@pytest.mark.parametrize("size", [3, 5, 11])
+def test_neighbours_csr(size):
+    """Test that the CSR neighbour arrays match the hexagonal directions."""
+    geometry = HexGeometry.for_size(size)
+    assert HexGeometry.for_size(size) is geometry
+    assert geometry.neighbour_offsets[-1] == len(geometry.neighbour_indices)
+    for index in range(size * size):
+        x, y = divmod(index, size)
+        expected = {(x + dx) * size + y + dy for dx, dy in HexGeometry.DIRECTIONS
+                    if 0 <= x + dx < size and 0 <= y + dy < size}
+        assert set(geometry.neighbours(index).tolist()) == expected
+        assert tuple(geometry.neighbours(index).tolist()) == HexCellTable.for_size(size).neighbours[index]
+
+
+@pytest.mark.parametrize("size", [3, 6])
+def test_bridges(size):
+    """Test that every bridge has two carrier cells adjacent to both of its ends."""
+    geometry = HexGeometry.for_size(size)
+    count = 0
+    for index in range(size * size):
+        targets, carriers = geometry.bridges(index)
+        for target, carrier in zip(targets.tolist(), carriers.tolist()):
+            count += 1
+            assert target not in geometry.neighbours(index)
+            for cell in carrier:
+                assert cell in geometry.neighbours(index)
+                assert cell in geometry.neighbours(target)
+    # Every bridge is seen from both of its ends
+    assert count % 2 == 0
+
+
+def test_bridges_of_centre():
+    """Test the six bridges of the centre of a 5x5 board."""
+    geometry = HexGeometry.for_size(5)
+    targets, carriers = geometry.bridges(12)
+    assert sorted(targets.tolist()) == sorted([3 * 5 + 4, 4 * 5 + 3, 3 * 5 + 1, 1 * 5 + 3, 1 * 5 + 0, 0 * 5 + 1])
+    assert sorted(carriers[targets.tolist().index(19)].tolist()) == [13, 18]
+
+
+def test_edges_and_distances():
+    """Test the edge masks, distance maps and centre distances."""
+    geometry = HexGeometry.for_size(3)
+    assert np.flatnonzero(geometry.edge_masks[HexGeometry.BLUE][0]).tolist() == [0, 1, 2]
+    assert np.flatnonzero(geometry.edge_masks[HexGeometry.BLUE][1]).tolist() == [6, 7, 8]
+    assert np.flatnonzero(geometry.edge_masks[HexGeometry.RED][0]).tolist() == [0, 3, 6]
+    assert np.flatnonzero(geometry.edge_masks[HexGeometry.RED][1]).tolist() == [2, 5, 8]
+    assert geometry.edge_distances[HexGeometry.BLUE][:, 5].tolist() == [1, 1]
+    assert geometry.edge_distances[HexGeometry.RED][:, 5].tolist() == [2, 0]
+    assert geometry.centre_distance.tolist() == [2, 1, 2, 1, 0, 1, 2, 1, 2]
+
+
+def test_sgf_maps():
+    """Test the coordinate, SGF and flat index maps."""
+    geometry = HexGeometry.for_size(11)
+    assert geometry.coordinates[13].tolist() == [1, 2]
+    assert geometry.sgf[13] == "cb"
+    assert geometry.sgf_index["cb"] == 13
+    assert HexGeometry.for_size(27).sgf is None
+
+
+def test_disk_cache(tmp_path):
+    """Test that a geometry written to the disk cache is read back identical."""
+    geometry = HexGeometry(7)
+    path = str(tmp_path / "hex_geometry_7.npz")
+    geometry.save(path)
+    loaded = HexGeometry.load(path)
+    assert loaded.size == 7
+    for name in HexGeometry._ARRAYS:
+        assert np.array_equal(getattr(loaded, name), getattr(geometry, name))
+    assert loaded.sgf_index == geometry.sgf_index
+    assert loaded.edge_masks[HexGeometry.RED] is loaded.red_edges
+
+
+def test_for_size_with_cache_dir(tmp_path, monkeypatch):
+    """Test that for_size fills the cache directory, then reads from it."""
+    monkeypatch.setattr(HexGeometry, "_cache", {})
+    geometry = HexGeometry.for_size(4, str(tmp_path))
+    assert (tmp_path / "hex_geometry_4.npz").exists()
+    monkeypatch.setattr(HexGeometry, "_cache", {})
+    assert np.array_equal(HexGeometry.for_size(4, str(tmp_path)).bridge_carriers, geometry.bridge_carriers)
@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+
+from src.models.core.hex_symmetry import HexSymmetry
+from src.models.core.hex_board import HexBoard
+from src.models.core.hex_move import HexMove
+from src.models.core.hex_win_detector import HexWinDetector
+from src.models.data_management.read_game import ReadSGFV4
+
+
+def _random_position(size, count, seed):
+    """Board state of a random game of count moves (BLUE first)."""
+    rng = np.random.default_rng(seed)
+    state = np.zeros(size * size, dtype=np.uint8)
+    for number, index in enumerate(rng.permutation(size * size)[:count]):
+        state[index] = 1 if number % 2 == 0 else 2
+    return state.reshape(size, size)
+
+
+def test_transforms():
+    """Test the four transforms on a single stone."""
+    symmetry = HexSymmetry.for_size(3)
+    state = np.zeros((3, 3), dtype=np.uint8)
+    state[0, 1] = 1
+    assert symmetry.transform_state(state, HexSymmetry.IDENTITY)[0, 1] == 1
+    assert symmetry.transform_state(state, HexSymmetry.ROTATE_180)[2, 1] == 1
+    assert symmetry.transform_state(state, HexSymmetry.TRANSPOSE)[1, 0] == 2
+    assert symmetry.transform_state(state, HexSymmetry.ANTI_TRANSPOSE)[1, 2] == 2
+    for index in range(9):
+        for s in range(4):
+            assert symmetry.transform_index(symmetry.transform_index(index, s), s) == index
+
+
+@pytest.mark.parametrize("size", [3, 6, 11])
+def test_transforms_preserve_winner(size):
+    """Test that the symmetries map a winner of one colour to the winner of its image."""
+    symmetry = HexSymmetry.for_size(size)
+    for seed in range(20):
+        state = _random_position(size, size * size, seed)
+        winner = HexWinDetector.static_detect_winner(state)
+        for s in range(4):
+            image = HexWinDetector.static_detect_winner(symmetry.transform_state(state, s))
+            assert image == (3 - winner if HexSymmetry.SWAPS_COLOURS[s] else winner)
+
+
+@pytest.mark.parametrize("count", [0, 1, 6, 7])
+def test_canonical_hash_is_invariant(count):
+    """Test that all images of a position share the canonical hash and form."""
+    symmetry = HexSymmetry.for_size(5)
+    state = _random_position(5, count, count)
+    mover = 1 if count % 2 == 0 else 2
+    canonical, _, canonical_mover = symmetry.canonical_state(state)
+    for s in range(4):
+        image = symmetry.transform_state(state, s)
+        image_mover = 3 - mover if HexSymmetry.SWAPS_COLOURS[s] else mover
+        assert symmetry.canonical_hash(image, image_mover) == symmetry.canonical_hash(state)
+        image_canonical, _, image_canonical_mover = symmetry.canonical_state(image, image_mover)
+        assert np.array_equal(image_canonical, canonical)
+        assert image_canonical_mover == canonical_mover
+
+
+def test_canonical_hash_separates_positions():
+    """Test that different positions and sides to move get different canonical hashes."""
+    symmetry = HexSymmetry.for_size(5)
+    hashes = {symmetry.canonical_hash(_random_position(5, 8, seed)) for seed in range(50)}
+    assert len(hashes) > 45
+    state = _random_position(5, 8, 0)
+    assert symmetry.canonical_hash(state, 1) != symmetry.canonical_hash(state, 2)
+
+
+def test_canonical_hash_of_board():
+    """Test that boards are accepted directly."""
+    board = HexBoard(4)
+    board.add_move(HexMove((0, 1)))
+    rotated = HexBoard(4)
+    rotated.add_move(HexMove((3, 2)))
+    symmetry = HexSymmetry.for_size(4)
+    assert symmetry.canonical_hash(board) == symmetry.canonical_hash(rotated)
+
+
+def test_canonical_moves():
+    """Test that a game and its rotation share a canonical move sequence."""
+    symmetry = HexSymmetry.for_size(3)
+    moves = [8, 0, 5]
+    rotated = [symmetry.transform_index(index, HexSymmetry.ROTATE_180) for index in moves]
+    assert symmetry.canonical_moves(moves) == ((0, 8, 3), HexSymmetry.ROTATE_180)
+    assert symmetry.canonical_moves(rotated) == ((0, 8, 3), HexSymmetry.IDENTITY)
+    assert symmetry.canonical_moves([]) == ((), HexSymmetry.IDENTITY)
+
+
+def test_canonical_sgf_moves():
+    """Test canonical move sequences built from SGF moves."""
+    moves = [{"W": "ac"}, {"B": "ab"}, {"W": "resign"}]
+    rotated = [{"W": "ca"}, {"B": "cb"}]
+    assert ReadSGFV4.convert_sgf_to_canonical_moves(moves, 3) == \
+        ReadSGFV4.convert_sgf_to_canonical_moves(rotated, 3)
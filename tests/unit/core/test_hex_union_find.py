@@ -0,0 +1,91 @@
+import random
+
+import pytest
+import numpy as np
+from src.models.core.hex_union_find import HexUnionFind
+from src.models.core.hex_win_detector import HexWinDetector
+from src.models.core.hex_board import HexBoard, MemoryHexBoard
+from src.models.core.hex_move import HexMove
+
+
+@pytest.fixture
+def connectivity():
+    """Fixture to provide a fresh connectivity structure on a 3x3 board."""
+    return HexUnionFind(3)
+
+
+def test_initial_state(connectivity):
+    """Test that a fresh structure has no winner and no connection."""
+    assert connectivity.winner is None
+    assert not connectivity.connected(connectivity.BLUE_START, connectivity.BLUE_END)
+    assert not connectivity.connected(connectivity.RED_START, connectivity.RED_END)
+
+
+def test_blue_connection(connectivity):
+    """Test that blue wins once x == 0 and x == size - 1 are connected."""
+    assert connectivity.add_stone(0, 1, HexUnionFind.BLUE) is None
+    assert connectivity.add_stone(1, 1, HexUnionFind.BLUE) is None
+    assert connectivity.add_stone(2, 2, HexUnionFind.BLUE) == HexUnionFind.BLUE
+    assert connectivity.winner == HexUnionFind.BLUE
+
+
+def test_red_connection(connectivity):
+    """Test that red wins once y == 0 and y == size - 1 are connected."""
+    connectivity.add_stone(1, 0, HexUnionFind.RED)
+    connectivity.add_stone(0, 1, HexUnionFind.RED)  # (0, 1) is not adjacent to (1, 0)
+    assert connectivity.winner is None
+    connectivity.add_stone(1, 1, HexUnionFind.RED)
+    assert connectivity.add_stone(1, 2, HexUnionFind.RED) == HexUnionFind.RED
+
+
+def test_remove_last_stone(connectivity):
+    """Test that removing stones restores the previous connectivity and winner."""
+    connectivity.add_stone(0, 1, HexUnionFind.BLUE)
+    connectivity.add_stone(1, 1, HexUnionFind.BLUE)
+    connectivity.add_stone(2, 2, HexUnionFind.BLUE)
+    assert connectivity.winner == HexUnionFind.BLUE
+
+    connectivity.remove_last_stone()
+    assert connectivity.winner is None
+    assert connectivity.connected(1, 4)
+    assert not connectivity.connected(4, 8)
+
+    connectivity.remove_last_stone()
+    connectivity.remove_last_stone()
+    assert all(connectivity.find(node) == node for node in range(9 + 4))
+    with pytest.raises(IndexError):
+        connectivity.remove_last_stone()
+
+
+def test_opponent_stones_do_not_connect(connectivity):
+    """Test that stones of different colours are never merged."""
+    connectivity.add_stone(0, 0, HexUnionFind.BLUE)
+    connectivity.add_stone(1, 0, HexUnionFind.RED)
+    connectivity.add_stone(2, 0, HexUnionFind.BLUE)
+    assert connectivity.winner is None
+    assert not connectivity.connected(0, 3)
+
+
+@pytest.mark.parametrize("size", [3, 5, 11])
+def test_matches_static_detector(size):
+    """Test that the incremental winner matches a full DFS after every move."""
+    rng = random.Random(size)
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    rng.shuffle(cells)
+
+    board = HexBoard(size)
+    for cell in cells:
+        board.add_move(HexMove(cell))
+        expected = HexWinDetector.static_detect_winner(board.get_board_state())
+        assert board.get_winner() == expected
+
+
+def test_connectivity_rebuilt_on_conversion():
+    """Test that converting a MemoryHexBoard rebuilds the connectivity structure."""
+    memory_board = MemoryHexBoard(3)
+    for cell in [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0)]:
+        memory_board.add_move(HexMove(cell))
+
+    board = memory_board.to_hex_board()
+    assert board.get_winner() == 1
+    assert np.array_equal(board.get_board_state(), memory_board.get_board_state())
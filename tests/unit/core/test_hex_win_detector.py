@@ -1,3 +1,4 @@
+import threading
 import pytest
 import numpy as np
 from src.models.core.hex_win_detector import HexWinDetector
@@ -248,4 +249,108 @@ def test_cache_with_unfinished_boards(win_detector):
     board[1, 0] = 1
     board[2, 0] = 1
     result3 = win_detector.detect_winner(board)
-    assert result3 == 1  # Cache should be invalidated and new result calculated 
\ No newline at end of file
+    assert result3 == 1  # Cache should be invalidated and new result calculated 
+
+def _snake_board(size, complete=True):
+    """Build a single blue chain zigzagging across the whole board."""
+    board = np.zeros((size, size), dtype=np.uint8)
+    for x in range(size):
+        if x % 2 == 0:
+            board[x, :] = 1
+        else:
+            board[x, size - 1 if x % 4 == 1 else 0] = 1
+    if not complete:
+        board[size - 1, :] = 0
+    return board
+
+
+@pytest.mark.parametrize("size", [31, 101, 255])
+@pytest.mark.parametrize("complete,expected_winner", [(True, 1), (False, None)])
+def test_snake_chain_does_not_recurse(size, complete, expected_winner):
+    """Test that very long chains are handled without hitting the recursion limit."""
+    board = _snake_board(size, complete)
+    assert HexWinDetector.static_detect_winner(board) == expected_winner
+    assert HexWinDetector._static_check_blue_win(board, size) == (expected_winner == 1)
+
+
+@pytest.mark.parametrize("size", [5, 9, 40])
+def test_large_board_mode_matches_dfs(size):
+    """Test that the vectorized large board mode agrees with the iterative DFS."""
+    rng = np.random.default_rng(size)
+    for _ in range(50):
+        board = rng.integers(0, 3, (size, size)).astype(np.uint8)
+        if HexWinDetector._static_check_blue_win(board, size):
+            expected = 1
+        elif HexWinDetector._static_check_red_win(board, size):
+            expected = 2
+        else:
+            expected = None
+        assert HexWinDetector._static_vectorized_detect_winner(board) == expected
+
+
+def test_cache_shared_between_threads():
+    """Test that one cached detector gives the right winners when used by several threads at once."""
+    detector = HexWinDetector(cache_size=16)
+    rng = np.random.default_rng(0)
+    boards = rng.integers(0, 3, (64, 5, 5)).astype(np.uint8)
+    expected = [HexWinDetector.static_detect_winner(board) for board in boards]
+    errors = []
+
+    def check():
+        try:
+            for _ in range(20):
+                for board, winner in zip(boards, expected):
+                    assert detector.detect_winner(board) == winner
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=check) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(detector._cache) <= detector.cache_size
+
+
+def test_detect_winners_batch():
+    """Test batched winner detection on a small stack of known boards."""
+    boards = np.array([
+        np.zeros((3, 3)),
+        [[1, 1, 1], [0, 0, 0], [0, 0, 0]],  # Blue stones on x == 0 only: no winner
+        [[1, 0, 0], [1, 0, 0], [1, 0, 0]],  # Blue connects x == 0 to x == 2
+        [[2, 2, 2], [0, 0, 0], [0, 0, 0]],  # Red connects y == 0 to y == 2
+        [[2, 0, 0], [0, 2, 0], [0, 0, 2]],  # Red zigzag
+    ], dtype=np.uint8)
+    winners = HexWinDetector.detect_winners(boards)
+    assert winners.dtype == np.uint8
+    assert winners.tolist() == [0, 0, 1, 2, 2]
+
+
+@pytest.mark.parametrize("size", [3, 7, 11, 70])
+def test_detect_winners_matches_static(size):
+    """Test that batched detection agrees with static_detect_winner on random boards."""
+    rng = np.random.default_rng(size)
+    boards = rng.integers(0, 3, (200, size, size)).astype(np.uint8)
+    expected = [HexWinDetector.static_detect_winner(board) or 0 for board in boards]
+    assert HexWinDetector.detect_winners(boards).tolist() == expected
+
+
+def test_detect_winners_invalid_shape():
+    """Test that batched detection rejects anything but a stack of square boards."""
+    assert HexWinDetector.detect_winners(np.zeros((0, 3, 3))).shape == (0,)
+    with pytest.raises(ValueError):
+        HexWinDetector.detect_winners(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        HexWinDetector.detect_winners(np.zeros((2, 3, 4)))
+
+
+@pytest.mark.parametrize("size", [3, 7, 11])
+def test_full_board_winner(size):
+    """Test that the full board detector agrees with the general one on filled boards."""
+    rng = np.random.default_rng(size)
+    for _ in range(20):
+        board = np.full(size * size, 2, dtype=np.uint8)
+        board[rng.permutation(size * size)[:(size * size + 1) // 2]] = 1
+        board = board.reshape(size, size)
+        assert HexWinDetector.static_detect_full_board_winner(board) == HexWinDetector.static_detect_winner(board)
@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+from src.models.core.hex_zobrist import HexZobrist
+from src.models.core.hex_board import HexBoard, MemoryHexBoard
+from src.models.core.bit_hex_board import BitHexBoard
+from src.models.core.hex_win_detector import HexWinDetector
+from src.models.core.hex_move import HexMove
+
+
+@pytest.fixture(params=[HexBoard, MemoryHexBoard, BitHexBoard])
+def board_class(request):
+    """Fixture to check the position hash on every board implementation."""
+    return request.param
+
+
+def test_keys_are_shared_and_deterministic():
+    """Test that keys are computed once per size and stable across instances."""
+    zobrist = HexZobrist.for_size(5)
+    assert HexZobrist.for_size(5) is zobrist
+    assert HexZobrist(5).keys == zobrist.keys
+    assert zobrist.key(0, HexZobrist.BLUE) != zobrist.key(0, HexZobrist.RED)
+    assert all(key == 0 for key in zobrist.keys[HexZobrist.EMPTY])
+
+
+def test_empty_board_hash(board_class):
+    """Test that an empty board hashes to zero."""
+    assert board_class(5).position_hash == 0
+
+
+def test_incremental_hash_matches_full_hash(board_class):
+    """Test that the hash kept by add_move / undo_move matches a full recomputation."""
+    rng = np.random.default_rng(0)
+    board = board_class(7)
+    zobrist = HexZobrist.for_size(7)
+    cells = rng.permutation(49)
+    for index in cells[:30]:
+        board.add_move(HexMove((int(index) // 7, int(index) % 7)))
+        assert board.position_hash == zobrist.hash_board(board.get_board_state())
+    for _ in range(10):
+        board.undo_move()
+        assert board.position_hash == zobrist.hash_board(board.get_board_state())
+
+
+def test_transpositions_share_hash(board_class):
+    """Test that the same position reached by different move orders has the same hash."""
+    first = board_class(5)
+    second = board_class(5)
+    for cell in [(0, 0), (1, 1), (2, 2), (3, 3)]:
+        first.add_move(HexMove(cell))
+    for cell in [(2, 2), (3, 3), (0, 0), (1, 1)]:
+        second.add_move(HexMove(cell))
+    assert first.position_hash == second.position_hash
+
+    swapped = board_class(5)
+    for cell in [(1, 1), (0, 0), (2, 2), (3, 3)]:  # Colours of (0, 0) and (1, 1) swapped
+        swapped.add_move(HexMove(cell))
+    assert swapped.position_hash != first.position_hash
+
+
+def test_winner_cache_is_bounded():
+    """Test that the winner cache keeps at most cache_size positions (LRU)."""
+    detector = HexWinDetector(cache_size=2)
+    boards = [np.zeros((3, 3), dtype=np.uint8) for _ in range(3)]
+    boards[1][0, 0] = 1
+    boards[2][:, 0] = 1
+
+    assert detector.detect_winner(boards[0]) is None
+    assert detector.detect_winner(boards[1]) is None
+    assert detector.detect_winner(boards[0]) is None  # Refreshes boards[0]
+    assert detector.detect_winner(boards[2]) == 1    # Evicts boards[1]
+    assert len(detector._cache) == 2
+
+    zobrist = HexZobrist.for_size(3)
+    assert ((3, 3), zobrist.hash_board(boards[1])) not in detector._cache
+    assert ((3, 3), zobrist.hash_board(boards[0])) in detector._cache
+
+
+def test_winner_cache_uses_given_hash():
+    """Test that a caller-provided position hash is used as cache key."""
+    detector = HexWinDetector()
+    board = np.zeros((3, 3), dtype=np.uint8)
+    board[:, 0] = 1
+    assert detector.detect_winner(board, position_hash=42) == 1
+    assert ((3, 3), 42) in detector._cache
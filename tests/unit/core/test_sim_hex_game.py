@@ -0,0 +1,101 @@
+import pytest
+import numpy as np
+
+from src.models.core.sim_hex_game import SimHexGame
+from src.models.core.hex_game import HexGame
+from src.models.core.hex_board import HexBoard, MemoryHexBoard
+from src.models.core.bit_hex_board import BitHexBoard
+from src.models.core.hex_cell import HexCell
+from src.models.core.hex_move import HexMove
+from src.models.core.hex_win_detector import HexWinDetector
+from src.models.core.interfaces import GameEndReason
+from src.models.core.hex_state import ActiveState, FinishedState
+
+
+def test_play_and_winner():
+    """Test that play returns the winner as soon as a player connects."""
+    game = SimHexGame(3)
+    assert game.current_player == SimHexGame.BLUE_PLAYER
+    for index in [0, 1, 3, 4]:  # (0, 0), (0, 1), (1, 0), (1, 1)
+        assert game.play(index) is None
+    assert game.play(6) == SimHexGame.BLUE_PLAYER  # (2, 0)
+    assert game.winner == SimHexGame.BLUE_PLAYER
+    assert game.total_moves == 5
+    assert game.current_player == SimHexGame.RED_PLAYER
+
+
+def test_undo():
+    """Test that undo takes back the last stone and the winner."""
+    game = SimHexGame(3)
+    for index in [0, 1, 3, 4, 6]:
+        game.play(index)
+    assert game.undo() == 6
+    assert game.winner is None
+    assert game.is_legal(6)
+    assert not game.is_legal(4)
+    assert not game.is_legal(9)
+    assert game.legal_moves().tolist() == [2, 5, 6, 7, 8]
+
+
+@pytest.mark.parametrize("size", [3, 5, 11])
+def test_random_playouts_match_detector(size):
+    """Test that the winner of filled boards matches a full detection."""
+    rng = np.random.default_rng(size)
+    for _ in range(20):
+        game = SimHexGame(size)
+        for index in rng.permutation(size * size):
+            game.play(int(index))
+        state = game.board.get_board_state()
+        assert game.winner == HexWinDetector.static_detect_winner(state)
+        assert game.winner is not None
+
+
+@pytest.mark.parametrize("board_type", [HexBoard, MemoryHexBoard, BitHexBoard])
+def test_from_game_does_not_touch_the_game(board_type):
+    """Test that a simulation started from a game works on a copy."""
+    game = HexGame(board_type(3))
+    game.start_game()
+    game.make_move(HexMove(HexCell(0, 0)))
+    game.make_move(HexMove(HexCell(1, 1)))
+
+    sim = SimHexGame.from_game(game)
+    assert sim.current_player == SimHexGame.BLUE_PLAYER
+    sim.play(3)
+    assert game.board.get_total_moves() == 2
+    assert sim.board.get_player_at(HexCell(1, 1)) == SimHexGame.RED_PLAYER
+
+
+def test_to_game():
+    """Test converting a simulation back to a full game."""
+    sim = SimHexGame(3)
+    sim.play(0)
+    game = sim.to_game()
+    assert isinstance(game.state, ActiveState)
+    assert game.get_current_player() == game.RED_PLAYER
+    game.make_move(HexMove(HexCell(1, 1)))
+    assert sim.total_moves == 1
+
+    for index in [1, 3, 4, 6]:
+        sim.play(index)
+    finished = sim.to_game()
+    assert isinstance(finished.state, FinishedState)
+    assert finished.game_end_reason == GameEndReason.VICTORY
+    assert finished.winner == HexGame.BLUE_PLAYER
+    assert [move.cell for move in finished.board.get_moves()] == [
+        HexCell(0, 0), HexCell(0, 1), HexCell(1, 0), HexCell(1, 1), HexCell(2, 0)]
+
+
+def test_fork():
+    """Test that a forked simulation plays independently."""
+    sim = SimHexGame(3)
+    sim.play(4)
+    fork = sim.fork()
+    fork.play(0)
+    assert sim.total_moves == 1
+    assert fork.total_moves == 2
+
+
+def test_missing_size():
+    """Test that a size or a board is required."""
+    with pytest.raises(ValueError):
+        SimHexGame()
@@ -1,8 +1,11 @@
 import datetime
+import pytest
 
 from src.models.data_management.read_game import ReadGameMonitoring, ReadSGFV4
 from src.models.data_management.saved_game import SavedGame
 from src.models.core.hex_game import HexGame
+from src.models.core.interfaces import GameEndReason
+from src.models.core.exceptions import GameOverError, InvalidCellError
 
 
 def test_read_game_monitoring_init():
@@ -100,3 +103,32 @@ def test_read_game_sgf_v4_read_game(game_dictionary_sgf_v4_sample):
     assert test_saved_game.game.board.get_moves()[0].cell.x == coordonnees_dict_0[0]
     assert test_saved_game.game.board.get_moves()[0].cell.y == coordonnees_dict_0[1]
 
+
+
+def test_make_game_with_resign():
+    """
+    Teste qu'un abandon termine la partie avec le vainqueur attendu
+    """
+    hex_game = ReadSGFV4.make_game(11, [{"W": "aa"}, {"B": "bb"}, {"W": "resign"}])
+    assert len(hex_game.board.get_moves()) == 2
+    assert hex_game.game_end_reason == GameEndReason.RESIGN
+    assert hex_game.winner == HexGame.BLUE_PLAYER
+
+
+def test_make_game_with_duplicate_move():
+    """
+    Teste qu'une case jouée deux fois est refusée
+    """
+    with pytest.raises(InvalidCellError):
+        ReadSGFV4.make_game(11, [{"W": "aa"}, {"B": "AA"}])
+
+
+def test_make_game_with_move_after_win():
+    """
+    Teste qu'une partie qui continue après une victoire est refusée,
+    même si le dernier coup est joué par le vainqueur
+    """
+    # Bleu relie ses bords au 5e coup (ac), puis Rouge joue cb et Bleu cc
+    moves = [{"W": "aa"}, {"B": "ba"}, {"W": "ab"}, {"B": "ca"}, {"W": "ac"}, {"B": "cb"}, {"W": "cc"}]
+    with pytest.raises(GameOverError):
+        ReadSGFV4.make_game(3, moves)
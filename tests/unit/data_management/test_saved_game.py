@@ -90,3 +90,22 @@ def test_saved_game_date_property(valid_hex_games_sample):
     saved_game = SavedGame(hex_game, blue_player, red_player, winner, name, val_datetime)
 
     assert saved_game.date == val_datetime.date()
+
+
+def test_saved_game_pickle(valid_hex_games_sample):
+    """
+    Vérifie qu'une partie sauvegardée survit à un aller-retour pickle sans changer d'identifiant.
+    """
+    import pickle
+    saved_game = SavedGame(valid_hex_games_sample[0], "BluePlayer", "RedPlayer", "blue", "Test Game",
+                           datetime.datetime(2023, 10, 1, 12, 0, 0))
+    next_id = SavedGame._id_count
+
+    restored = pickle.loads(pickle.dumps(saved_game))
+    assert SavedGame._id_count == next_id
+    assert restored.id == saved_game.id
+    assert restored.name == "Test Game"
+    assert restored.blue_player.name == "BluePlayer"
+    assert restored.winner == "blue"
+    assert restored.date_time() == saved_game.date_time()
+    assert restored.game.board.get_moves() == saved_game.game.board.get_moves()
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import pytest
+from src.models.game_management.game_manager import GameManager
+from src.models.game_management.command import Command
+from src.models.game_management.exceptions import GameAlreadyStartedError
+from src.models.game_management.player import Player
+
+
+class RecordingCommand(Command):
+    """Command recording its execution."""
+
+    def __init__(self, player, executed: list):
+        super().__init__(player)
+        self.executed = executed
+
+    def _execute_impl(self, game_board, players_names):
+        self.executed.append(self)
+        return "recorded"
+
+
+class TestGameManager:
+    """Test suite for the GameManager main loop."""
+
+    @pytest.fixture
+    def game_manager(self):
+        """Create a game manager on a dummy board."""
+        return GameManager(object(), "Blue", "Red")
+
+    @staticmethod
+    async def _until(condition, timeout=1.0):
+        """Wait until a condition holds, yielding to the event loop."""
+        async def poll():
+            while not condition():
+                await asyncio.sleep(0)
+        await asyncio.wait_for(poll(), timeout)
+
+    def test_commands_wake_the_loop(self, game_manager):
+        """Test that a command waiting loop executes new commands, added from the loop or from a thread."""
+        executed = []
+        player = Player("Blue")
+
+        async def scenario():
+            task = asyncio.ensure_future(game_manager.start())
+            await asyncio.sleep(0)
+            game_manager.add_command(RecordingCommand(player, executed))
+            await self._until(lambda: len(executed) == 1)
+            thread = threading.Thread(target=game_manager.add_command, args=(RecordingCommand(player, executed),))
+            thread.start()
+            thread.join()
+            await self._until(lambda: len(executed) == 2)
+            with pytest.raises(GameAlreadyStartedError):
+                await game_manager.start()
+            game_manager.stop()
+            await asyncio.wait_for(task, 1.0)
+
+        asyncio.run(scenario())
+        assert not game_manager.running
+
+    def test_stop_wakes_the_loop(self, game_manager):
+        """Test that stopping an idle manager ends its main loop at once."""
+        async def scenario():
+            task = asyncio.ensure_future(game_manager.start())
+            await asyncio.sleep(0)
+            game_manager.stop()
+            await asyncio.wait_for(task, 1.0)
+
+        asyncio.run(scenario())
+        # Commands added while stopped wait in the queue
+        game_manager.add_command(RecordingCommand(Player("Blue"), []))
+        assert len(game_manager.command_queue) == 1
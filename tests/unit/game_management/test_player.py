@@ -3,7 +3,7 @@ from src.models.game_management.player import Player
 from src.models.game_management.game_manager import GameManager
 from src.models.game_management.command import MoveCommand
 from src.models.game_management.exceptions import PlayerNotAttachedError
-from src.models.core import HexGame, HexState, HexBoard
+from src.models.core import HexGame, HexState, HexBoard, HexMove
 
 
 class MockHexGame(HexGame):
@@ -94,4 +94,19 @@ class TestPlayer:
             player.get_board_matrix()
         
         with pytest.raises(PlayerNotAttachedError):
-            player.get_board_size() 
\ No newline at end of file
+            player.get_board_size() 
+    def test_valid_moves_are_empty_cells(self, player):
+        """Test that valid moves are the empty cells and that checking a move never raises."""
+        game = HexGame(HexBoard(3))
+        game.start_game()
+        game.make_move(HexMove((0, 0)))
+        game.make_move(HexMove((1, 2)))
+        player.attach_to_game(GameManager(game, "TestPlayer", "Opponent"))
+
+        valid_moves = player.get_valid_moves()
+        assert len(valid_moves) == 7
+        assert (0, 0) not in valid_moves and (1, 2) not in valid_moves
+        assert (2, 2) in valid_moves
+        assert player.is_move_valid(2, 2)
+        assert not player.is_move_valid(0, 0)
+        assert not player.is_move_valid(3, 0)